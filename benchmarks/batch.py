@@ -0,0 +1,60 @@
+"""
+Getting 200 messages by sid, 40 of them repeated, with each request waiting
+10 ms as it would on the network: one get() at a time, and get_many() with
+a few levels of concurrency.
+"""
+import time
+
+from mock import patch
+
+from recorded import best_of, fixture, report
+
+from twilio.compat import urlparse
+from twilio.rest.resources import Messages, Resource
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+LATENCY = 0.01
+MESSAGES = 200
+REPEATED = 40
+
+MESSAGE = fixture('sms_messages_instance.json')
+SIDS = ['SM%032d' % i for i in range(MESSAGES - REPEATED)]
+SIDS += SIDS[:REPEATED]
+
+
+def request(resource, method, uri, params=None, **kwargs):
+    time.sleep(LATENCY)
+    data = dict(MESSAGE)
+    data['sid'] = urlparse(uri).path.split('/')[-1]
+    return None, data
+
+
+def one_at_a_time():
+    messages = Messages(BASE_URI, AUTH)
+    for sid in SIDS:
+        messages.get(sid)
+
+
+def get_many(concurrency):
+    def run():
+        Messages(BASE_URI, AUTH).get_many(SIDS, concurrency=concurrency)
+    return run
+
+
+def main():
+    rows = []
+    with patch.object(Resource, 'request', autospec=True,
+                      side_effect=request):
+        ms = best_of(one_at_a_time, number=1, repeat=1)
+        rows.append(('get() each', '%8.1f ms' % ms))
+        for concurrency in (1, 8, 32):
+            ms = best_of(get_many(concurrency), number=1, repeat=1)
+            rows.append(('get_many(concurrency=%d)' % concurrency,
+                         '%8.1f ms' % ms))
+    report('Getting %d messages, %d repeated, %d ms per request' % (
+        MESSAGES, REPEATED, LATENCY * 1000), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Sending 200 messages, with each request waiting 10 ms as it would on the
+network: a loop of create(), and bulk_create() with and without a journal.
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from mock import Mock, patch
+
+from recorded import best_of, fixture, report
+
+from twilio.rest.resources import Messages, Resource
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+LATENCY = 0.01
+MESSAGES = 200
+
+MESSAGE = fixture('sms_messages_instance.json')
+SENDS = [{'to': '+1415555%04d' % i, 'from_': '+14155551234',
+          'body': 'Hello'} for i in range(MESSAGES)]
+
+
+def request(resource, method, uri, params=None, data=None, **kwargs):
+    time.sleep(LATENCY)
+    record = dict(MESSAGE)
+    record['to'] = data['To']
+    return Mock(status_code=201), record
+
+
+def loop():
+    messages = Messages(BASE_URI, AUTH)
+    for kwargs in SENDS:
+        messages.create(**kwargs)
+
+
+def bulk(concurrency, journal=False):
+    def run():
+        path = None
+        if journal:
+            directory = tempfile.mkdtemp()
+            path = os.path.join(directory, 'sends.journal')
+        Messages(BASE_URI, AUTH).bulk_create(
+            SENDS, concurrency=concurrency, journal=path).run()
+        if journal:
+            shutil.rmtree(directory)
+    return run
+
+
+def main():
+    rows = []
+    with patch.object(Resource, 'request', autospec=True,
+                      side_effect=request):
+        ms = best_of(loop, number=1, repeat=1)
+        rows.append(('create() each', '%8.1f ms' % ms))
+        for concurrency in (8, 32):
+            ms = best_of(bulk(concurrency), number=1, repeat=1)
+            rows.append(('bulk_create(concurrency=%d)' % concurrency,
+                         '%8.1f ms' % ms))
+            ms = best_of(bulk(concurrency, journal=True), number=1, repeat=1)
+            rows.append(('  with a journal', '%8.1f ms' % ms))
+    report('Sending %d messages, %d ms per request' % (
+        MESSAGES, LATENCY * 1000), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+20 rounds of activity changes for 10 TaskRouter workers, as an agent
+desktop makes them while states flap, with each request waiting 10 ms as it
+would on the network: update() each, and through a coalescing writer.
+"""
+import time
+
+from mock import Mock, patch
+
+from recorded import best_of, report
+
+from twilio.compat import urlparse
+from twilio.rest.resources import Resource
+from twilio.rest.resources.task_router import Workers
+
+BASE_URI = "https://taskrouter.twilio.com/v1/Workspaces/WS123"
+AUTH = ("AC123", "token")
+LATENCY = 0.01
+WORKERS = 10
+ROUNDS = 20
+UPDATES = [('WK%032d' % (i % WORKERS), 'WA%d' % (i // WORKERS % 2))
+           for i in range(WORKERS * ROUNDS)]
+POSTS = []
+
+
+def request(resource, method, uri, params=None, data=None, **kwargs):
+    time.sleep(LATENCY)
+    POSTS.append(uri)
+    return Mock(), {'sid': urlparse(uri).path.split('/')[-1],
+                    'activity_sid': data['ActivitySid']}
+
+
+def update_each():
+    workers = Workers(BASE_URI, AUTH, None)
+    for sid, activity in UPDATES:
+        workers.update(sid, activity_sid=activity)
+
+
+def coalesced(window):
+    def run():
+        workers = Workers(BASE_URI, AUTH, None)
+        with workers.coalescing_writer(window=window) as writer:
+            pending = [writer.update(sid, activity_sid=activity)
+                       for sid, activity in UPDATES]
+        assert pending[-1].result().activity_sid == UPDATES[-1][1]
+    return run
+
+
+def main():
+    rows = []
+    with patch.object(Resource, 'request', autospec=True,
+                      side_effect=request):
+        for name, func in [('update() each', update_each),
+                           ('coalescing_writer(window=0.05)',
+                            coalesced(0.05))]:
+            del POSTS[:]
+            ms = best_of(func, number=1, repeat=1)
+            rows.append((name, '%8.1f ms, %4d POSTs' % (ms, len(POSTS))))
+    report('%d updates to %d workers, %d ms per request' % (
+        len(UPDATES), WORKERS, LATENCY * 1000), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Summing price and duration and finding the latest date_created over 20
+recorded pages of 1000 calls: from instance resources, from raw dicts, and
+from iter_columns with array and, when installed, numpy columns.
+"""
+import math
+import time
+
+from recorded import best_of, page, report
+
+from twilio.rest.resources import Calls
+from twilio.rest.resources.imports import numpy
+from twilio.rest.resources.util import parse_rfc2822_date
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+PAGES = 20
+FIELDS = ['price', 'duration', 'date_created']
+
+
+def recorded_page():
+    data = page('calls_list.json', 'calls', 1000)
+    for i, record in enumerate(data['calls']):
+        record['price'] = '-0.%05d' % (i % 3000)
+        record['duration'] = str(i % 600)
+    return data
+
+
+def dated(data, page_number):
+    # Every call on every page starts at a different second
+    start = 1420070400 + page_number * 1000
+    records = []
+    for i, record in enumerate(data['calls']):
+        record = dict(record)
+        record['date_created'] = time.strftime(
+            '%a, %d %b %Y %H:%M:%S +0000', time.gmtime(start + i))
+        records.append(record)
+    return dict(data, calls=records)
+
+
+DATA = recorded_page()
+SERVED = [dated(DATA, i) for i in range(PAGES)]
+
+
+def calls(copy=False):
+    served = [0]
+
+    def request(*args, **kwargs):
+        data = SERVED[served[0]]
+        served[0] += 1
+        data['next_page_uri'] = '/Calls?Page=1' if served[0] < PAGES else None
+        if copy:
+            # Loading instances changes the records, so serve fresh copies
+            data = dict(data, calls=[dict(r) for r in data['calls']])
+        return None, data
+
+    resource = Calls(BASE_URI, AUTH)
+    resource.request = request
+    return resource
+
+
+def instances():
+    price = duration = 0.0
+    latest = None
+    for call in calls(copy=True).iter():
+        price += float(call.price)
+        duration += float(call.duration)
+        latest = max(latest or call.date_created, call.date_created)
+
+
+def raw():
+    price = duration = 0.0
+    latest = None
+    for call in calls().iter(raw=True):
+        price += float(call['price'])
+        duration += float(call['duration'])
+        created = parse_rfc2822_date(call['date_created'])
+        latest = max(latest or created, created)
+
+
+def arrays():
+    price = duration = 0.0
+    latest = None
+    for columns in calls().iter_columns(FIELDS, numpy=False):
+        price += math.fsum(columns['price'])
+        duration += math.fsum(columns['duration'])
+        latest = max(latest or 0, max(columns['date_created']))
+
+
+def numpy_arrays():
+    price = duration = 0.0
+    latest = None
+    for columns in calls().iter_columns(FIELDS, numpy=True):
+        price += numpy.nansum(columns['price'])
+        duration += numpy.nansum(columns['duration'])
+        newest = columns['date_created'].max()
+        latest = newest if latest is None else max(latest, newest)
+
+
+def main():
+    rows = []
+    runs = [('instances', instances), ('raw dicts', raw),
+            ('iter_columns', arrays)]
+    if numpy is not None:
+        runs.append(('iter_columns numpy', numpy_arrays))
+    for name, func in runs:
+        ms = best_of(func, number=1, repeat=3)
+        rows.append((name, '%7.1f ms  %5.2f us/record' % (
+            ms, ms * 1000 / (PAGES * 1000))))
+    report('Aggregating %d calls' % (PAGES * 1000), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Memory per record when keeping 100k phone numbers and workers, as regular
+and as compact instances. Field values are shared between records, so the
+figures are the cost of the instances themselves, plus the copy of each
+worker's attributes made when it is wrapped in a JsonString.
+"""
+import tracemalloc
+
+from recorded import page, report
+
+from twilio.rest.resources import PhoneNumbers
+from twilio.rest.resources.task_router import Workers
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+TASKROUTER_URI = "https://taskrouter.twilio.com/v1/Workspaces/WS123"
+AUTH = ("AC123", "token")
+N = 100000
+
+
+def measure(resource, records):
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    kept = []
+    for i in range(N):
+        kept.append(resource.load_instance(dict(records[i % len(records)])))
+    stats = tracemalloc.take_snapshot().compare_to(snapshot, 'filename')
+    tracemalloc.stop()
+    return sum(s.size_diff for s in stats) / float(N)
+
+
+def main():
+    cases = [
+        ('PhoneNumber', PhoneNumbers(BASE_URI, AUTH, None),
+         page('incoming_phone_numbers_list.json',
+              'incoming_phone_numbers', 50)['incoming_phone_numbers']),
+        ('Worker', Workers(TASKROUTER_URI, AUTH, None),
+         page('task_router/workers_list.json', 'workers', 50)['workers']),
+    ]
+    for name, resource, records in cases:
+        sizes = []
+        for compact in (False, True):
+            resource.compact_instances = compact
+            sizes.append(measure(resource, records))
+        report('%d %s instances' % (N, name), [
+            ('regular', '%6d bytes/record' % sizes[0]),
+            ('compact', '%6d bytes/record' % sizes[1]),
+            ('saved', '%5.1fx' % (sizes[0] / sizes[1])),
+        ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Applying a deploy's settings to 500 recorded applications, 10 of which
+differ, with each request waiting 10 ms as it would on the network: update()
+each, update(if_changed=True) fetching each application, and the same after
+one load_snapshot() scan.
+"""
+import time
+
+from mock import Mock, patch
+
+from recorded import best_of, report
+
+from twilio.compat import urlparse
+from twilio.rest.resources import Applications, Resource
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+LATENCY = 0.01
+APPLICATIONS = 500
+CHANGED = 10
+PAGE_SIZE = 50
+
+RECORDS = [{'sid': 'AP%032d' % i, 'friendly_name': 'app %d' % i,
+            'voice_url': 'http://example.com/voice',
+            'voice_method': 'POST', 'sms_url': 'http://example.com/sms'}
+           for i in range(APPLICATIONS)]
+SETTINGS = dict((r['sid'], {'voice_url': r['voice_url'],
+                            'voice_method': 'POST',
+                            'sms_url': r['sms_url']}) for r in RECORDS)
+for sid in sorted(SETTINGS)[:CHANGED]:
+    SETTINGS[sid]['voice_url'] = 'http://example.com/voice2'
+BY_SID = dict((r['sid'], r) for r in RECORDS)
+
+
+def request(resource, method, uri, params=None, **kwargs):
+    time.sleep(LATENCY)
+    parts = urlparse(uri).path.split('/')
+    if parts[-1] != 'Applications':
+        return Mock(status_code=200), dict(BY_SID[parts[-1]])
+    number = (params or {}).get('Page', 0)
+    number = int(number[0] if isinstance(number, list) else number)
+    data = {'applications':
+            RECORDS[number * PAGE_SIZE:(number + 1) * PAGE_SIZE]}
+    more = (number + 1) * PAGE_SIZE < len(RECORDS)
+    data['next_page_uri'] = '/Applications?Page=%d' % (
+        number + 1) if more else None
+    return Mock(status_code=200), data
+
+
+def update_each():
+    apps = Applications(BASE_URI, AUTH)
+    for sid, settings in SETTINGS.items():
+        apps.update(sid, **settings)
+
+
+def if_changed(snapshot):
+    def run():
+        apps = Applications(BASE_URI, AUTH)
+        if snapshot:
+            apps.load_snapshot()
+        writes = 0
+        for sid, settings in SETTINGS.items():
+            if apps.update(sid, if_changed=True, **settings).changed:
+                writes += 1
+        assert writes == CHANGED
+    return run
+
+
+def main():
+    rows = []
+    with patch.object(Resource, 'request', autospec=True,
+                      side_effect=request):
+        for name, func in [('update() each', update_each),
+                           ('if_changed, GET each', if_changed(False)),
+                           ('if_changed after load_snapshot()',
+                            if_changed(True))]:
+            ms = best_of(func, number=1, repeat=1)
+            rows.append((name, '%8.1f ms' % ms))
+    report('Updating %d applications, %d changed, %d ms per request' % (
+        APPLICATIONS, CHANGED, LATENCY * 1000), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Reading 10 IP Messaging services, their 10 channels each and every
+channel's members and messages, with each request waiting 10 ms as it would
+on the network: with the nested loop load_subresources leads to, and with a
+Crawler fetching 16 lists at once.
+"""
+import time
+
+from mock import patch
+
+from recorded import best_of, report
+
+from twilio.compat import urlparse
+from twilio.rest.resources import Resource
+from twilio.rest.resources.crawler import Crawler
+from twilio.rest.resources.ip_messaging import Services
+
+BASE_URI = "https://ip-messaging.twilio.com/v1"
+AUTH = ("AC123", "token")
+LATENCY = 0.01
+FANOUT = 10
+
+
+def request(resource, method, uri, **kwargs):
+    time.sleep(LATENCY)
+    path = urlparse(uri).path
+    key = path.rsplit('/', 1)[1].lower()
+    prefix = key[:2].upper()
+    records = [{'sid': '%s%d' % (prefix, i)} for i in range(FANOUT)]
+    return None, {'meta': {'key': key, 'next_page_url': None}, key: records}
+
+
+def nested_loops():
+    count = 0
+    for service in Services(BASE_URI, AUTH).iter():
+        for channel in service.channels.iter():
+            count += 1
+            for member in channel.members.iter():
+                count += 1
+            for message in channel.messages.iter():
+                count += 1
+    return count
+
+
+def crawler():
+    spec = {'channels': {'members': None, 'messages': None}}
+    crawl = Crawler(Services(BASE_URI, AUTH), spec, concurrency=16)
+    return sum(1 for _ in crawl)
+
+
+def main():
+    rows = []
+    with patch.object(Resource, 'request', autospec=True,
+                      side_effect=request):
+        for name, func in [('nested loops', nested_loops),
+                           ('Crawler x16', crawler)]:
+            ms = best_of(func, number=1, repeat=1)
+            rows.append((name, '%8.1f ms' % ms))
+    lists = 1 + FANOUT + 2 * FANOUT * FANOUT
+    report('Crawling %d lists, %d ms per request' % (lists, LATENCY * 1000),
+           rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Time spent turning the timestamps of a 1000 record page into datetimes, with
+the original parsers, the fixed-format fast paths, the fast paths plus the
+memo cache, and how long loading a page of calls takes with and without
+lazy_dates.
+"""
+import datetime
+from email.utils import parsedate
+
+import pytz
+
+from recorded import best_of, page, report
+
+from twilio.rest.resources import Calls
+from twilio.rest.resources import util
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+
+
+def old_rfc2822(s):
+    date_tuple = parsedate(s)
+    if date_tuple is None:
+        return None
+    return datetime.datetime(*date_tuple[:-3])
+
+
+def old_iso(s):
+    try:
+        return datetime.datetime.strptime(
+            s, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=pytz.utc)
+    except (ValueError, TypeError):
+        return s
+
+
+def uncached(parse, cache):
+    def parse_uncached(s):
+        cache.clear()
+        return parse(s)
+    return parse_uncached
+
+
+def timestamps(records, fields):
+    return [r[f] for r in records for f in fields if r.get(f)]
+
+
+def load_page(resource, records, read):
+    def run():
+        util._rfc2822_cache.clear()
+        util._iso_cache.clear()
+        for record in records:
+            instance = resource.load_instance(dict(record))
+            getattr(instance, read)
+    return run
+
+
+def main():
+    calls = page('calls_list.json', 'calls')['calls']
+    events = page('task_router/events_list.json', 'events')['events']
+
+    # Give every record a distinct second so the cache only helps with the
+    # timestamps a record shares with its neighbours
+    start = datetime.datetime(2015, 1, 1)
+    for i, call in enumerate(calls):
+        t = start + datetime.timedelta(seconds=i)
+        call['date_created'] = t.strftime('%a, %d %b %Y %H:%M:%S +0000')
+        call['start_time'] = call['date_created']
+    for i, event in enumerate(events):
+        t = start + datetime.timedelta(seconds=i)
+        event['event_date'] = t.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    rfc = timestamps(calls, ('date_created', 'date_updated', 'start_time',
+                             'end_time'))
+    iso = timestamps(events, ('event_date',))
+
+    for title, strings, old, new, cache in [
+        ('Calls page, %d RFC 2822 dates' % len(rfc), rfc, old_rfc2822,
+         util.parse_rfc2822_date, util._rfc2822_cache),
+        ('Events page, %d ISO 8601 dates' % len(iso), iso, old_iso,
+         util.parse_iso_date, util._iso_cache),
+    ]:
+        rows = []
+        fast = uncached(new, cache)
+        for name, parse in [('original', old), ('fast path', fast),
+                            ('fast path, warm cache', new)]:
+            ms = best_of(lambda: [parse(s) for s in strings])
+            rows.append((name, '%7.2f ms/page' % ms))
+        report(title, rows)
+
+    for read in ('date_created', 'sid'):
+        rows = []
+        for lazy in (False, True):
+            resource = Calls(BASE_URI, AUTH)
+            resource.lazy_dates = lazy
+            ms = best_of(load_page(resource, calls, read))
+            rows.append(('lazy_dates=%s' % lazy, '%7.2f ms/page' % ms))
+        report('Calls page loaded, %s read' % read, rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Cost of iter(stable=True): the time per record it adds to a raw scan of
+recorded call pages, and the memory a SidSet holds for 1M sids kept
+exactly and in Bloom filters. Each memory mode runs in its own process and
+reports the growth in peak RSS.
+"""
+import json
+import resource
+import subprocess
+import sys
+
+from recorded import ROOT, best_of, page, report
+
+from twilio.rest.resources import Calls
+from twilio.rest.resources.dedup import SidSet
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+N = 1000000
+
+
+def calls_pages():
+    data = page('calls_list.json', 'calls', 1000)
+    for i, record in enumerate(data['calls']):
+        record['sid'] = 'CA%032x' % (i * 0x9e3779b97f4a7c15 % 2 ** 128)
+    data['next_page_uri'] = None
+    return data
+
+
+def scan_time(stable):
+    calls = Calls(BASE_URI, AUTH)
+    data = calls_pages()
+    calls.request = lambda *args, **kwargs: (None, data)
+    return best_of(lambda: sum(1 for _ in calls.iter(raw=True,
+                                                     stable=stable)))
+
+
+def peak_rss():
+    # Kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run(exact_limit):
+    sids = ['CA%032x' % (i * 0x9e3779b97f4a7c15 % 2 ** 128)
+            for i in range(N)]
+    before = peak_rss()
+    seen = SidSet(exact_limit=exact_limit)
+    for sid in sids:
+        seen.add(sid)
+    print(json.dumps(peak_rss() - before))
+
+
+def main():
+    if len(sys.argv) > 1:
+        return run(int(sys.argv[1]))
+
+    plain, stable = scan_time(False), scan_time(True)
+    report('Raw scan of a 1000 call page', [
+        ('plain', '%6.2f ms' % plain),
+        ('stable=True', '%6.2f ms  (+%.2f us/record)' % (
+            stable, (stable - plain))),
+    ])
+
+    rows = []
+    for name, limit in (('exact', N), ('bloom', 1000)):
+        out = subprocess.check_output(
+            [sys.executable, __file__, str(limit)], cwd=ROOT)
+        size = json.loads(out.decode('utf-8').splitlines()[-1])
+        rows.append((name, '%6.1f MB  %4.1f bytes/sid' % (
+            size / 2.0 ** 20, float(size) / N)))
+    report('SidSet holding %d sids' % N, rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Memory held by 1M synthetic message records kept from an iteration, as raw
+dicts, with and without intern_strings. Each mode runs in its own process
+and reports the growth in peak RSS.
+"""
+import json
+import random
+import resource
+import subprocess
+import sys
+import time
+
+from recorded import ROOT, report
+
+from twilio.rest.resources import Messages
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+N = 1000000
+PAGE_SIZE = 1000
+
+ACCOUNT = "AC" + "a" * 32
+OUR_NUMBERS = ["+1415555%04d" % i for i in range(20)]
+STATUSES = ["queued", "sending", "sent", "delivered", "failed"]
+DIRECTIONS = ["inbound", "outbound-api", "outbound-call", "outbound-reply"]
+
+
+def message(i, rng):
+    sid = "SM%032x" % i
+    date = time.strftime("%a, %d %b %Y %H:%M:%S +0000",
+                         time.gmtime(1420070400 + i))
+    return {
+        "sid": sid,
+        "account_sid": ACCOUNT,
+        "from": rng.choice(OUR_NUMBERS),
+        "to": "+1%010d" % rng.randint(0, 10 ** 10 - 1),
+        "body": "Your code is %06d" % rng.randint(0, 999999),
+        "status": rng.choice(STATUSES),
+        "direction": rng.choice(DIRECTIONS),
+        "api_version": "2010-04-01",
+        "price": rng.choice(["-0.00750", "-0.01500", None]),
+        "price_unit": "USD",
+        "num_segments": "1",
+        "num_media": "0",
+        "date_created": date,
+        "date_sent": date,
+        "uri": "/2010-04-01/Accounts/%s/Messages/%s.json" % (ACCOUNT, sid),
+    }
+
+
+def pages():
+    """ Decoded pages, as the client would see them off the wire """
+    rng = random.Random(0)
+    for start in range(0, N, PAGE_SIZE):
+        records = [message(i, rng) for i in range(start, start + PAGE_SIZE)]
+        body = json.dumps({"messages": records, "next_page_uri": "/next"})
+        yield None, json.loads(body)
+
+
+def peak_rss():
+    # Kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run(intern):
+    messages = Messages(BASE_URI, AUTH)
+    messages.intern_strings = intern
+    feed = pages()
+    messages.request = lambda *args, **kwargs: next(feed)
+
+    before = peak_rss()
+    start = time.time()
+    kept = []
+    for record in messages.iter(raw=True):
+        kept.append(record)
+        if len(kept) == N:
+            break
+    elapsed = time.time() - start
+    print(json.dumps([peak_rss() - before, elapsed]))
+
+
+def main():
+    if len(sys.argv) > 1:
+        return run(sys.argv[1] == 'intern')
+
+    rows = []
+    results = {}
+    for mode in ('plain', 'intern'):
+        out = subprocess.check_output(
+            [sys.executable, __file__, mode], cwd=ROOT)
+        size, elapsed = json.loads(out.decode('utf-8').splitlines()[-1])
+        results[mode] = size
+        rows.append((mode, '%6d MB  %4d bytes/record  %5.1fs' % (
+            size / 2 ** 20, size / N, elapsed)))
+    rows.append(('saved', '%6d MB  %4.0f%%' % (
+        (results['plain'] - results['intern']) / 2 ** 20,
+        100.0 * (results['plain'] - results['intern']) / results['plain'])))
+    report('%d raw message records kept' % N, rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Joining 200 recorded calls with their recordings, notifications and
+feedback, with each request waiting 10 ms as it would on the network: with
+a request per call for each, and with CallJoin's scans of each list.
+"""
+import time
+
+from mock import patch
+
+from recorded import best_of, page, report
+
+from twilio.compat import urlparse
+from twilio.rest.resources import Calls, Resource
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+LATENCY = 0.01
+CALLS = 200
+PAGE_SIZE = 50
+
+
+def recorded(path, key, sid_prefix):
+    records = page(path, key, CALLS)[key]
+    for i, record in enumerate(records):
+        record['sid'] = '%s%032d' % (sid_prefix, i)
+        record['call_sid'] = 'CA%032d' % i
+    return records
+
+
+LISTS = {
+    'Calls': ('calls', recorded('calls_list.json', 'calls', 'CA')),
+    'Recordings': ('recordings',
+                   recorded('recordings_list.json', 'recordings', 'RE')),
+    'Notifications': ('notifications',
+                      recorded('notifications_list.json', 'notifications',
+                               'NO')),
+}
+
+
+def request(resource, method, uri, params=None, **kwargs):
+    time.sleep(LATENCY)
+    parts = urlparse(uri).path.split('/')
+    if parts[-1] == 'Feedback':
+        return None, {'quality_score': 5}
+    key, records = LISTS[parts[-1]]
+    if parts[-2].startswith('CA'):
+        records = [r for r in records if r['call_sid'] == parts[-2]]
+    number = (params or {}).get('Page', 0)
+    # Cursors are parsed into lists of values
+    number = int(number[0] if isinstance(number, list) else number)
+    data = {key: records[number * PAGE_SIZE:(number + 1) * PAGE_SIZE]}
+    more = (number + 1) * PAGE_SIZE < len(records)
+    data['next_page_uri'] = '/%s?Page=%d' % (
+        parts[-1], number + 1) if more else None
+    return None, data
+
+
+def per_call():
+    calls = Calls(BASE_URI, AUTH)
+    for call in calls.iter():
+        call.recordings.list()
+        call.notifications.list()
+        call.feedback.get()
+
+
+def joined():
+    for timeline in Calls(BASE_URI, AUTH).timeline(feedback=True):
+        pass
+
+
+def joined_without_feedback():
+    for timeline in Calls(BASE_URI, AUTH).timeline():
+        pass
+
+
+def main():
+    rows = []
+    with patch.object(Resource, 'request', autospec=True,
+                      side_effect=request):
+        for name, func in [('request per call', per_call),
+                           ('CallJoin', joined),
+                           ('CallJoin, no feedback',
+                            joined_without_feedback)]:
+            ms = best_of(func, number=1, repeat=1)
+            rows.append((name, '%8.1f ms' % ms))
+    report('Timelines of %d calls, %d ms per request' % (
+        CALLS, LATENCY * 1000), rows)
+
+
+if __name__ == '__main__':
+    main()
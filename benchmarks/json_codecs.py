@@ -0,0 +1,31 @@
+"""
+Compare the json backends for decoding recorded list pages.
+
+"text" is the old path, which decodes the body to text before parsing it;
+every other row parses the raw bytes the way ``Resource.request`` now does.
+"""
+from recorded import best_of, page_bytes, report
+
+from twilio.rest.resources.imports import json
+from twilio.rest.resources.json_codec import available_codecs, get_codec
+
+PAGES = [
+    ('calls_list.json', 'calls'),
+    ('sms_messages_list.json', 'sms_messages'),
+    ('task_router/workers_list.json', 'workers'),
+]
+
+
+def main():
+    for path, key in PAGES:
+        body = page_bytes(path, key)
+        rows = [('text', '%.2f ms' % best_of(
+            lambda: json.loads(body.decode('utf-8'))))]
+        for name in available_codecs():
+            codec = get_codec(name)
+            rows.append((name, '%.2f ms' % best_of(lambda: codec.loads(body))))
+        report('%s, 1000 records, %d KB' % (path, len(body) // 1024), rows)
+
+
+if __name__ == '__main__':
+    main()
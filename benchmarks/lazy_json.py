@@ -0,0 +1,59 @@
+"""
+Reading one attribute from each task of a 1000 record page, decoding the
+whole attributes document as callers used to, through JsonString.data, and
+through the JsonString.get single key accessor.
+"""
+import json
+
+from recorded import best_of, page, report
+
+from twilio.rest.resources.task_router.tasks import Tasks
+
+BASE_URI = "https://taskrouter.twilio.com/v1/Workspaces/WS123"
+AUTH = ("AC123", "token")
+
+
+def attributes(size, first):
+    fields = [("field%d" % i, {"value": "x" * 20, "tags": ["a", "b", "c"]})
+              for i in range(size)]
+    language = [("language", "english")]
+    doc = language + fields if first else fields + language
+    return '{%s}' % ', '.join('%s: %s' % (json.dumps(k), json.dumps(v))
+                              for k, v in doc)
+
+
+def main():
+    tasks = Tasks(BASE_URI, AUTH)
+    records = page('task_router/tasks_list.json', 'tasks')['tasks']
+
+    for size, first in [(0, True), (20, True), (20, False), (200, True),
+                        (200, False)]:
+        doc = attributes(size, first)
+        for record in records:
+            record['attributes'] = doc
+        instances = [tasks.load_instance(dict(r)) for r in records]
+
+        def decode():
+            for task in instances:
+                json.loads(task.attributes)['language']
+
+        def data():
+            for task in instances:
+                task.attributes.__dict__.clear()
+                task.attributes.data['language']
+
+        def get():
+            for task in instances:
+                task.attributes.__dict__.clear()
+                task.attributes.get('language')
+
+        rows = []
+        for name, func in [('json.loads', decode), ('attributes.data', data),
+                           ('attributes.get', get)]:
+            rows.append((name, '%7.2f ms/page' % best_of(func)))
+        report('%d byte attributes, key %s' % (
+            len(doc), 'first' if first else 'last'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Records per second scanning 20k records from a simulated API with a fixed
+cost per request and a cost per record, at the default page size, at the
+largest page size, and with iter(adaptive=True).
+"""
+import time
+
+from recorded import page, report
+
+from twilio.rest.resources import Calls
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+N = 20000
+
+# Round trip per request, and server time per record once pages get large
+LATENCY = 0.02
+PER_RECORD = 0.00002
+SLOW_PAGE = 500
+PER_RECORD_SLOW = 0.0001
+
+
+def param(params, name, default):
+    # The first request has the values given to iter, later ones the lists
+    # parsed from next_page_uri
+    value = params.get(name, default)
+    return int(value[0] if isinstance(value, list) else value)
+
+
+class SimulatedCalls(Calls):
+
+    def __init__(self, records):
+        super(SimulatedCalls, self).__init__(BASE_URI, AUTH)
+        self.records = records
+
+    def request(self, method, uri, params=None, **kwargs):
+        size = param(params, 'PageSize', 50)
+        offset = param(params, 'AfterSid', 0)
+        count = min(size, N - offset)
+        time.sleep(LATENCY + count * PER_RECORD +
+                   max(0, count - SLOW_PAGE) * PER_RECORD_SLOW)
+        records = [self.records[(offset + i) % len(self.records)]
+                   for i in range(count)]
+        next_page_uri = None
+        if offset + count < N:
+            next_page_uri = '/Calls?PageSize=%d&AfterSid=%d' % (
+                size, offset + count)
+        return None, {'calls': records, 'next_page_uri': next_page_uri}
+
+
+def scan(**kwargs):
+    calls = SimulatedCalls(page('calls_list.json', 'calls', 50)['calls'])
+    start = time.time()
+    count = sum(1 for _ in calls.iter(raw=True, **kwargs))
+    elapsed = time.time() - start
+    sizer = calls.page_sizer
+    return count / elapsed, sizer.page_size if sizer else None
+
+
+def main():
+    rows = []
+    for name, kwargs in [('page_size=50', {'page_size': 50}),
+                         ('page_size=1000', {'page_size': 1000}),
+                         ('adaptive', {'adaptive': True})]:
+        rate, chosen = scan(**kwargs)
+        note = '' if chosen is None else '  (settled on %d)' % chosen
+        rows.append((name, '%7.0f records/s%s' % (rate, note)))
+    report('Scanning %d calls' % N, rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+Per-call cost of turning create() arguments into a form body, with the
+original transform_params and urlencode path and with the cached key names
+and one-pass encoder, alone and as part of Messages.create and
+Calls.create against a stubbed HTTP connection. Every call goes to a new
+number, and every message has a new body, as for a high-volume sender.
+"""
+import itertools
+
+import httplib2
+from six import binary_type, integer_types, iteritems, string_types
+
+from recorded import ROOT, best_of, report
+
+from twilio.compat import urlencode
+from twilio.rest.resources import Calls, Messages, base, util
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+
+MESSAGE = {
+    "to": "+14155551212",
+    "from_": "+14155550000",
+    "body": "Your verification code is 123456",
+    "status_callback": "https://example.com/status",
+    "media_url": ["https://example.com/a.png"],
+}
+CALL = {
+    "to": "+14155551212",
+    "from_": "+14155550000",
+    "url": "https://example.com/twiml",
+    "status_callback": "https://example.com/status",
+    "status_events": ["initiated", "completed"],
+    "record": True,
+    "timeout": 30,
+}
+
+
+def old_transform_params(parameters):
+    transformed_parameters = {}
+    for key, value in iteritems(parameters):
+        if isinstance(value, (list, tuple, set)):
+            value = [util.convert_boolean(param) for param in value]
+            transformed_parameters[old_format_name(key)] = value
+        elif value is not None:
+            transformed_parameters[old_format_name(key)] = \
+                util.convert_boolean(value)
+    return transformed_parameters
+
+
+def old_format_name(word):
+    if word.lower() == word:
+        return util.convert_case(word)
+    return word
+
+
+def old_encode_params(data):
+    def encode_atom(atom):
+        if isinstance(atom, (integer_types, binary_type)):
+            return atom
+        return atom.encode('utf-8')
+
+    udata = {}
+    for k, v in iteritems(data):
+        key = k.encode('utf-8')
+        if isinstance(v, (list, tuple, set)):
+            udata[key] = [encode_atom(x) for x in v]
+        elif isinstance(v, (integer_types, binary_type, string_types)):
+            udata[key] = encode_atom(v)
+    return urlencode(udata, doseq=True)
+
+
+def fixture_bytes(path):
+    with open('%s/tests/resources/%s' % (ROOT, path), 'rb') as f:
+        return f.read()
+
+
+class StubHttp(object):
+    """ Answers every request with a recorded body """
+    body = None
+
+    def __init__(self, **kwargs):
+        self.follow_redirects = True
+
+    def add_credentials(self, user, password):
+        pass
+
+    def request(self, url, method, headers=None, body=None):
+        return httplib2.Response({'status': '201'}), self.body
+
+
+def varied(kwargs):
+    """ Return a function giving kwargs with a new recipient each time """
+    counter = itertools.count()
+
+    def next_kwargs():
+        i = next(counter)
+        result = dict(kwargs, to="+1415%07d" % i)
+        if "body" in result:
+            result["body"] = "Your verification code is %06d" % i
+        return result
+    return next_kwargs
+
+
+def use(transform, encode):
+    base.transform_params = transform
+    base.encode_params = encode
+
+
+def main():
+    httplib2.Http = StubHttp
+    messages = Messages(BASE_URI, AUTH)
+    calls = Calls(BASE_URI, AUTH)
+    message_body = fixture_bytes('sms_messages_instance.json')
+    call_body = fixture_bytes('calls_instance.json')
+
+    next_message = varied(MESSAGE)
+    next_call = varied(CALL)
+
+    def create_message():
+        StubHttp.body = message_body
+        messages.create(**next_message())
+
+    def create_call():
+        StubHttp.body = call_body
+        calls.create(**next_call())
+
+    modes = [
+        ('before', old_transform_params, old_encode_params),
+        ('after', util.transform_params, util.encode_params),
+    ]
+    for name, kwargs, create in [('Messages.create', MESSAGE, create_message),
+                                 ('Calls.create', CALL, create_call)]:
+        next_kwargs = varied(kwargs)
+
+        def params():
+            result = next_kwargs()
+            result['from'] = result.pop('from_')
+            return result
+
+        rows = []
+        for mode, transform, encode in modes:
+            use(transform, encode)
+            encoding = best_of(lambda: encode(transform(params())),
+                               number=10000) * 1000
+            total = best_of(create, number=2000) * 1000
+            rows.append((mode, 'params %5.1f us/call  create %6.1f us/call'
+                               % (encoding, total)))
+        report(name, rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Fetching a transcription for each of 500 recorded recordings, with each
+fetch waiting 10 ms as a request would: in a plain loop, and in a pipeline
+with 16 workers. Then the cost a pipeline stage adds to each record, from
+three map stages over 20000 records.
+"""
+import time
+
+from recorded import best_of, page, report
+
+from twilio.rest.resources import Recordings
+from twilio.rest.resources.pipeline import Pipeline
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+LATENCY = 0.01
+
+
+def recordings(count):
+    data = page('recordings_list.json', 'recordings', 1000)
+    pages = [dict(data, recordings=data['recordings'][:count])]
+    served = [0]
+
+    def request(*args, **kwargs):
+        data = pages[served[0] % len(pages)]
+        served[0] += 1
+        more = served[0] * 1000 < count
+        data['next_page_uri'] = '/Recordings?Page=1' if more else None
+        return None, data
+
+    resource = Recordings(BASE_URI, AUTH)
+    resource.request = request
+    return resource
+
+
+def fetch_transcription(recording):
+    time.sleep(LATENCY)
+    return recording['sid']
+
+
+def loop():
+    for recording in recordings(500).iter(raw=True):
+        fetch_transcription(recording)
+
+
+def parallel():
+    pipeline = recordings(500).pipeline(raw=True)
+    pipeline.parallel_map(fetch_transcription, workers=16).run()
+    return pipeline
+
+
+def plain_stages():
+    for item in recordings(20000).iter(raw=True):
+        item = item['sid']
+        item = item.lower()
+        item = len(item)
+
+
+def pipeline_stages():
+    (recordings(20000).pipeline(raw=True)
+     .map(lambda r: r['sid'])
+     .map(lambda s: s.lower())
+     .map(len)
+     .run())
+
+
+def main():
+    rows = []
+    for name, func, count in [('loop', loop, 500),
+                              ('parallel_map x16', parallel, 500)]:
+        ms = best_of(func, number=1, repeat=1)
+        rows.append((name, '%8.1f ms  %6.2f ms/recording' % (
+            ms, ms / count)))
+    report('Transcriptions of 500 recordings, %d ms each' % (LATENCY * 1000),
+           rows)
+    print(parallel().report())
+    print('')
+
+    rows = []
+    for name, func in [('generator', plain_stages),
+                       ('pipeline', pipeline_stages)]:
+        ms = best_of(func, number=1, repeat=3)
+        rows.append((name, '%8.1f ms  %6.2f us/record' % (
+            ms, ms * 1000 / 20000)))
+    report('Three map stages over 20000 records', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Helpers for replaying recorded API responses in benchmarks
+"""
+import copy
+import json
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def fixture(path):
+    with open(os.path.join(ROOT, 'tests', 'resources', path), 'rb') as f:
+        return json.loads(f.read().decode('utf-8'))
+
+
+def page(path, key, page_size=1000):
+    """
+    Return a recorded list page with its records repeated up to page_size
+    """
+    data = fixture(path)
+    records = data[key]
+    data[key] = [copy.deepcopy(records[i % len(records)])
+                 for i in range(page_size)]
+    return data
+
+
+def page_bytes(path, key, page_size=1000):
+    return json.dumps(page(path, key, page_size)).encode('utf-8')
+
+
+def best_of(func, number=10, repeat=5):
+    """ Return the best time per call of func, in milliseconds """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1000
+
+
+def report(title, rows):
+    print(title)
+    width = max(len(name) for name, _ in rows)
+    for name, value in rows:
+        print('  %s  %s' % (name.ljust(width), value))
+    print('')
@@ -0,0 +1,58 @@
+"""
+Per-record cost of the ways list resources can hand back records: full
+InstanceResources, raw dicts (projected or not) and namedtuple records.
+"""
+import copy
+import tracemalloc
+
+from recorded import best_of, page, report
+
+from twilio.rest.resources import Calls, Messages
+from twilio.rest.resources.util import record_type
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+FIELDS = ('sid', 'status', 'duration', 'price', 'date_created')
+
+
+def loaders(resource):
+    Record = record_type('Record', FIELDS)
+    return [
+        ('instance', resource.record_loader()),
+        ('raw', resource.record_loader(raw=True)),
+        ('raw, 5 fields', resource.record_loader(raw=True, fields=FIELDS)),
+        ('records(), 5 fields', resource.record_loader(
+            raw=lambda r: Record(*[r.get(f) for f in FIELDS]))),
+    ]
+
+
+def retained(load, records):
+    """ Bytes per record still alive after decoding and loading it """
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    loaded = [load(copy.deepcopy(r)) for r in records]
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del loaded
+    return size // 1000
+
+
+def main():
+    for resource, path, key in [
+        (Calls(BASE_URI, AUTH), 'calls_list.json', 'calls'),
+        (Messages(BASE_URI, AUTH), 'sms_messages_list.json', 'sms_messages'),
+    ]:
+        records = page(path, key)[key]
+        rows = []
+        for name, load in loaders(resource):
+            def run():
+                for record in copy.copy(records):
+                    load(dict(record))
+            ms = best_of(run, number=3)
+            rows.append((name, '%6.2f us/record %6d bytes/record' % (
+                ms, retained(load, records))))
+        report('%s, 1000 records' % resource.name, rows)
+
+
+if __name__ == '__main__':
+    main()
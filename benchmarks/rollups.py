@@ -0,0 +1,78 @@
+"""
+Daily p50 and p95 of call duration, by status, over 20 recorded pages of
+1000 calls: keeping every duration and sorting at the end, against a Rollup
+of quantile sketches. Also shows the memory each holds.
+"""
+import random
+import sys
+
+from recorded import best_of, page, report
+
+from twilio.rest.resources.columns import epoch_seconds
+from twilio.rest.resources.rollups import Rollup
+
+PAGES = 20
+STATUSES = ['completed', 'busy', 'no-answer', 'failed']
+
+
+def recorded_records():
+    rng = random.Random(0)
+    template = page('calls_list.json', 'calls', 1000)['calls'][0]
+    records = []
+    for i in range(PAGES * 1000):
+        record = dict(template)
+        record['status'] = STATUSES[i % len(STATUSES)]
+        record['duration'] = str(int(rng.expovariate(1 / 90.0)))
+        record['date_created'] = 'Thu, 01 Jan 2015 %02d:%02d:%02d +0000' % (
+            i // 3600 % 24, i // 60 % 60, i % 60)
+        records.append(record)
+    return records
+
+
+RECORDS = recorded_records()
+
+
+def exact():
+    groups = {}
+    for record in RECORDS:
+        seconds = int(epoch_seconds(record['date_created']))
+        key = (seconds - seconds % 86400, record['status'])
+        groups.setdefault(key, []).append(float(record['duration']))
+    for values in groups.values():
+        values.sort()
+        values[len(values) // 2], values[int(len(values) * 0.95)]
+    return groups
+
+
+def rollup():
+    summaries = Rollup({'duration': 'duration'}, group_by=['status'],
+                       interval=86400)
+    summaries.consume(RECORDS)
+    for metrics in summaries.results().values():
+        metrics['duration'].quantile(0.5), metrics['duration'].quantile(0.95)
+    return summaries
+
+
+def held(values):
+    return sum(sys.getsizeof(v) + 8 for v in values)
+
+
+def main():
+    groups = exact()
+    exact_bytes = sum(held(values) for values in groups.values())
+    sketched = rollup()
+    sketch_bytes = sum(
+        held(v for c in metrics['duration'].sketch.compactors for v in c)
+        for metrics in sketched.buckets.values())
+
+    rows = []
+    for name, func, size in [('sorted lists', exact, exact_bytes),
+                             ('Rollup', rollup, sketch_bytes)]:
+        ms = best_of(func, number=1, repeat=3)
+        rows.append((name, '%7.1f ms  %5.2f us/record  %8d bytes held' % (
+            ms, ms * 1000 / len(RECORDS), size)))
+    report('Daily duration quantiles of %d calls' % len(RECORDS), rows)
+
+
+if __name__ == '__main__':
+    main()
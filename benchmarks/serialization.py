@@ -0,0 +1,53 @@
+"""
+Encoding and decoding 1000 call records with pickle and with
+InstanceResource.to_record / from_record, and the size of each.
+"""
+import pickle
+
+from recorded import best_of, page, report
+
+from twilio.rest.resources import Calls
+from twilio.rest.resources.imports import msgpack
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+N = 1000
+
+
+def main():
+    calls = Calls(BASE_URI, AUTH)
+    instances = [calls.load_instance(record)
+                 for record in page('calls_list.json', 'calls', N)['calls']]
+
+    def pickle_dumps():
+        return [pickle.dumps(i, pickle.HIGHEST_PROTOCOL) for i in instances]
+
+    def pickle_loads(blobs):
+        return [pickle.loads(b) for b in blobs]
+
+    def record_dumps(codec):
+        return [i.to_record(codec) for i in instances]
+
+    def record_loads(blobs):
+        return [calls.from_record(b) for b in blobs]
+
+    cases = [('pickle', pickle_dumps, pickle_loads)]
+    codecs = ['json'] + ([] if msgpack is None else ['msgpack'])
+    for codec in codecs:
+        cases.append(('record ' + codec,
+                      lambda codec=codec: record_dumps(codec), record_loads))
+
+    rows = []
+    for name, dumps, loads in cases:
+        blobs = dumps()
+        size = sum(len(b) for b in blobs) / float(N)
+        encode = best_of(dumps, number=3)
+        decode = best_of(lambda: loads(blobs), number=3)
+        rows.append((name, '%5d bytes/record  encode %6.0f records/s  '
+                           'decode %6.0f records/s' % (
+                               size, N / encode * 1000, N / decode * 1000)))
+    report('%d Call instances' % N, rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Allocations per record when iterating 100k calls, with subresources built
+eagerly (the old behaviour) and lazily on first access.
+"""
+import time
+import tracemalloc
+
+from recorded import page, report
+
+from twilio.rest.resources import Calls
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+N = 100000
+
+
+def eager(calls, record):
+    instance = calls.load_instance(record)
+    instance.load_subresources()
+    return instance
+
+
+def lazy(calls, record):
+    return calls.load_instance(record)
+
+
+def measure(load, records):
+    calls = Calls(BASE_URI, AUTH)
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    start = time.time()
+    kept = []
+    for i in range(N):
+        record = dict(records[i % len(records)])
+        kept.append(load(calls, record))
+    elapsed = time.time() - start
+    stats = tracemalloc.take_snapshot().compare_to(snapshot, 'filename')
+    tracemalloc.stop()
+    blocks = sum(s.count_diff for s in stats)
+    size = sum(s.size_diff for s in stats)
+    return elapsed, blocks / float(N), size / float(N)
+
+
+def main():
+    records = page('calls_list.json', 'calls', 50)['calls']
+    rows = []
+    for name, load in [('eager', eager), ('lazy', lazy)]:
+        elapsed, blocks, size = measure(load, records)
+        rows.append((name, '%5.1f allocations/record %6d bytes/record '
+                           '%5.2fs' % (blocks, size, elapsed)))
+    report('%d Call instances' % N, rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,16 @@ class EventTest(unittest.TestCase):
         request.assert_called_with("GET", uri, auth=AUTH,
                                    use_json_extension=False)
 
+    @patch('twilio.rest.resources.base.make_twilio_request')
+    def test_event_data(self, request):
+        resp = create_mock_json('tests/resources/task_router/events_list.json')
+        resp.status_code = 200
+        request.return_value = resp
+
+        event = Events(BASE_URI, AUTH).list()[0]
+        self.assertEqual(event.event_data["worker_name"], "JustinWorker")
+        self.assertEqual(event.event_data["worker_attributes"].data, {})
+
     @patch('twilio.rest.resources.base.make_twilio_request')
     def test_list(self, request):
         resp = create_mock_json('tests/resources/task_router/events_list.json')
@@ -69,6 +69,17 @@ class TaskTest(unittest.TestCase):
         request.assert_called_with("GET", uri, auth=AUTH,
                                    use_json_extension=False)
 
+    @patch('twilio.rest.resources.base.make_twilio_request')
+    def test_attributes(self, request):
+        resp = create_mock_json('tests/resources/task_router/tasks_instance.json')
+        resp.status_code = 200
+        request.return_value = resp
+
+        task = Tasks(BASE_URI, AUTH).get(TASK_SID)
+        self.assertEqual(task.attributes, '{"body": "hello"}')
+        self.assertEqual(task.attributes.get("body"), "hello")
+        self.assertEqual(task.attributes.data, {"body": "hello"})
+
     @patch('twilio.rest.resources.base.make_twilio_request')
     def test_list(self, request):
         resp = create_mock_json('tests/resources/task_router/tasks_list.json')
@@ -3,11 +3,15 @@ from datetime import datetime
 import unittest
 
 from mock import Mock, sentinel, patch, ANY
-from nose.tools import assert_equal, assert_true
+from nose.tools import assert_equal, assert_true, raises
 import pytz
 from six import advance_iterator
 
+from twilio import TwilioException
+from twilio.rest.resources.dedup import StableScan
 from twilio.rest.resources.imports import json
+from twilio.rest.resources.paging import PageSizer
+from twilio.rest.resources.streaming import StreamingPage
 from twilio.rest.resources import Resource, NextGenListResource, NextGenInstanceResource
 from twilio.rest.resources import ListResource
 from twilio.rest.resources import InstanceResource
@@ -73,6 +77,338 @@ class ListResourceTest(unittest.TestCase):
 
         self.assertRaises(StopIteration, advance_iterator, self.r.iter())
 
+    def testIterStream(self):
+        first = b'{"resources": [{"sid": "foo"}], "next_page_uri": "/Resources?Page=1"}'
+        second = b'{"resources": [{"sid": "bar"}], "next_page_uri": null}'
+        self.r.request_stream = Mock()
+        self.r.request_stream.side_effect = [
+            (Mock(), StreamingPage([first], key=self.r.key)),
+            (Mock(), StreamingPage([second], key=self.r.key)),
+        ]
+
+        sids = [r.sid for r in self.r.iter(stream=True)]
+
+        assert_equal(sids, ['foo', 'bar'])
+        self.r.request_stream.assert_called_with(
+            "GET", "https://api.twilio.com/2010-04-01/Resources",
+            key=self.r.key, params={'Page': ['1']})
+
+    def testIterStreamNoKey(self):
+        self.r.request_stream = Mock()
+        self.r.request_stream.return_value = (
+            Mock(), StreamingPage([b'{"next_page_uri": "/Resources?Page=1"}'])
+        )
+
+        assert_equal(list(self.r.iter(stream=True)), [])
+        assert_equal(self.r.request_stream.call_count, 1)
+
+    def testIterRaw(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {self.r.key: [
+            {'sid': 'foo', 'from': '+1415', 'date_created': 'Sat, 29 Sep 2012 12:47:54 +0000'},
+        ]}
+
+        items = list(self.r.iter(raw=True))
+
+        assert_equal(items, [{'sid': 'foo', 'from': '+1415', 'date_created': 'Sat, 29 Sep 2012 12:47:54 +0000'}])
+
+    def testIterRawFields(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {self.r.key: [
+            {'sid': 'foo', 'status': 'sent', 'body': 'hi'},
+            {'sid': 'bar', 'body': 'ho'},
+        ]}
+
+        items = list(self.r.iter(raw=True, fields=['sid', 'status']))
+
+        assert_equal(items, [{'sid': 'foo', 'status': 'sent'}, {'sid': 'bar'}])
+        self.r.request.assert_called_with("GET", "https://api.twilio.com/2010-04-01/Resources", params={})
+
+    def testIterFieldsKeepsSid(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {self.r.key: [
+            {'sid': 'foo', 'status': 'sent', 'body': 'hi'},
+        ]}
+
+        item = advance_iterator(self.r.iter(fields=['status']))
+
+        assert_true(isinstance(item, InstanceResource))
+        assert_equal(item.sid, 'foo')
+        assert_equal(item.status, 'sent')
+        assert_true(not hasattr(item, 'body'))
+
+    def testListRaw(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {self.r.key: [{'sid': 'foo', 'body': 'hi'}]}
+
+        items = self.r.list(raw=True, fields=['sid'], page_size=10)
+
+        assert_equal(items, [{'sid': 'foo'}])
+        self.r.request.assert_called_with("GET", "https://api.twilio.com/2010-04-01/Resources", params={'PageSize': 10})
+
+    def page(self, sids, next_page_uri):
+        records = [{'sid': sid} for sid in sids]
+        return Mock(), {self.r.key: records, 'next_page_uri': next_page_uri}
+
+    def record_params(self, pages, responses):
+        responses = iter(responses)
+
+        def request(method, uri, params):
+            pages.append(dict(params))
+            return advance_iterator(responses)
+        return request
+
+    def testIterLimit(self):
+        pages = []
+        self.r.request = self.record_params(pages, [
+            self.page(['a', 'b'], '/Resources?Page=1&PageSize=2&AfterSid=b'),
+            self.page(['c'], '/Resources?Page=2&PageSize=1&AfterSid=c'),
+        ])
+
+        sids = [r.sid for r in self.r.iter(limit=3, page_size=2)]
+
+        assert_equal(sids, ['a', 'b', 'c'])
+        assert_equal(pages, [{'PageSize': 2},
+                             {'Page': ['1'], 'PageSize': ['1'],
+                              'AfterSid': ['b']}])
+
+    def testIterLimitPageSize(self):
+        self.r.request = Mock()
+        self.r.request.return_value = self.page(['a'], None)
+
+        list(self.r.iter(limit=5000))
+        self.r.request.assert_called_with(
+            "GET", ANY, params={'PageSize': self.r.max_page_size})
+
+        list(self.r.iter(limit=20))
+        self.r.request.assert_called_with("GET", ANY,
+                                          params={'PageSize': 20})
+
+    def testIterLimitStopsRequests(self):
+        self.r.request = Mock()
+        self.r.request.return_value = self.page(['a', 'b'], '/Resources?Page=1')
+
+        items = self.r.iter(limit=2)
+        advance_iterator(items)
+        advance_iterator(items)
+
+        self.assertRaises(StopIteration, advance_iterator, items)
+        assert_equal(self.r.request.call_count, 1)
+
+    def testIterLimitKeepsPageWithoutCursor(self):
+        # Without a cursor, a smaller page would start at a different offset
+        pages = []
+        self.r.request = self.record_params(pages, [
+            self.page(['a', 'b'], '/Resources?Page=1&PageSize=2'),
+            self.page(['c', 'd'], None),
+        ])
+
+        sids = [r.sid for r in self.r.iter(limit=3, page_size=2)]
+
+        assert_equal(sids, ['a', 'b', 'c'])
+        assert_equal(pages[1]['PageSize'], ['2'])
+
+    def testIterAdaptive(self):
+        pages = []
+        sizer = PageSizer(pages_per_step=1)
+        self.r.request = self.record_params(pages, [
+            self.page(['a'] * 50, '/Resources?Page=1&PageSize=50&AfterSid=a'),
+            self.page(['b'] * 100, None),
+        ])
+
+        sids = [r.sid for r in self.r.iter(adaptive=sizer)]
+
+        assert_equal(len(sids), 150)
+        assert_equal(pages[0], {'PageSize': 50})
+        assert_equal(pages[1]['PageSize'], ['100'])
+
+    def testIterAdaptiveWithoutCursor(self):
+        pages = []
+        sizer = PageSizer(pages_per_step=1)
+        self.r.request = self.record_params(pages, [
+            self.page(['a'] * 50, '/Resources?Page=1&PageSize=50'),
+            self.page(['b'] * 50, '/Resources?Page=2&PageSize=50'),
+            self.page(['c'], None),
+        ])
+
+        list(self.r.iter(adaptive=sizer))
+
+        # Offset pages can't be resized, so the sizer is left untouched
+        assert_equal(pages[1]['PageSize'], ['50'])
+        assert_equal(pages[2]['PageSize'], ['50'])
+        assert_equal(sizer.page_size, 50)
+        assert_equal(sizer.best_size, 50)
+
+    def testIterAdaptiveSizerPerScan(self):
+        self.r.request = Mock()
+        self.r.request.return_value = self.page(['a'], None)
+
+        first = self.r.iter(adaptive=True)
+        next(first)
+        first_sizer = self.r.page_sizer
+        first_sizer._best_size = 200
+        second = self.r.iter(adaptive=True)
+        next(second)
+
+        assert_true(self.r.page_sizer is not first_sizer)
+        assert_equal(self.r.page_sizer.page_size, 200)
+
+    def testIterAdaptiveKeepsSizer(self):
+        self.r.request = Mock()
+        self.r.request.return_value = self.page(['a'], None)
+
+        list(self.r.iter(adaptive=True))
+
+        assert_true(isinstance(self.r.page_sizer, PageSizer))
+        assert_equal(self.r.page_sizer.max_page_size, self.r.max_page_size)
+        self.r.request.assert_called_with(
+            "GET", ANY, params={'PageSize': self.r.page_sizer.page_size})
+
+    def testIterAdaptiveHonorsPageSize(self):
+        pages = []
+        self.r.request = self.record_params(pages, [
+            self.page(['a'] * 10, '/Resources?Page=1&PageSize=10&AfterSid=a'),
+            self.page(['b'], None),
+        ])
+
+        list(self.r.iter(adaptive=True, page_size=10))
+
+        assert_equal(pages[1]['PageSize'], ['10'])
+        assert_equal(self.r.page_sizer, None)
+
+    def testIterPages(self):
+        pages = []
+        self.r.request = self.record_params(pages, [
+            (Mock(), {self.r.key: [{'sid': 'a'}, {'sid': 'b'}], 'page': 0,
+                      'next_page_uri': '/Resources?Page=1&PageSize=2&AfterSid=b'}),
+            (Mock(), {self.r.key: [{'sid': 'c'}], 'page': 1,
+                      'next_page_uri': None}),
+        ])
+
+        result = list(self.r.iter_pages(page_size=2))
+
+        assert_equal([[r.sid for r in p] for p in result], [['a', 'b'], ['c']])
+        assert_equal(result[0].cursor, 'Page=1&PageSize=2&AfterSid=b')
+        assert_equal(result[0].meta['page'], 0)
+        assert_true(self.r.key not in result[0].meta)
+        assert_equal(result[1].cursor, None)
+        assert_equal(pages[1], {'Page': ['1'], 'PageSize': ['2'],
+                                'AfterSid': ['b']})
+
+    def testIterPagesResume(self):
+        self.r.request = Mock()
+        self.r.request.return_value = self.page(['c'], None)
+
+        pages = list(self.r.iter_pages(
+            raw=True, resume_from='Page=1&PageSize=2&AfterSid=b'))
+
+        assert_equal(pages[0].records, [{'sid': 'c'}])
+        self.r.request.assert_called_with("GET", ANY, params={
+            'Page': ['1'], 'PageSize': ['2'], 'AfterSid': ['b']})
+
+    def testIterResume(self):
+        self.r.request = Mock()
+        self.r.request.return_value = self.page(['c'], None)
+
+        sids = [r.sid for r in self.r.iter(resume_from='Page=1&AfterSid=b')]
+
+        assert_equal(sids, ['c'])
+        self.r.request.assert_called_with("GET", ANY, params={
+            'Page': ['1'], 'AfterSid': ['b']})
+
+    def testIterStable(self):
+        # A record arriving mid-scan pushes 'b' onto the second page too
+        self.r.request = Mock()
+        self.r.request.side_effect = [
+            self.page(['a', 'b'], '/Resources?Page=1'),
+            self.page(['b', 'c'], None),
+        ]
+
+        sids = [r.sid for r in self.r.iter(stable=True)]
+
+        assert_equal(sids, ['a', 'b', 'c'])
+        assert_equal(self.r.stable_scan.duplicates, 1)
+
+    def testIterStableSkipsNewer(self):
+        scan = StableScan(until=datetime(2011, 2, 15))
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {self.r.key: [
+            {'sid': 'a', 'date_created': 'Wed, 16 Feb 2011 04:21:00 +0000'},
+            {'sid': 'b', 'date_created': 'Mon, 14 Feb 2011 04:21:00 +0000'},
+        ]}
+
+        records = list(self.r.iter(stable=scan, raw=True, fields=['sid']))
+
+        assert_equal(records, [{'sid': 'b'}])
+        assert_equal(scan.newer, 1)
+        assert_equal(scan.duplicates, 0)
+
+    def testSequence(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {
+            self.r.key: [{'sid': 'c'}], 'total': 3}
+
+        seq = self.r.sequence(raw=True, page_size=2)
+
+        assert_equal(seq[2], {'sid': 'c'})
+        assert_equal(len(seq), 3)
+        self.r.request.assert_called_once_with("GET", ANY, params={
+            'Page': 1, 'PageSize': 2})
+
+    def testIterPagesNoKey(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {'next_page_uri': '/Resources?Page=1'}
+
+        assert_equal(list(self.r.iter_pages()), [])
+
+    def testIterLimitZero(self):
+        self.r.request = Mock()
+        assert_equal(list(self.r.iter(limit=0)), [])
+        assert_equal(self.r.request.call_count, 0)
+
+    def testIterLimitStream(self):
+        body = b'{"resources": [{"sid": "a"}, {"sid": "b"}], "next_page_uri": "/Resources?Page=1"}'
+        resp = Mock()
+        self.r.request_stream = Mock()
+        self.r.request_stream.return_value = (
+            resp, StreamingPage([body], key=self.r.key))
+
+        sids = [r.sid for r in self.r.iter(stream=True, limit=1)]
+
+        assert_equal(sids, ['a'])
+        assert_equal(self.r.request_stream.call_count, 1)
+        assert_true(resp.close.called)
+
+    def testIterInternStrings(self):
+        record = '{"sid": "%s", "status": "sent", "body": "hi"}'
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {self.r.key: [
+            json.loads(record % 'foo'), json.loads(record % 'bar'),
+        ]}
+        self.r.intern_strings = True
+
+        first, second = self.r.iter(raw=True)
+        assert_true(first['status'] is second['status'])
+        assert_equal(first['sid'], 'foo')
+
+        first, second = self.r.iter()
+        assert_true(first.status is second.status)
+        assert_true(self.r.intern_table() is self.r.intern_table())
+
+    def testRecords(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {self.r.key: [
+            {'sid': 'foo', 'from': '+1415', 'body': 'hi'},
+            {'sid': 'bar'},
+        ]}
+
+        items = list(self.r.records(['sid', 'from']))
+
+        assert_equal(items[0].sid, 'foo')
+        assert_equal(items[0].from_, '+1415')
+        assert_equal(tuple(items[1]), ('bar', None))
+        assert_equal(type(items[0]).__name__, 'InstanceResourceRecord')
+
     def testKeyValue(self):
         self.r.key = "Hey"
         assert_equal(self.r.key, "Hey")
@@ -137,6 +473,118 @@ class NextGenListResourceTest(unittest.TestCase):
 
         self.assertRaises(StopIteration, advance_iterator, items)
 
+    def test_iter_stream(self):
+        body = b'{"foos": [{"sid": "123"}], "meta": {"key": "foos", "next_page_url": null}}'
+        self.r.request_stream = Mock()
+        self.r.request_stream.return_value = Mock(), StreamingPage([body], key='foos')
+
+        items = list(self.r.iter(stream=True))
+
+        self.r.request_stream.assert_called_with("GET", "https://api.twilio.com/2010-04-01/Resources", key=self.r.key)
+        assert_equal([i.sid for i in items], ['123'])
+
+    def test_iter_limit(self):
+        self.r.request = Mock()
+        self.r.request.side_effect = [
+            (Mock(), {'meta': {'key': 'foos', 'next_page_url': 'https://api.twilio.com/2010-04-01/Resources?PageSize=2&PageToken=PA2'},
+                      'foos': [{'sid': '1'}, {'sid': '2'}]}),
+            (Mock(), {'meta': {'key': 'foos', 'next_page_url': 'https://api.twilio.com/2010-04-01/Resources?PageSize=2&PageToken=PA3'},
+                      'foos': [{'sid': '3'}]}),
+        ]
+
+        items = list(self.r.iter(limit=3, page_size=2))
+
+        assert_equal([i.sid for i in items], ['1', '2', '3'])
+        assert_equal(self.r.request.call_count, 2)
+        self.r.request.assert_called_with(
+            "GET", "https://api.twilio.com/2010-04-01/Resources?PageSize=1&PageToken=PA2")
+
+    def test_iter_adaptive(self):
+        sizer = PageSizer(pages_per_step=1)
+        self.r.request = Mock()
+        self.r.request.side_effect = [
+            (Mock(), {'meta': {'key': 'foos', 'next_page_url': 'https://api.twilio.com/2010-04-01/Resources?PageSize=50&PageToken=PA2'},
+                      'foos': [{'sid': '1'}] * 50}),
+            (Mock(), {'meta': {'key': 'foos'}, 'foos': []}),
+        ]
+
+        list(self.r.iter(adaptive=sizer))
+
+        self.r.request.assert_called_with(
+            "GET", "https://api.twilio.com/2010-04-01/Resources?PageSize=100&PageToken=PA2")
+
+    def test_iter_stable(self):
+        scan = StableScan(until=datetime(2015, 1, 2))
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {'meta': {'key': 'foos'}, 'foos': [
+            {'sid': '1', 'date_created': '2015-01-01T00:00:00Z'},
+            {'sid': '1', 'date_created': '2015-01-01T00:00:00Z'},
+            {'sid': '2', 'date_created': '2015-01-03T00:00:00Z'},
+        ]}
+
+        items = list(self.r.iter(stable=scan))
+
+        assert_equal([i.sid for i in items], ['1'])
+        assert_equal(scan.duplicates, 1)
+        assert_equal(scan.newer, 1)
+
+    @raises(TwilioException)
+    def test_sequence(self):
+        self.r.sequence()
+
+    def test_iter_pages(self):
+        self.r.request = Mock()
+        self.r.request.side_effect = [
+            (Mock(), {'meta': {'key': 'foos', 'page': 0, 'next_page_url': 'https://api.twilio.com/2010-04-01/Resources?PageSize=1&Page=1&PageToken=PA2'},
+                      'foos': [{'sid': '1'}]}),
+            (Mock(), {'meta': {'key': 'foos', 'page': 1, 'next_page_url': None},
+                      'foos': [{'sid': '2'}]}),
+        ]
+
+        pages = list(self.r.iter_pages(page_size=1))
+
+        assert_equal([[r.sid for r in p] for p in pages], [['1'], ['2']])
+        assert_equal(pages[0].cursor, 'PageSize=1&Page=1&PageToken=PA2')
+        assert_equal(pages[1].meta['page'], 1)
+        assert_equal(pages[1].cursor, None)
+        self.r.request.assert_called_with(
+            "GET", "https://api.twilio.com/2010-04-01/Resources?PageSize=1&Page=1&PageToken=PA2")
+
+    def test_iter_pages_resume(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {'meta': {'key': 'foos'}, 'foos': [{'sid': '2'}]}
+
+        pages = list(self.r.iter_pages(resume_from='PageSize=1&Page=1&PageToken=PA2'))
+        assert_equal(len(pages), 1)
+        self.r.request.assert_called_with(
+            "GET", "https://api.twilio.com/2010-04-01/Resources?PageSize=1&Page=1&PageToken=PA2")
+
+        list(self.r.iter(resume_from='PageSize=1&Page=1&PageToken=PA2'))
+        self.r.request.assert_called_with(
+            "GET", "https://api.twilio.com/2010-04-01/Resources?PageSize=1&Page=1&PageToken=PA2")
+
+    def test_iter_limit_page_size(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {'meta': {'key': 'foos'}, 'foos': []}
+
+        list(self.r.iter(limit=20))
+
+        self.r.request.assert_called_with("GET", "https://api.twilio.com/2010-04-01/Resources?PageSize=20")
+
+    def test_iter_raw(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {'meta': {'key': 'foos'}, 'foos': [{'sid': '123', 'date_created': '2015-01-01T00:00:00Z'}]}
+
+        items = list(self.r.iter(raw=True, fields=['date_created']))
+
+        assert_equal(items, [{'date_created': '2015-01-01T00:00:00Z'}])
+
+    def test_list_raw(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {'meta': {'key': 'foos'}, 'foos': [{'sid': '123'}]}
+
+        assert_equal(self.r.list(raw=True), [{'sid': '123'}])
+
     def test_instance_loading(self):
         instance = self.r.load_instance({"sid": "foo"})
 
@@ -172,6 +620,36 @@ class testInstanceResourceInit(unittest.TestCase):
         except AttributeError:
             pass
 
+    def testLoadLazyDates(self):
+        self.parent.lazy_dates = True
+        self.r.load({"date_created": "Sat, 29 Sep 2012 12:47:54 +0000",
+                     "date_updated": None})
+
+        assert_true("date_created" not in self.r.__dict__)
+        assert_equal(self.r.date_updated, None)
+        assert_equal(self.r.date_created, datetime(2012, 9, 29, 12, 47, 54))
+        assert_true("date_created" in self.r.__dict__)
+
+    def testLazyDatesEquality(self):
+        self.parent.lazy_dates = True
+        other = InstanceResource(self.parent, "123")
+        for r in (self.r, other):
+            r.load({"date_created": "Sat, 29 Sep 2012 12:47:54 +0000"})
+
+        self.r.date_created
+        assert_equal(self.r, other)
+
+    def testLazyDatesReload(self):
+        self.parent.lazy_dates = True
+        self.r.load({"date_updated": "Sat, 29 Sep 2012 12:47:54 +0000"})
+        self.r.date_updated
+
+        updated = InstanceResource(self.parent, "123")
+        updated.load({"date_updated": "Sun, 30 Sep 2012 12:47:54 +0000"})
+        self.r.load(updated.__dict__)
+
+        assert_equal(self.r.date_updated, datetime(2012, 9, 30, 12, 47, 54))
+
     def testLoadNullDate(self):
         self.r.load({"date_created": None, "uri": "foobar"})
         assert self.r.date_created is None
@@ -186,6 +664,33 @@ class testInstanceResourceInit(unittest.TestCase):
         self.r.load_subresources()
         m.assert_called_with(self.r.uri, self.r.auth, self.r.timeout)
 
+    def testLazySubresources(self):
+        m = Mock()
+        m.key = "things"
+        self.r.subresources = [m]
+
+        assert_true("things" not in self.r.__dict__)
+        assert_equal(m.call_count, 0)
+
+        things = self.r.things
+
+        m.assert_called_with(self.r.uri, self.r.auth, self.r.timeout)
+        assert_true(self.r.things is things)
+        assert_equal(m.call_count, 1)
+
+    def testMissingAttribute(self):
+        self.assertRaises(AttributeError, getattr, self.r, "things")
+
+    def testEqualityIgnoresBuiltSubresources(self):
+        m = Mock()
+        m.key = "things"
+        other = InstanceResource(self.parent, "123")
+        self.r.subresources = other.subresources = [m]
+
+        self.r.things
+        assert_equal(self.r, other)
+        assert_equal(hash(self.r), hash(other))
+
 
 class NextGenInstanceResourceTest(unittest.TestCase):
     def setUp(self):
@@ -227,3 +732,101 @@ class testTimeoutPropagation(unittest.TestCase):
             timeout=sentinel.timeout,
             auth=ANY
         )
+
+
+class DictCache(object):
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+
+class ConditionalUpdateTest(unittest.TestCase):
+
+    def setUp(self):
+        from twilio.rest.resources import Applications
+        self.apps = Applications("%s/Accounts/AC123" % base_uri, auth)
+        self.apps.request = Mock()
+        self.record = {"sid": "AP1", "voice_url": "http://a",
+                       "voice_method": "POST"}
+
+    def respond(self, method, uri, params=None, data=None):
+        if method == "POST":
+            record = dict(self.record)
+            fields = {"VoiceUrl": "voice_url", "VoiceMethod": "voice_method",
+                      "From": "from"}
+            record.update((fields[k], v) for k, v in data.items())
+            return Mock(), record
+        if uri.endswith("/AP1"):
+            return Mock(), dict(self.record)
+        return Mock(), {"applications": [dict(self.record)]}
+
+    def methods(self):
+        return [c[0][0] for c in self.apps.request.call_args_list]
+
+    def test_skips_unchanged_from_snapshot(self):
+        self.apps.request.side_effect = self.respond
+        self.apps.load_snapshot()
+        app = self.apps.update("AP1", voice_url="http://a",
+                               voice_method="POST", if_changed=True)
+        assert_equal(self.methods(), ["GET"])
+        assert_equal(app.changed, [])
+        assert_equal(app.sid, "AP1")
+        assert_equal(app.voice_url, "http://a")
+
+    def test_posts_changed(self):
+        self.apps.request.side_effect = self.respond
+        self.apps.load_snapshot()
+        app = self.apps.update("AP1", voice_url="http://b",
+                               voice_method="POST", if_changed=True)
+        assert_equal(self.methods(), ["GET", "POST"])
+        assert_equal(app.changed, ["voice_url"])
+        assert_equal(app.voice_url, "http://b")
+        assert_equal(self.apps.request.call_args[1]["data"],
+                     {"VoiceUrl": "http://b", "VoiceMethod": "POST"})
+        # The snapshot follows the update
+        self.apps.update("AP1", voice_url="http://b", if_changed=True)
+        assert_equal(self.methods(), ["GET", "POST"])
+
+    def test_repeated_update_from_snapshot(self):
+        self.apps.request.side_effect = self.respond
+        self.apps.load_snapshot()
+        self.apps.update("AP1", from_="+15555555555", if_changed=True)
+        app = self.apps.update("AP1", from_="+15555555555", if_changed=True)
+        assert_equal(self.methods(), ["GET", "POST"])
+        assert_equal(app.changed, [])
+
+    def test_fetches_unknown_state(self):
+        self.apps.request.side_effect = self.respond
+        app = self.apps.update("AP1", voice_url="http://a", if_changed=True)
+        assert_equal(self.methods(), ["GET"])
+        assert_equal(app.changed, [])
+
+    def test_uses_cache(self):
+        self.apps.request.side_effect = self.respond
+        self.apps.instance_cache = DictCache()
+        self.apps.update("AP1", voice_url="http://b")
+        app = self.apps.update("AP1", voice_url="http://b", if_changed=True)
+        assert_equal(self.methods(), ["POST"])
+        assert_equal(app.changed, [])
+
+    def test_given_state(self):
+        self.apps.request.side_effect = self.respond
+        app = self.apps.load_instance(dict(self.record))
+        app.update_instance(voice_url="http://a", if_changed=True)
+        assert_equal(self.methods(), [])
+        assert_equal(app.changed, [])
+        self.apps.update("AP1", voice_url="http://a",
+                         if_changed={"voice_url": "http://b"})
+        assert_equal(self.methods(), ["POST"])
+
+    def test_without_if_changed(self):
+        self.apps.request.side_effect = self.respond
+        app = self.apps.update("AP1", voice_url="http://a", if_changed=False)
+        assert_equal(self.methods(), ["POST"])
+        assert_true(not hasattr(app, "changed"))
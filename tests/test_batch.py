@@ -0,0 +1,114 @@
+import time
+import unittest
+
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.compat import urlparse
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import Messages
+from tests.tools import FakeApi
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+
+
+class MessagesApi(FakeApi):
+
+    def __init__(self, latency=0, missing=()):
+        super(MessagesApi, self).__init__(latency)
+        self.missing = missing
+
+    def note(self, method, uri, params, data):
+        return urlparse(uri).path.split("/")[-1]
+
+    def respond(self, method, uri, params, data):
+        sid = urlparse(uri).path.split("/")[-1]
+        if sid in self.missing:
+            raise TwilioRestException(404, uri, "Not found")
+        return None, {"sid": sid, "body": "Body of %s" % sid}
+
+
+class DictCache(object):
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+
+class GetManyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.messages = Messages(BASE_URI, AUTH)
+
+    def test_dedupes_and_keeps_order(self):
+        api = MessagesApi().install(self)
+        sids = ["SM3", "SM1", "SM3", "SM2", "SM1"]
+        fetched = self.messages.get_many(sids, concurrency=4)
+        assert_equal(fetched.sids, ["SM3", "SM1", "SM2"])
+        assert_equal(list(fetched), ["SM3", "SM1", "SM2"])
+        assert_equal([m.sid for m in fetched.instances()],
+                     ["SM3", "SM1", "SM2"])
+        assert_equal(sorted(api.requests), ["SM1", "SM2", "SM3"])
+        assert_equal(fetched["SM1"].body, "Body of SM1")
+        assert_true(fetched.ok)
+        assert_equal(len(fetched), 3)
+
+    def test_reports_failures_without_stopping(self):
+        MessagesApi(missing=("SM2", )).install(self)
+        fetched = self.messages.get_many(["SM1", "SM2", "SM3"])
+        assert_true(not fetched.ok)
+        assert_equal(list(fetched.results), ["SM1", "SM3"])
+        assert_equal(list(fetched.errors), ["SM2"])
+        assert_equal(fetched.errors["SM2"].status, 404)
+        assert_true("SM2" in fetched)
+        assert_true("SM4" not in fetched)
+        assert_equal(repr(fetched), "<BatchResult 2 ok, 1 failed>")
+
+    @raises(TwilioRestException)
+    def test_getitem_raises_error(self):
+        MessagesApi(missing=("SM2", )).install(self)
+        self.messages.get_many(["SM1", "SM2"])["SM2"]
+
+    def test_fetches_concurrently(self):
+        MessagesApi(latency=0.05).install(self)
+        sids = ["SM%d" % i for i in range(8)]
+        start = time.time()
+        fetched = self.messages.get_many(sids, concurrency=8)
+        assert_true(time.time() - start < 0.3)
+        assert_equal(list(fetched.results), sids)
+
+    def test_sequential(self):
+        api = MessagesApi().install(self)
+        fetched = self.messages.get_many(["SM2", "SM1"], concurrency=1)
+        assert_equal(api.requests, ["SM2", "SM1"])
+        assert_equal(list(fetched.results), ["SM2", "SM1"])
+
+    def test_empty(self):
+        api = MessagesApi().install(self)
+        fetched = self.messages.get_many([])
+        assert_true(fetched.ok)
+        assert_equal(fetched.instances(), [])
+        assert_equal(api.requests, [])
+
+    def test_uses_cache(self):
+        api = MessagesApi(missing=("SM3", )).install(self)
+        self.messages.instance_cache = DictCache()
+        first = self.messages.get_many(["SM1", "SM2", "SM3"])
+        assert_equal(first.cached, 0)
+        assert_equal(sorted(self.messages.instance_cache.data),
+                     ["%s/Messages/SM1" % BASE_URI,
+                      "%s/Messages/SM2" % BASE_URI])
+
+        api.requests = []
+        second = self.messages.get_many(["SM2", "SM3", "SM1"])
+        assert_equal(second.cached, 2)
+        assert_equal(api.requests, ["SM3"])
+        assert_equal([m.sid for m in second.instances()], ["SM2", "SM1"])
+        assert_equal(second["SM2"].body, "Body of SM2")
+        assert_equal(second["SM2"].parent, self.messages)
+        assert_equal(list(second.errors), ["SM3"])
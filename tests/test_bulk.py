@@ -0,0 +1,179 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from mock import Mock
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.compat import urlparse
+from twilio.exceptions import TwilioException
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import Messages
+from twilio.rest.resources.bulk import Journal, RateLimiter
+from tests.tools import FakeApi
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+
+
+class BulkApi(FakeApi):
+
+    def __init__(self, latency=0, errors=None):
+        super(BulkApi, self).__init__(latency)
+        self.errors = errors or {}
+
+    def note(self, method, uri, params, data):
+        return (method, _path(uri), (data or {}).get("To"))
+
+    def respond(self, method, uri, params, data):
+        path = _path(uri)
+        data = data or {}
+        status = self.errors.get(data.get("To") or path)
+        if status:
+            raise TwilioRestException(status, uri, "Boom %d" % status)
+        if method == "DELETE":
+            return Mock(status_code=204), None
+        sid = path.split("/")[-1] if method == "POST" and \
+            path != "/Messages" else "SM" + data["To"]
+        return Mock(status_code=201), {"sid": sid, "to": data.get("To"),
+                                       "body": data.get("Body")}
+
+
+def _path(uri):
+    return urlparse(uri).path.replace(urlparse(BASE_URI).path, "")
+
+
+def sends(count):
+    return [{"to": "%d" % i, "from_": "+1", "body": "Hi"}
+            for i in range(count)]
+
+
+class BulkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.messages = Messages(BASE_URI, AUTH)
+        self.dir = tempfile.mkdtemp()
+        self.journal = os.path.join(self.dir, "job.journal")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_create(self):
+        api = BulkApi().install(self)
+        job = self.messages.bulk_create(sends(5), concurrency=3)
+        outcomes = sorted(job, key=lambda o: o.key)
+        assert_equal([o.key for o in outcomes], [0, 1, 2, 3, 4])
+        assert_true(all(o.ok for o in outcomes))
+        assert_equal(outcomes[2].result.sid, "SM2")
+        assert_equal(outcomes[2].item["to"], "2")
+        assert_equal(len(api.requests), 5)
+        assert_equal((job.succeeded, job.failed, job.skipped), (5, 0, 0))
+
+    def test_runs_concurrently(self):
+        BulkApi(latency=0.05).install(self)
+        start = time.time()
+        self.messages.bulk_create(sends(8), concurrency=8).run()
+        assert_true(time.time() - start < 0.3)
+
+    def test_rate(self):
+        BulkApi().install(self)
+        start = time.time()
+        self.messages.bulk_create(sends(6), concurrency=6, rate=50).run()
+        assert_true(time.time() - start >= 0.09)
+
+    def test_failures_dont_stop_the_job(self):
+        BulkApi(errors={"1": 400, "3": 503}).install(self)
+        job = self.messages.bulk_create(sends(5))
+        failed = sorted((o.key, o.error.status) for o in job if not o.ok)
+        assert_equal(failed, [(1, 400), (3, 503)])
+        assert_equal((job.succeeded, job.failed), (3, 2))
+
+    def test_resume(self):
+        api = BulkApi(errors={"1": 400, "3": 503}).install(self)
+
+        def key(kwargs):
+            return kwargs["to"]
+
+        job = self.messages.bulk_create(sends(5), journal=self.journal,
+                                        key=key)
+        job.run()
+
+        journal = Journal(self.journal)
+        assert_equal(journal.state("0"), "ok")
+        assert_equal(journal.state("1"), "failed")
+        assert_equal(journal.state("3"), "unknown")
+        assert_equal(journal.entries['"0"']["sid"], "SM0")
+
+        # Turned down requests are retried, unanswered ones held back
+        api.errors = {}
+        api.requests = []
+        job = self.messages.bulk_create(sends(5), journal=self.journal,
+                                        key=key)
+        assert_equal([o.key for o in job], ["1"])
+        assert_equal(job.skipped, 3)
+        assert_equal(job.uncertain, ["3"])
+
+        job = self.messages.bulk_create(sends(5), journal=self.journal,
+                                        key=key, retry_unknown=True)
+        assert_equal([o.key for o in job], ["3"])
+        assert_equal(job.skipped, 4)
+        assert_equal([to for _, _, to in api.requests], ["1", "3"])
+
+    def test_resume_after_crash(self):
+        api = BulkApi().install(self)
+        with open(self.journal, "wb") as f:
+            f.write(b'{"operation": "create", "uri": "' +
+                    self.messages.uri.encode("utf-8") +
+                    b'", "version": 1}\n'
+                    b'{"key": 0, "state": "started"}\n'
+                    b'{"key": 0, "state": "ok"}\n'
+                    b'{"key": 1, "state": "started"}\n'
+                    b'{"key": 2, "sta')
+        job = self.messages.bulk_create(sends(4), journal=self.journal)
+        assert_equal(sorted(o.key for o in job), [2, 3])
+        assert_equal(job.uncertain, [1])
+        assert_equal(len(api.requests), 2)
+        journal = Journal(self.journal)
+        assert_equal(journal.state(2), "ok")
+        assert_equal(journal.state(3), "ok")
+
+    @raises(TwilioException)
+    def test_journal_of_another_job(self):
+        BulkApi().install(self)
+        self.messages.bulk_create(sends(1), journal=self.journal).run()
+        self.messages.bulk_delete(["SM1"], journal=self.journal).run()
+
+    def test_update_and_delete(self):
+        api = BulkApi(errors={"/Messages/SM2": 404}).install(self)
+        job = self.messages.bulk_update([("SM1", {"body": ""}),
+                                         ("SM2", {"body": ""})],
+                                        journal=self.journal)
+        outcomes = dict((o.key, o) for o in job)
+        assert_equal(outcomes["SM1"].result.sid, "SM1")
+        assert_equal(outcomes["SM2"].error.status, 404)
+
+        job = self.messages.bulk_delete(["SM3", "SM4"], concurrency=1)
+        assert_equal([(o.key, o.result) for o in job],
+                     [("SM3", True), ("SM4", True)])
+        assert_equal(sorted(api.requests)[:2],
+                     [("DELETE", "/Messages/SM3", None),
+                      ("DELETE", "/Messages/SM4", None)])
+
+    @raises(TwilioException)
+    def test_runs_once(self):
+        BulkApi().install(self)
+        job = self.messages.bulk_delete(["SM1"])
+        job.run()
+        iter(job)
+
+
+def test_rate_limiter_burst():
+    limiter = RateLimiter(20, burst=3)
+    start = time.time()
+    for _ in range(3):
+        limiter.acquire()
+    assert_true(time.time() - start < 0.04)
+    limiter.acquire()
+    assert_true(time.time() - start >= 0.04)
@@ -1,7 +1,13 @@
 from datetime import date
 from mock import patch, Mock
-from nose.tools import assert_true
-from twilio.rest.resources import Calls, Call
+from nose.tools import assert_equal, assert_true
+from twilio.rest.resources import (
+    Calls,
+    Call,
+    CallFeedbackFactory,
+    Notifications,
+    Recordings,
+)
 from tests.tools import create_mock_json
 
 BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
@@ -100,6 +106,52 @@ def test_paging_iter(mock):
                             use_json_extension=True)
 
 
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_iter_limit(mock):
+    resp = create_mock_json("tests/resources/calls_list.json")
+    mock.return_value = resp
+
+    uri = "%s/Calls" % (BASE_URI)
+    calls = list(list_resource.iter(started_before=date(2010, 12, 5),
+                                    limit=1))
+    exp_params = {'StartTime<': '2010-12-05', 'PageSize': 1}
+
+    assert_equal(len(calls), 1)
+    mock.assert_called_once_with("GET", uri, params=exp_params, auth=AUTH,
+                                 use_json_extension=True)
+
+
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_iter_pages(mock):
+    resp = create_mock_json("tests/resources/calls_list.json")
+    mock.return_value = resp
+
+    uri = "%s/Calls" % (BASE_URI)
+    page = next(list_resource.iter_pages(started_before=date(2010, 12, 5)))
+    exp_params = {'StartTime<': '2010-12-05'}
+
+    assert_equal(len(page), 50)
+    assert_equal(page.cursor, "Page=1&PageSize=50")
+    assert_equal(page.meta["num_pages"], 11)
+    mock.assert_called_once_with("GET", uri, params=exp_params, auth=AUTH,
+                                 use_json_extension=True)
+
+
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_sequence(mock):
+    resp = create_mock_json("tests/resources/calls_list.json")
+    mock.return_value = resp
+
+    uri = "%s/Calls" % (BASE_URI)
+    calls = list_resource.sequence(started_before=date(2010, 12, 5))
+
+    assert_equal(len(calls), 509)
+    assert_equal(len(calls[0:10]), 10)
+    mock.assert_called_once_with("GET", uri, params={
+        'StartTime<': '2010-12-05', 'Page': 0, 'PageSize': 50},
+        auth=AUTH, use_json_extension=True)
+
+
 @patch("twilio.rest.resources.base.make_twilio_request")
 def test_get(mock):
     resp = create_mock_json("tests/resources/calls_instance.json")
@@ -154,3 +206,30 @@ def test_delete(req):
     app.delete()
     uri = "https://api.twilio.com/2010-04-01/Accounts/AC123/Calls/CA123"
     req.assert_called_with("DELETE", uri)
+
+
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_records(mock):
+    resp = create_mock_json("tests/resources/calls_list.json")
+    mock.return_value = resp
+
+    records = list_resource.records(['sid', 'status', 'from'],
+                                    started_after=date(2011, 1, 1))
+    records = [next(records) for i in range(3)]
+
+    assert_true(records[0].sid.startswith("CA"))
+    assert_true(records[0].from_.startswith("+1"))
+    uri = "%s/Calls" % (BASE_URI)
+    mock.assert_called_with("GET", uri, params={"StartTime>": "2011-01-01"},
+                            auth=AUTH, use_json_extension=True)
+
+
+def test_subresources_are_lazy():
+    call = list_resource.load_instance({"sid": CALL_SID})
+
+    assert_true("recordings" not in call.__dict__)
+    assert_true(isinstance(call.recordings, Recordings))
+    assert_true(isinstance(call.notifications, Notifications))
+    assert_true(isinstance(call.feedback, CallFeedbackFactory))
+    assert_true(call.recordings.uri.startswith(call.uri))
+    assert_true(call.recordings is call.recordings)
@@ -0,0 +1,132 @@
+import time
+import unittest
+
+from mock import Mock
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.compat import urlparse
+from twilio.exceptions import TwilioException
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources.coalescing import PendingUpdate
+from twilio.rest.resources.task_router import Workers
+from tests.tools import FakeApi
+
+BASE_URI = "https://taskrouter.twilio.com/v1/Workspaces/WS123"
+AUTH = ("AC123", "token")
+FIELDS = {"ActivitySid": "activity_sid", "FriendlyName": "friendly_name"}
+
+
+class WorkersApi(FakeApi):
+
+    def __init__(self, latency=0, fail=False):
+        super(WorkersApi, self).__init__(latency)
+        self.fail = fail
+        self.overlapped = False
+
+    def note(self, method, uri, params, data):
+        sid = urlparse(uri).path.split("/")[-1]
+        if any(flying == sid for flying, _ in self.in_flight):
+            self.overlapped = True
+        return sid, data
+
+    def respond(self, method, uri, params, data):
+        sid = urlparse(uri).path.split("/")[-1]
+        if self.fail:
+            raise TwilioRestException(500, uri, "Boom")
+        record = {"sid": sid}
+        record.update((FIELDS[k], v) for k, v in data.items())
+        return Mock(), record
+
+
+class CoalescingWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.workers = Workers(BASE_URI, AUTH, None)
+
+    def test_merges_updates_in_window(self):
+        api = WorkersApi().install(self)
+        writer = self.workers.coalescing_writer(window=0.05)
+        first = writer.update("WK1", activity_sid="WA1", friendly_name="a")
+        second = writer.update("WK1", activity_sid="WA2")
+        other = writer.update("WK2", activity_sid="WA3")
+        assert_true(not first.done())
+
+        assert_equal(first.result(1).activity_sid, "WA2")
+        assert_true(second.result(1) is first.result())
+        assert_equal(first.result().friendly_name, "a")
+        assert_equal(other.result(1).sid, "WK2")
+        assert_equal(sorted(api.requests), [
+            ("WK1", {"ActivitySid": "WA2", "FriendlyName": "a"}),
+            ("WK2", {"ActivitySid": "WA3"}),
+        ])
+        assert_equal((writer.updates, writer.posts), (3, 2))
+        writer.close()
+
+    def test_new_window_after_send(self):
+        api = WorkersApi().install(self)
+        writer = self.workers.coalescing_writer(window=0.01)
+        writer.update("WK1", activity_sid="WA1").result(1)
+        writer.update("WK1", activity_sid="WA2").result(1)
+        assert_equal([data for _, data in api.requests],
+                     [{"ActivitySid": "WA1"}, {"ActivitySid": "WA2"}])
+        writer.close()
+
+    def test_sends_one_post_per_sid_at_a_time(self):
+        api = WorkersApi(latency=0.05).install(self)
+        writer = self.workers.coalescing_writer(window=0, concurrency=4)
+        pending = []
+        for i in range(4):
+            pending.append(writer.update("WK1", activity_sid="WA%d" % i))
+            time.sleep(0.01)
+        assert_equal(pending[-1].result(1).activity_sid, "WA3")
+        assert_true(not api.overlapped)
+        assert_equal(api.requests[-1], ("WK1", {"ActivitySid": "WA3"}))
+        writer.close()
+
+    def test_flush(self):
+        api = WorkersApi().install(self)
+        writer = self.workers.coalescing_writer(window=60)
+        pending = writer.update("WK1", activity_sid="WA1")
+        assert_true(writer.flush(1))
+        assert_true(pending.done())
+        assert_equal(len(api.requests), 1)
+        writer.close()
+
+    def test_close_sends_pending(self):
+        api = WorkersApi().install(self)
+        with self.workers.coalescing_writer(window=60) as writer:
+            pending = writer.update("WK1", activity_sid="WA1")
+        assert_equal(pending.result(0).sid, "WK1")
+        assert_equal(len(api.requests), 1)
+        assert_true(not any(t.is_alive() for t in writer._threads))
+
+    @raises(TwilioException)
+    def test_closed(self):
+        writer = self.workers.coalescing_writer()
+        writer.close()
+        writer.update("WK1", activity_sid="WA1")
+
+    def test_failure_reaches_every_caller(self):
+        WorkersApi(fail=True).install(self)
+        writer = self.workers.coalescing_writer(window=0.01)
+        first = writer.update("WK1", activity_sid="WA1")
+        second = writer.update("WK1", activity_sid="WA2")
+        assert_equal(first.exception(1).status, 500)
+        assert_true(second.exception(1) is first.exception())
+        self.assertRaises(TwilioRestException, second.result)
+        writer.close()
+
+
+class PendingUpdateTest(unittest.TestCase):
+
+    def test_callbacks(self):
+        pending = PendingUpdate()
+        seen = []
+        pending.add_done_callback(lambda p: seen.append(p.result()))
+        pending._finish("result", None)
+        pending.add_done_callback(lambda p: seen.append(p.result()))
+        assert_equal(seen, ["result", "result"])
+
+    @raises(TwilioException)
+    def test_result_timeout(self):
+        PendingUpdate().result(0.01)
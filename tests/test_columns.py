@@ -0,0 +1,134 @@
+import array
+import json
+import unittest
+
+from mock import Mock, patch
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio import TwilioException
+from twilio.rest.resources import Calls, NextGenListResource
+from twilio.rest.resources.columns import (
+    batch_columns, column_type, date_column, number_column,
+)
+from twilio.rest.resources.imports import numpy
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+
+
+def is_nan(value):
+    return value != value
+
+
+class ColumnTypeTest(unittest.TestCase):
+
+    def test_types(self):
+        assert_equal(column_type("price"), "number")
+        assert_equal(column_type("date_created"), "date")
+        assert_equal(column_type("start_time"), "date")
+        assert_equal(column_type("to"), "str")
+
+
+class ArrayColumnsTest(unittest.TestCase):
+
+    def test_numbers(self):
+        column = number_column(["-0.0075", None, "12", "n/a"])
+        assert_true(isinstance(column, array.array))
+        assert_equal(column[0], -0.0075)
+        assert_true(is_nan(column[1]))
+        assert_equal(column[2], 12.0)
+        assert_true(is_nan(column[3]))
+
+    def test_dates(self):
+        column = date_column(["Tue, 15 Feb 2011 04:21:00 +0000", None,
+                              "2015-01-01T00:00:00Z", "soon"])
+        assert_equal(column[0], 1297743660.0)
+        assert_true(is_nan(column[1]))
+        assert_equal(column[2], 1420070400.0)
+        assert_true(is_nan(column[3]))
+
+    def test_batches(self):
+        records = [{"sid": str(i), "duration": str(i)} for i in range(5)]
+        batches = list(batch_columns([records[:3], records[3:]],
+                                     ["sid", "duration"], 2))
+        assert_equal([b["sid"] for b in batches],
+                     [["0", "1"], ["2", "3"], ["4"]])
+        assert_equal(list(batches[2]["duration"]), [4.0])
+
+    def test_exact_batches(self):
+        records = [{"sid": str(i)} for i in range(4)]
+        assert_equal(len(list(batch_columns([records], ["sid"], 2))), 2)
+
+    def test_types(self):
+        records = [{"to": "+14155550000"}]
+        batch = next(batch_columns([records], ["to"], 10, {"to": "number"}))
+        assert_equal(list(batch["to"]), [14155550000.0])
+
+    @raises(TwilioException)
+    def test_unknown_type(self):
+        batch_columns([], ["to"], 10, {"to": "phone"})
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class NumpyColumnsTest(unittest.TestCase):
+
+    def test_numbers(self):
+        column = number_column(["-0.0075", None, "n/a"], numpy)
+        assert_equal(column.dtype, numpy.float64)
+        assert_equal(column[0], -0.0075)
+        assert_true(numpy.isnan(column[1]))
+        assert_true(numpy.isnan(column[2]))
+
+    def test_dates(self):
+        column = date_column(["Tue, 15 Feb 2011 04:21:00 +0000", None,
+                              "2015-01-01T00:00:00Z", "soon"], numpy)
+        assert_equal(str(column.dtype), "datetime64[s]")
+        assert_equal(str(column[0]), "2011-02-15T04:21:00")
+        assert_true(numpy.isnat(column[1]))
+        assert_equal(str(column[2]), "2015-01-01T00:00:00")
+        assert_true(numpy.isnat(column[3]))
+
+    def test_strings(self):
+        batch = next(batch_columns([[{"to": "+1"}]], ["to"], 10, np=numpy))
+        assert_equal(batch["to"].dtype, object)
+
+
+class IterColumnsTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/resources/calls_list.json") as f:
+            self.page = json.load(f)
+        self.page["next_page_uri"] = None
+        self.calls = Calls(BASE_URI, AUTH)
+        self.calls.request = Mock()
+        self.calls.request.return_value = Mock(), self.page
+
+    def test_iter_columns(self):
+        batches = list(self.calls.iter_columns(
+            ["sid", "duration", "date_created"], batch=20, numpy=False,
+            status="completed"))
+        assert_equal([len(b["sid"]) for b in batches], [20, 20, 10])
+        assert_equal(batches[0]["sid"][0], self.page["calls"][0]["sid"])
+        assert_equal(batches[0]["duration"][0],
+                     float(self.page["calls"][0]["duration"]))
+        self.calls.request.assert_called_with(
+            "GET", self.calls.uri, params={"Status": "completed"})
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self):
+        batch = next(self.calls.iter_columns(["duration"]))
+        assert_true(isinstance(batch["duration"], numpy.ndarray))
+
+    @raises(TwilioException)
+    def test_numpy_missing(self):
+        with patch("twilio.rest.resources.columns.numpy", None):
+            self.calls.iter_columns(["duration"], numpy=True)
+
+    def test_next_gen(self):
+        resource = NextGenListResource(BASE_URI, AUTH)
+        resource.request = Mock()
+        resource.request.return_value = Mock(), {
+            "meta": {"key": "resources"},
+            "resources": [{"sid": "1", "date_created": "2015-01-01T00:00:00Z"}]}
+        batch = next(resource.iter_columns(["date_created"], numpy=False))
+        assert_equal(list(batch["date_created"]), [1420070400.0])
@@ -0,0 +1,203 @@
+import gc
+import json
+import unittest
+import weakref
+from datetime import datetime
+
+from mock import Mock, patch
+from nose.tools import assert_equal, assert_false, assert_true, raises
+
+from tests.tools import create_mock_json
+from twilio.rest.resources import (
+    InstanceResource, ListResource, PhoneNumber, PhoneNumbers,
+)
+from twilio.rest.resources.compact import (
+    compact_class, documented_fields, resource_context,
+)
+from twilio.rest.resources.task_router.workers import Worker, Workers
+
+AUTH = ("AC123", "token")
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+TASKROUTER_URI = "https://taskrouter.twilio.com/v1/Workspaces/WS123"
+
+
+def fixture(path, key):
+    with open("tests/resources/" + path) as f:
+        return json.load(f)[key]
+
+
+class Sheep(InstanceResource):
+    """
+    .. attribute:: sid
+
+    .. attribute:: from
+
+    .. attribute:: uri
+
+        A property, so not a field
+    """
+
+
+class Lamb(Sheep):
+    """
+    .. attribute:: wool
+
+    .. attribute:: sid
+    """
+
+
+class DocumentedFieldsTest(unittest.TestCase):
+
+    def test_fields(self):
+        assert_equal(documented_fields(Sheep), ("sid", "from_"))
+
+    def test_inherited(self):
+        assert_equal(documented_fields(Lamb), ("sid", "from_", "wool"))
+
+    def test_cached_class(self):
+        klass = compact_class(Lamb)
+        assert_true(compact_class(Lamb) is klass)
+        assert_true(issubclass(klass, Lamb))
+        assert_equal(klass.__name__, "CompactLamb")
+
+
+class CompactWorkerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.workers = Workers(TASKROUTER_URI, AUTH, 30)
+        self.workers.compact_instances = True
+        self.record = fixture("task_router/workers_list.json", "workers")[0]
+
+    def test_fields(self):
+        worker = self.workers.load_instance(dict(self.record))
+        assert_true(isinstance(worker, Worker))
+        assert_false(hasattr(type(worker), "__weakref__") and
+                     "__weakref__" in type(worker).__slots__)
+        assert_equal(worker.sid, self.record["sid"])
+        assert_equal(worker.name, self.record["sid"])
+        assert_equal(worker.attributes.data,
+                     json.loads(self.record["attributes"]))
+        assert_true(isinstance(worker.date_created, datetime))
+
+    def test_context(self):
+        worker = self.workers.load_instance(dict(self.record))
+        assert_true(worker.parent is self.workers)
+        assert_equal(worker.base_uri, self.workers.uri)
+        assert_equal(worker.auth, AUTH)
+        assert_equal(worker.timeout, 30)
+        assert_equal(worker.uri, "%s/%s" % (self.workers.uri, worker.sid))
+
+        other = self.workers.load_instance(dict(self.record))
+        assert_true(worker._context is other._context)
+
+    def test_undocumented_fields(self):
+        record = dict(self.record, shoe_size="10")
+        worker = self.workers.load_instance(record)
+        assert_equal(worker.shoe_size, "10")
+        assert_equal(worker.__dict__["shoe_size"], "10")
+
+    @raises(AttributeError)
+    def test_missing_field(self):
+        worker = self.workers.load_instance(dict(self.record))
+        worker.shoe_size
+
+    def test_equal_to_regular(self):
+        compact = self.workers.load_instance(dict(self.record))
+        regular = Worker(self.workers, self.record["sid"])
+        regular.load(dict(self.record))
+
+        assert_equal(compact.__dict__, regular.__dict__)
+        assert_true(compact == regular)
+        assert_true(regular == compact)
+        assert_equal(hash(compact), hash(regular))
+
+    def test_set_attributes(self):
+        worker = self.workers.load_instance(dict(self.record))
+        worker.friendly_name = "Bob"
+        worker.note = "not a field"
+        assert_equal(worker.friendly_name, "Bob")
+        assert_equal(worker.note, "not a field")
+
+    def test_subresources(self):
+        worker = self.workers.load_instance(dict(self.record))
+        assert_equal(worker.reservations.uri,
+                     "%s/Reservations" % worker.uri)
+        assert_true(worker.reservations is worker.reservations)
+
+    def test_lazy_dates(self):
+        self.workers.lazy_dates = True
+        worker = self.workers.load_instance(dict(self.record))
+        assert_true(isinstance(worker.date_updated, datetime))
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_update(self, request):
+        resp = create_mock_json(
+            "tests/resources/task_router/workers_instance.json")
+        request.return_value = resp
+        worker = self.workers.load_instance(dict(self.record))
+        worker.update(friendly_name="Bob")
+        assert_equal(worker.friendly_name, json.loads(resp.content)[
+            "friendly_name"])
+
+
+class CompactPhoneNumberTest(unittest.TestCase):
+
+    def setUp(self):
+        self.numbers = PhoneNumbers(BASE_URI, AUTH)
+        self.numbers.compact_instances = True
+        self.records = fixture("incoming_phone_numbers_list.json",
+                               "incoming_phone_numbers")
+
+    def test_fields(self):
+        number = self.numbers.load_instance(dict(self.records[0]))
+        assert_true(isinstance(number, PhoneNumber))
+        assert_equal(number.phone_number, self.records[0]["phone_number"])
+        assert_equal(number.capabilities, self.records[0]["capabilities"])
+        assert_equal(number.base_uri, number.parent.uri)
+
+    def test_shared_parent(self):
+        # Each phone number makes its own parent for its account, which
+        # compact instances share
+        first = self.numbers.load_instance(dict(self.records[0]))
+        second = self.numbers.load_instance(dict(self.records[0]))
+        assert_true(first.parent is second.parent)
+        assert_true(first._context is second._context)
+
+    def test_transfer_parent(self):
+        number = self.numbers.load_instance(dict(self.records[0]))
+        parent = PhoneNumbers(BASE_URI.replace("AC123", "AC456"), AUTH)
+        number.parent = parent
+        assert_true(number.parent is parent)
+        assert_equal(number.base_uri, parent.uri)
+
+
+class ResourceContextTest(unittest.TestCase):
+
+    def test_shared(self):
+        parent = ListResource(BASE_URI, AUTH)
+        first = resource_context(parent, parent.uri, AUTH, None)
+        second = resource_context(parent, parent.uri, AUTH, None)
+        assert_true(first is second)
+
+    def test_per_parent(self):
+        parent = ListResource(BASE_URI, AUTH)
+        other = ListResource(BASE_URI, AUTH)
+        first = resource_context(parent, parent.uri, AUTH, None)
+        second = resource_context(other, other.uri, AUTH, None)
+        assert_true(first is not second)
+        assert_true(second.parent is other)
+
+    def test_freed_with_parent(self):
+        parent = ListResource(BASE_URI, AUTH)
+        resource_context(parent, parent.uri, AUTH, None)
+        ref = weakref.ref(parent)
+        del parent
+        gc.collect()
+        assert_equal(ref(), None)
+
+    def test_unhashable(self):
+        parent = ListResource(BASE_URI, AUTH)
+        auth = Mock()
+        auth.__hash__ = None
+        context = resource_context(parent, parent.uri, auth, None)
+        assert_true(context.auth is auth)
@@ -1,7 +1,12 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from datetime import date
+from email.utils import formatdate
+import calendar
 
-from nose.tools import assert_equal
+from mock import Mock
+from nose.tools import assert_equal, assert_true, raises
+import pytz
+from six import u
 
 from twilio.rest.resources import parse_date
 from twilio.rest.resources import transform_params
@@ -9,6 +14,22 @@ from twilio.rest.resources import convert_keys
 from twilio.rest.resources import convert_case
 from twilio.rest.resources import convert_boolean
 from twilio.rest.resources import normalize_dates
+from twilio.compat import urlencode
+from twilio.rest.resources.util import (
+    DATE_CACHE_SIZE,
+    PARAM_NAME_CACHE_SIZE,
+    PARAM_VALUE_CACHE_SIZE,
+    _iso_cache,
+    _param_names,
+    _quoted_values,
+    changed_fields,
+    encode_params,
+    format_name,
+    parse_api_date,
+    parse_iso_date,
+    parse_rfc2822_date,
+    record_field,
+)
 
 
 def test_date():
@@ -100,3 +121,123 @@ def test_convert_keys():
     }
 
     assert_equal(ed, convert_keys(d))
+
+
+def test_convert_date_range_keys():
+    assert_equal(convert_keys({"date_sent_before": 0,
+                               "date_created_after": 1}),
+                 {"DateSent<": 0, "DateCreated>": 1})
+
+
+def test_convert_keys_cached():
+    assert_equal(convert_keys({"started_after": 0}), {"StartTime>": 0})
+    assert_equal(convert_keys({"started_after": 1}), {"StartTime>": 1})
+
+
+def test_format_name_cached():
+    assert_equal(format_name("status_callback"), "StatusCallback")
+    assert_equal(_param_names["status_callback"], "StatusCallback")
+    assert_equal(format_name("StatusCallback"), "StatusCallback")
+
+
+def test_format_name_cache_bounded():
+    for i in range(PARAM_NAME_CACHE_SIZE + 10):
+        format_name("name_%d" % i)
+    assert_true(len(_param_names) <= PARAM_NAME_CACHE_SIZE)
+    assert_equal(format_name("name_1"), "Name1")
+
+
+def test_encode_params():
+    data = {
+        "To": "+1 415-555-1212",
+        "Body": u("Chlo\xe9 & co"),
+        "MediaUrl": ["http://a/1.png", b"http://a/2.png"],
+        "MaxPrice": 10,
+        "Empty": [],
+    }
+    expected = dict((k.encode("utf-8"), v) for k, v in data.items())
+    expected[b"Body"] = data["Body"].encode("utf-8")
+    assert_equal(encode_params(data), urlencode(expected, doseq=True))
+
+
+def test_encode_params_value_cache():
+    for i in range(PARAM_VALUE_CACHE_SIZE + 10):
+        encode_params({"To": "+1415%07d" % i})
+    assert_true(len(_quoted_values) <= PARAM_VALUE_CACHE_SIZE)
+    assert_equal(encode_params({"To": "+14150000001"}), "To=%2B14150000001")
+    assert_equal(encode_params({"Body": "x" * 300}), "Body=" + "x" * 300)
+    assert_true("x" * 300 not in _quoted_values)
+
+
+@raises(ValueError)
+def test_encode_params_bad_value():
+    encode_params({"Body": 1.5})
+
+
+@raises(ValueError)
+def test_encode_params_bad_list_value():
+    encode_params({"Body": [None]})
+
+
+def test_parse_rfc2822_date():
+    d = datetime(2011, 2, 1, 4, 21, 0)
+    for i in range(400):
+        d += timedelta(days=3, seconds=3671)
+        s = formatdate(calendar.timegm(d.timetuple()))
+        assert_equal(parse_rfc2822_date(s), d)
+
+
+def test_parse_rfc2822_date_other_formats():
+    assert_equal(parse_rfc2822_date("Tue, 5 Feb 2011 04:21:00 +0000"),
+                 datetime(2011, 2, 5, 4, 21, 0))
+    assert_equal(parse_rfc2822_date("Tue, 15 Foo 2011 04:21:00 +0000"), None)
+    assert_equal(parse_rfc2822_date("garbage"), None)
+
+
+def test_parse_rfc2822_date_none():
+    assert_equal(parse_rfc2822_date(None), None)
+
+
+def test_parse_iso_date():
+    assert_equal(parse_iso_date("2015-01-31T23:59:58Z"),
+                 datetime(2015, 1, 31, 23, 59, 58, tzinfo=pytz.utc))
+    assert_equal(parse_iso_date("2015-02-31T23:59:58Z"),
+                 "2015-02-31T23:59:58Z")
+    assert_equal(parse_iso_date("2015-01-31"), "2015-01-31")
+
+
+def test_parse_api_date():
+    expected = datetime(2015, 1, 31, 23, 59, 58)
+    assert_equal(parse_api_date("Sat, 31 Jan 2015 23:59:58 +0000"), expected)
+    assert_equal(parse_api_date("2015-01-31T23:59:58Z"), expected)
+    assert_equal(parse_api_date("2015-01-31"), None)
+    assert_equal(parse_api_date("garbage"), None)
+
+
+def test_record_field():
+    assert_equal(record_field({"from": "+1555"}, "from_"), "+1555")
+    assert_equal(record_field({"sid": "CA1"}, "status"), None)
+    assert_equal(record_field(Mock(from_="+1555"), "from_"), "+1555")
+
+
+def test_date_cache_is_bounded():
+    d = datetime(2015, 1, 1, tzinfo=pytz.utc)
+    for i in range(DATE_CACHE_SIZE + 10):
+        s = (d + timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        assert_equal(parse_iso_date(s), d + timedelta(seconds=i))
+        assert_true(len(_iso_cache) <= DATE_CACHE_SIZE)
+
+
+def test_changed_fields():
+    record = {"voice_url": "http://a", "voice_caller_id_lookup": False,
+              "sms_url": None, "from": "+1555", "priority": 1}
+    assert_equal(changed_fields(record, {"voice_url": "http://a",
+                                         "voice_caller_id_lookup": False,
+                                         "from_": "+1555",
+                                         "priority": "1",
+                                         "sms_url": None}), [])
+    assert_equal(changed_fields(record, {"voice_url": "http://b",
+                                         "VoiceCallerIdLookup": "true",
+                                         "sms_url": "",
+                                         "status_callback": "http://c"}),
+                 ["voice_caller_id_lookup", "status_callback", "voice_url"])
@@ -0,0 +1,165 @@
+import threading
+import time
+import unittest
+
+from mock import Mock
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio import TwilioException
+from twilio.compat import urlparse
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources.crawler import Crawler, normalize_spec
+from twilio.rest.resources.ip_messaging import (
+    Channel, Member, Service, Services,
+)
+from tests.tools import FakeApi
+
+BASE_URI = "https://ip-messaging.twilio.com/v1"
+AUTH = ("AC123", "token")
+
+TREE = {
+    "/v1/Services": ["IS1", "IS2"],
+    "/v1/Services/IS1/Channels": ["CH1", "CH2", "CH3"],
+    "/v1/Services/IS2/Channels": ["CH4"],
+    "/v1/Services/IS1/Channels/CH1/Members": ["MB1", "MB2"],
+    "/v1/Services/IS1/Channels/CH2/Members": ["MB3"],
+    "/v1/Services/IS2/Channels/CH4/Members": ["MB4"],
+    "/v1/Services/IS1/Channels/CH1/Messages": ["IM1"],
+    "/v1/Services/IS1/Users": ["US1"],
+}
+
+
+class TreeApi(FakeApi):
+    """ Serves TREE a record per page """
+
+    def __init__(self, latency=0, fail=None):
+        super(TreeApi, self).__init__(latency)
+        self.fail = fail
+
+    def respond(self, method, uri, params, data):
+        parsed = urlparse(uri)
+        if parsed.path == self.fail:
+            raise TwilioRestException(500, uri, "Boom")
+        sids = TREE.get(parsed.path, [])
+        index = int(parsed.query[len("Page="):] or 0)
+        key = parsed.path.rsplit("/", 1)[1].lower()
+        more = index + 1 < len(sids)
+        return Mock(), {
+            "meta": {
+                "key": key,
+                "next_page_url": "%s?Page=%d" % (
+                    parsed.path, index + 1) if more else None,
+            },
+            key: [{"sid": sid} for sid in sids[index:index + 1]],
+        }
+
+
+SPEC = {"channels": {"members": None, "messages": None}, "users": None}
+
+ALL = set([
+    ("services", "IS1"),
+    ("services", "IS2"),
+    ("services", "IS1", "channels", "CH1"),
+    ("services", "IS1", "channels", "CH2"),
+    ("services", "IS1", "channels", "CH3"),
+    ("services", "IS2", "channels", "CH4"),
+    ("services", "IS1", "channels", "CH1", "members", "MB1"),
+    ("services", "IS1", "channels", "CH1", "members", "MB2"),
+    ("services", "IS1", "channels", "CH2", "members", "MB3"),
+    ("services", "IS2", "channels", "CH4", "members", "MB4"),
+    ("services", "IS1", "channels", "CH1", "messages", "IM1"),
+    ("services", "IS1", "users", "US1"),
+])
+
+
+class CrawlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.services = Services(BASE_URI, AUTH)
+
+    def crawl(self, api, *args, **kwargs):
+        with api.patch():
+            crawler = self.services.crawl(*args, **kwargs)
+            return crawler, list(crawler)
+
+    def test_crawl(self):
+        crawler, results = self.crawl(TreeApi(), SPEC)
+        paths = [path for path, _ in results]
+        assert_equal(len(paths), len(ALL))
+        assert_equal(set(paths), ALL)
+        records = dict(results)
+        assert_true(isinstance(records[("services", "IS1")], Service))
+        channel = records[("services", "IS1", "channels", "CH1")]
+        assert_true(isinstance(channel, Channel))
+        member = records[("services", "IS1", "channels", "CH1", "members",
+                          "MB1")]
+        assert_true(isinstance(member, Member))
+        assert_equal(member.sid, "MB1")
+        assert_true(not crawler.truncated)
+        # The services, and every list under each service and channel
+        assert_equal(crawler.lists, 13)
+        # A page per record, and one for each empty list
+        assert_equal(crawler.pages, 17)
+
+    def test_concurrency_cap(self):
+        api = TreeApi(latency=0.02)
+        start = time.time()
+        self.crawl(api, SPEC, concurrency=3)
+        assert_true(api.most_in_flight <= 3)
+        assert_true(api.most_in_flight > 1)
+        assert_true(time.time() - start < 0.02 * len(api.requests))
+
+    def test_max_depth(self):
+        crawler, results = self.crawl(TreeApi(), SPEC, max_depth=1)
+        assert_equal(set(p for p, _ in results),
+                     set(p for p in ALL if len(p) <= 4))
+        assert_true(crawler.truncated)
+
+        crawler, results = self.crawl(TreeApi(), SPEC, max_depth=0)
+        assert_equal(len(results), 2)
+
+    def test_timeout(self):
+        api = TreeApi(latency=0.05)
+        crawler, results = self.crawl(api, SPEC, timeout=0.12)
+        assert_true(crawler.truncated)
+        assert_true(0 < len(results) < len(ALL))
+
+    def test_list_spec(self):
+        _, results = self.crawl(TreeApi(), ["users"])
+        assert_equal(set(p for p, _ in results), set([
+            ("services", "IS1"), ("services", "IS2"),
+            ("services", "IS1", "users", "US1")]))
+
+    def test_instance_root(self):
+        service = self.services.load_instance({"sid": "IS2"})
+        with TreeApi().patch():
+            results = list(Crawler(service, {"channels": ["members"]}))
+        assert_equal([p for p, _ in results], [
+            ("channels", "CH4"), ("channels", "CH4", "members", "MB4")])
+
+    @raises(TwilioRestException)
+    def test_error(self):
+        self.crawl(TreeApi(fail="/v1/Services/IS1/Channels"), SPEC)
+
+    def test_stop_early(self):
+        with TreeApi(latency=0.01).patch():
+            for path, record in self.services.crawl(SPEC, concurrency=4):
+                break
+            time.sleep(0.3)
+        assert_equal([t for t in threading.enumerate()
+                      if t.name == "crawler"], [])
+
+    @raises(TwilioException)
+    def test_unknown_subresource(self):
+        self.services.crawl({"channels": {"participants": None}})
+
+    @raises(TwilioException)
+    def test_runs_once(self):
+        crawler, _ = self.crawl(TreeApi(), None)
+        list(crawler)
+
+    def test_normalize_spec(self):
+        assert_equal(normalize_spec(None), {})
+        assert_equal(normalize_spec("users"), {"users": {}})
+        assert_equal(normalize_spec({"channels": ["members"]}),
+                     {"channels": {"members": {}}})
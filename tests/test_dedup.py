@@ -0,0 +1,96 @@
+import hashlib
+import unittest
+from datetime import datetime
+
+from nose.tools import assert_equal, assert_false, assert_true
+
+from twilio.rest.resources.dedup import BloomFilter, SidSet, StableScan
+from twilio.rest.resources.util import parse_iso_date
+
+
+def sid(n):
+    return "CA" + hashlib.md5(str(n).encode("ascii")).hexdigest()
+
+
+class BloomFilterTest(unittest.TestCase):
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000, 1e-4)
+        hashes = [int(sid(n)[2:], 16) for n in range(1000)]
+        for h in hashes:
+            bloom.add(h)
+        for h in hashes:
+            assert_true(h in bloom)
+        assert_equal(bloom.count, 1000)
+
+    def test_sized_for_error_rate(self):
+        bloom = BloomFilter(1000, 1e-6)
+        assert_equal(len(bloom.bits), 3595)
+        assert_equal(bloom.hashes, 20)
+
+
+class SidSetTest(unittest.TestCase):
+
+    def test_exact(self):
+        sids = SidSet()
+        assert_true(sids.add("CA1"))
+        assert_false(sids.add("CA1"))
+        assert_equal(len(sids), 1)
+        assert_equal(sids.filters, [])
+
+    def test_moves_to_bloom_filters(self):
+        sids = SidSet(exact_limit=10)
+        for n in range(100):
+            assert_true(sids.add(sid(n)))
+        assert_equal(sids.exact, set())
+        assert_equal([f.capacity for f in sids.filters], [20, 40, 80])
+        for n in range(100):
+            assert_false(sids.add(sid(n)))
+        assert_equal(len(sids), 100)
+
+    def test_other_ids(self):
+        sids = SidSet(exact_limit=1)
+        for name in ("alice", u"b\xf6b", "carol"):
+            assert_true(sids.add(name))
+        assert_false(sids.add(u"b\xf6b"))
+
+
+class StableScanTest(unittest.TestCase):
+
+    def test_pins_start(self):
+        scan = StableScan()
+        scan.start()
+        assert_true(scan.until <= datetime.utcnow())
+        assert_false(scan.accept({"sid": "CA1",
+                                  "date_created": "Tue, 15 Feb 2050 04:21:00 +0000"}))
+        assert_true(scan.accept({"sid": "CA1",
+                                 "date_created": "Tue, 15 Feb 2011 04:21:00 +0000"}))
+        assert_equal(scan.newer, 1)
+
+    def test_aware_dates(self):
+        scan = StableScan(until=datetime(2015, 1, 1, 12))
+        scan.start(parse_iso_date)
+        assert_true(scan.accept({"sid": "1",
+                                 "date_created": "2015-01-01T12:00:00Z"}))
+        assert_false(scan.accept({"sid": "2",
+                                  "date_created": "2015-01-01T12:00:01Z"}))
+
+    def test_undated(self):
+        scan = StableScan()
+        scan.start()
+        assert_true(scan.accept({"sid": "1", "date_created": None}))
+        assert_true(scan.accept({"sid": "2", "date_created": "soon"}))
+        assert_false(scan.accept({"sid": "2"}))
+        assert_equal(scan.duplicates, 1)
+
+    def test_reused(self):
+        scan = StableScan()
+        scan.start()
+        first = scan.until
+        assert_true(scan.accept({"sid": "1"}))
+        assert_false(scan.accept({"sid": "1"}))
+
+        scan.start()
+        assert_true(scan.until >= first)
+        assert_equal(scan.duplicates, 0)
+        assert_true(scan.accept({"sid": "1"}))
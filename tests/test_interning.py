@@ -0,0 +1,52 @@
+import json
+import unittest
+
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest.resources.interning import InternTable
+
+
+def decode(record):
+    # A fresh decode, so nothing is shared with earlier records
+    return json.loads(json.dumps(record))
+
+
+class InternTableTest(unittest.TestCase):
+
+    def test_record(self):
+        table = InternTable()
+        record = {"sid": "SM1", "status": "sent", "price": None,
+                  "subresource_uris": {"media": "/Media.json"}}
+        first = table.record(decode(record))
+        second = table.record(decode(record))
+
+        assert_equal(first, record)
+        assert_true(first["status"] is second["status"])
+        assert_true(first["subresource_uris"]["media"] is
+                    second["subresource_uris"]["media"])
+        for a, b in zip(sorted(first), sorted(second)):
+            assert_true(a is b)
+
+    def test_high_cardinality_field(self):
+        table = InternTable(max_values=3)
+        for i in range(3):
+            table.value("sid", "SM%d" % i)
+        assert_equal(len(table.values["sid"]), 3)
+
+        table.value("sid", "SM3")
+        assert_equal(table.values["sid"], None)
+        value = "".join(["SM", "0"])
+        assert_true(table.value("sid", value) is value)
+
+    def test_long_values(self):
+        table = InternTable(max_length=4)
+        value = "".join(["12", "345"])
+        assert_true(table.value("body", value) is value)
+        assert_equal(len(table), 0)
+
+    def test_bounded_keys(self):
+        table = InternTable(max_keys=2)
+        table.record({"a": "1", "b": "2", "c": "3"})
+        assert_equal(len(table.keys), 2)
+        assert_equal(len(table.values), 2)
+        assert_true(len(table) <= 4)
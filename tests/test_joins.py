@@ -0,0 +1,127 @@
+import unittest
+from datetime import date
+
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.compat import urlparse
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import Calls
+from twilio.rest.resources.joins import CallJoin, index_by
+from tests.tools import FakeApi
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+
+LISTS = {
+    "/Calls": ("calls", [{"sid": "CA1"}, {"sid": "CA2"}, {"sid": "CA3"}]),
+    "/Recordings": ("recordings", [
+        {"sid": "RE1", "call_sid": "CA1"},
+        {"sid": "RE2", "call_sid": "CA1"},
+        {"sid": "RE3", "call_sid": "CA3"},
+        {"sid": "RE4", "call_sid": "CA9"},
+    ]),
+    "/Notifications": ("notifications", [
+        {"sid": "NO1", "call_sid": "CA2"},
+        {"sid": "NO2", "call_sid": None},
+    ]),
+}
+
+
+def _path(uri):
+    return urlparse(uri).path.replace(urlparse(BASE_URI).path, "")
+
+
+class CallsApi(FakeApi):
+
+    def __init__(self, fail=None):
+        super(CallsApi, self).__init__()
+        self.fail = fail
+
+    def note(self, method, uri, params, data):
+        return (_path(uri), params)
+
+    def respond(self, method, uri, params, data):
+        path = _path(uri)
+        if path == self.fail:
+            raise TwilioRestException(500, uri, "Boom")
+        if path.endswith("/Feedback"):
+            if path.startswith("/Calls/CA2"):
+                raise TwilioRestException(404, uri, "Not found")
+            return None, {"quality_score": 5}
+        key, records = LISTS[path]
+        return None, {key: [dict(r) for r in records]}
+
+    def params(self, path):
+        return [p for requested, p in self.requests if requested == path]
+
+
+class CallJoinTest(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = Calls(BASE_URI, AUTH)
+        self.api = CallsApi().install(self)
+
+    def test_join(self):
+        timelines = list(self.calls.timeline(date(2015, 1, 1),
+                                             date(2015, 1, 2)))
+        assert_equal([t.call.sid for t in timelines], ["CA1", "CA2", "CA3"])
+        assert_equal([r.sid for r in timelines[0].recordings],
+                     ["RE1", "RE2"])
+        assert_equal(timelines[0].notifications, [])
+        assert_equal([n.sid for n in timelines[1].notifications], ["NO1"])
+        assert_equal([r.sid for r in timelines[2].recordings], ["RE3"])
+        assert_equal(timelines[2].feedback, None)
+        # One scan of each list, and no request per call
+        assert_equal(len(self.api.requests), 3)
+
+    def test_windows(self):
+        list(self.calls.timeline("2015-01-01", "2015-01-02", status="busy"))
+        assert_equal(self.api.params("/Calls"), [{
+            "StartTime>": "2015-01-01", "StartTime<": "2015-01-02",
+            "Status": "busy"}])
+        # Recordings and notifications of calls near the end of the window
+        # are logged later
+        assert_equal(self.api.params("/Recordings"), [{
+            "DateCreated>": "2015-01-01", "DateCreated<": "2015-01-03"}])
+        assert_equal(self.api.params("/Notifications"), [{
+            "MessageDate>": "2015-01-01", "MessageDate<": "2015-01-03"}])
+
+    def test_raw(self):
+        timelines = list(self.calls.timeline(raw=True))
+        assert_equal(timelines[0].call, {"sid": "CA1"})
+        assert_equal(timelines[0].recordings[1],
+                     {"sid": "RE2", "call_sid": "CA1"})
+
+    def test_feedback(self):
+        timelines = list(self.calls.timeline(feedback=True))
+        assert_equal([t.call.sid for t in timelines], ["CA1", "CA2", "CA3"])
+        assert_equal(timelines[0].feedback.quality_score, 5)
+        assert_equal(timelines[1].feedback, None)
+        assert_equal([r.sid for r in timelines[2].recordings], ["RE3"])
+        feedback = sorted(p for p, _ in self.api.requests if "Feedback" in p)
+        assert_equal(feedback, ["/Calls/CA1/Feedback", "/Calls/CA2/Feedback",
+                                "/Calls/CA3/Feedback"])
+
+    def test_leave_out(self):
+        join = CallJoin(self.calls, recordings=False)
+        timelines = list(join.iter())
+        assert_equal(timelines[0].recordings, [])
+        assert_equal(self.api.params("/Recordings"), [])
+
+    @raises(TwilioRestException)
+    def test_scan_error(self):
+        self.api.fail = "/Notifications"
+        list(self.calls.timeline())
+
+    @raises(TwilioRestException)
+    def test_feedback_error(self):
+        self.api.fail = "/Calls/CA3/Feedback"
+        list(self.calls.timeline(feedback=True))
+
+
+def test_index_by():
+    records = [{"call_sid": "CA1", "sid": "RE1"}, {"sid": "RE2"},
+               {"call_sid": "CA1", "sid": "RE3"}]
+    assert_equal(index_by(records), {"CA1": [records[0], records[2]]})
+    assert_equal(sorted(index_by(records, "sid")), ["RE1", "RE2", "RE3"])
+    assert_true(index_by([]) == {})
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from mock import Mock, patch
+from nose.tools import assert_equal, assert_raises, assert_true
+
+from twilio.exceptions import TwilioException
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import Connection, ListResource, Response
+from twilio.rest.resources.imports import orjson
+from twilio.rest.resources.json_codec import (
+    JsonCodec,
+    StdlibJsonCodec,
+    available_codecs,
+    get_codec,
+)
+
+BODY = u'{"sid": "SM123", "body": "h\xe9llo"}'.encode('utf-8')
+
+
+class GetCodecTest(unittest.TestCase):
+
+    def test_stdlib(self):
+        codec = get_codec('json')
+        assert_true(isinstance(codec, StdlibJsonCodec))
+        assert_equal(codec.loads(BODY), {'sid': 'SM123', 'body': u'h\xe9llo'})
+
+    def test_default_is_installed(self):
+        assert_true(get_codec().name in available_codecs())
+
+    def test_unknown(self):
+        assert_raises(TwilioException, get_codec, 'yaml')
+
+    def test_custom_codec(self):
+        codec = Mock(spec=['loads', 'dumps'])
+        assert_true(get_codec(codec) is codec)
+
+    def test_base_codec(self):
+        codec = JsonCodec()
+        assert_equal(codec.loads(codec.dumps({'sid': 'SM123'})),
+                     {'sid': 'SM123'})
+
+    def test_codec_module(self):
+        class ModuleCodec(JsonCodec):
+            name = 'mock'
+            module = Mock(spec=['loads', 'dumps'])
+
+        codec = ModuleCodec()
+        codec.loads('{}')
+        ModuleCodec.module.loads.assert_called_once_with('{}')
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_lone_surrogate(self):
+        codec = get_codec('orjson')
+        assert_equal(codec.loads(b'{"a": "\\ud800"}'), {'a': u'\ud800'})
+
+
+class ResponseTest(unittest.TestCase):
+
+    def test_content_is_decoded_lazily(self):
+        resp = Response(Mock(status=200), BODY, 'http://example.com')
+        assert_equal(resp.body, BODY)
+        assert_equal(resp._content, None)
+        assert_equal(resp.content, u'{"sid": "SM123", "body": "h\xe9llo"}')
+
+
+class CodecSelectionTest(unittest.TestCase):
+
+    def tearDown(self):
+        Connection.set_json_codec(None)
+
+    def test_client_sets_codec(self):
+        TwilioRestClient("AC123", "token", json_codec='json')
+        assert_true(isinstance(Connection.json_codec(), StdlibJsonCodec))
+
+    @patch('twilio.rest.resources.base.make_twilio_request')
+    def test_request_hands_bytes_to_codec(self, mock):
+        codec = Mock(spec=['loads', 'dumps'])
+        codec.loads.return_value = {'sid': 'SM123'}
+        Connection.set_json_codec(codec)
+        mock.return_value = Response(Mock(status=200), BODY, 'http://a')
+
+        r = ListResource("https://api.twilio.com", ("AC123", "token"))
+        resp, data = r.request("GET", r.uri)
+
+        codec.loads.assert_called_with(BODY)
+        assert_equal(data, {'sid': 'SM123'})
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import json
+import pickle
+import unittest
+
+from nose.tools import assert_equal, assert_true
+from six import text_type
+
+from twilio.rest.resources.lazy_json import find_key, json_field, JsonString
+
+
+DOC = (u'{"nested": {"language": "french", "skills": ["a", "}{"]}, '
+       u'"note": "\\"language\\": \\"spanish\\"", '
+       u'"language": "english", "quoted \\"key\\"": 1, '
+       u'"list": [{"language": "german"}], "unicode": "été", '
+       u'"padding": "%s"}' % (u'x' * 200))
+
+
+def test_find_key():
+    assert_equal(find_key(DOC, "language"), "english")
+    assert_equal(find_key(DOC, "nested"),
+                 {"language": "french", "skills": ["a", "}{"]})
+    assert_equal(find_key(DOC, 'quoted "key"'), 1)
+    assert_equal(find_key(DOC, "unicode"), u"été")
+
+
+def test_find_key_missing():
+    assert_equal(find_key(DOC, "skills"), None)
+    assert_equal(find_key(DOC, "french", 0), 0)
+    assert_equal(find_key('"language"', "language"), None)
+    assert_equal(find_key('{}', "language"), None)
+
+
+class JsonStringTest(unittest.TestCase):
+
+    def test_is_a_string(self):
+        s = JsonString(DOC)
+        assert_true(isinstance(s, text_type))
+        assert_equal(s, DOC)
+        assert_equal(json.loads(s), json.loads(DOC))
+
+    def test_data_is_cached(self):
+        s = JsonString(DOC)
+        assert_equal(s.data, json.loads(DOC))
+        assert_true(s.data is s.data)
+
+    def test_get(self):
+        s = JsonString(DOC)
+        assert_equal(s.get("language"), "english")
+        assert_equal(s.get("missing", "default"), "default")
+        assert_true("_data" not in s.__dict__)
+
+        s.data
+        assert_equal(s.get("language"), "english")
+        assert_equal(s.get("missing"), None)
+
+    def test_get_decodes_when_key_is_far_in(self):
+        s = JsonString(DOC)
+        assert_equal(s.get("unicode"), u"été")
+        assert_true("_data" in s.__dict__)
+
+    def test_get_small(self):
+        s = JsonString('{"language": "english"}')
+        assert_equal(s.get("language"), "english")
+        assert_equal(s.get("missing"), None)
+
+    def test_get_non_object(self):
+        s = JsonString("[%s]" % ", ".join(["1"] * 200))
+        assert_equal(s.get("language"), None)
+        s.data
+        assert_equal(s.get("language"), None)
+
+    def test_pickle(self):
+        s = JsonString(DOC)
+        s.data
+        assert_equal(pickle.loads(pickle.dumps(s)).get("language"), "english")
+
+
+def test_json_field():
+    s = json_field(DOC)
+    assert_true(isinstance(s, JsonString))
+    assert_true(json_field(s) is s)
+
+    data = json_field({"task_attributes": '{"a": 1}', "task_age": "1"})
+    assert_equal(data["task_attributes"].get("a"), 1)
+    assert_true(not isinstance(data["task_age"], JsonString))
+    assert_equal(json_field(None), None)
+
+
+def test_find_key_escaped():
+    assert_equal(find_key('{"\\u006canguage": "english"}', "language"),
+                 "english")
@@ -9,7 +9,11 @@ import twilio
 from nose.tools import assert_equal, raises
 from mock import patch, Mock, ANY
 from twilio.rest.exceptions import TwilioRestException
-from twilio.rest.resources.base import make_request, make_twilio_request
+from twilio.rest.resources.base import (
+    make_request,
+    make_streaming_request,
+    make_twilio_request,
+)
 from twilio.rest.resources.connection import Connection
 from twilio.rest.resources.connection import PROXY_TYPE_SOCKS5
 
@@ -86,6 +90,41 @@ def test_make_twilio_request_headers(mock):
                             headers=post_headers)
 
 
+@patch('twilio.rest.resources.base.make_streaming_request')
+def test_make_twilio_request_stream(mock):
+    url = "http://random/url"
+    make_twilio_request("GET", url, use_json_extension=True, stream=True)
+    mock.assert_called_with("GET", "http://random/url.json",
+                            headers=get_headers)
+
+
+@patch('httplib2.HTTPSConnectionWithTimeout')
+def test_streaming_request(connection_mock):
+    connection = Mock()
+    response = Mock()
+    response.status = 200
+    response.read.side_effect = [b'{"a": ', b'1}', b'']
+    connection.getresponse.return_value = response
+    connection_mock.return_value = connection
+
+    resp = make_streaming_request("GET", "https://api.twilio.com/Calls.json",
+                                  params={"Page": 2}, auth=("AC123", "token"),
+                                  headers={"Accept": "application/json"})
+
+    connection.request.assert_called_with(
+        "GET",
+        "/Calls.json?Page=2",
+        headers={
+            "Accept": "application/json",
+            "Authorization": "Basic QUMxMjM6dG9rZW4=",
+        },
+    )
+    assert_equal(resp.status_code, 200)
+    assert_equal(resp.url, "https://api.twilio.com/Calls.json?Page=2")
+    assert_equal(list(resp.iter_content()), [b'{"a": ', b'1}'])
+    connection.close.assert_called_with()
+
+
 @raises(TwilioRestException)
 @patch('twilio.rest.resources.base.make_request')
 def test_make_twilio_request_bad_data(mock):
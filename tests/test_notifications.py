@@ -26,6 +26,19 @@ def test_paging(mock):
                             use_json_extension=True)
 
 
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_iter_dates(mock):
+    resp = create_mock_json("tests/resources/notifications_list.json")
+    mock.return_value = resp
+
+    uri = "%s/Notifications" % (BASE_URI)
+    next(list_resource.iter(after=date(2010, 12, 5)))
+    exp_params = {'MessageDate>': '2010-12-05'}
+
+    mock.assert_called_with("GET", uri, params=exp_params, auth=AUTH,
+                            use_json_extension=True)
+
+
 @patch("twilio.rest.resources.base.make_twilio_request")
 def test_get(mock):
     resp = create_mock_json("tests/resources/notifications_instance.json")
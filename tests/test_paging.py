@@ -0,0 +1,207 @@
+import random
+import unittest
+
+from nose.tools import (assert_equal, assert_false, assert_raises,
+                        assert_true, raises)
+
+from twilio import TwilioException
+from twilio.rest.resources.paging import Page, PagedSequence, PageSizer
+
+
+def scan(sizer, seconds_per_page, pages=40):
+    """ Feed the sizer full pages timed by seconds_per_page(page_size) """
+    sizes = []
+    for _ in range(pages):
+        size = sizer.page_size
+        sizes.append(size)
+        sizer.record(size, seconds_per_page(size))
+    return sizes
+
+
+class PageSizerTest(unittest.TestCase):
+
+    def test_grows_while_faster(self):
+        # A fixed cost per request makes bigger pages faster, up to the max
+        sizer = PageSizer(max_page_size=1000, pages_per_step=1)
+        sizes = scan(sizer, lambda size: 0.2 + size * 0.0001)
+        assert_equal(sizes[:6], [50, 100, 200, 400, 800, 1000])
+        assert_equal(sizer.page_size, 1000)
+        assert_true(sizer.settled)
+
+    def test_settles_at_best(self):
+        # Pages past 200 records get slower per record
+        def seconds(size):
+            return 0.1 + size * 0.001 + max(0, size - 200) * 0.01
+        sizer = PageSizer(pages_per_step=1)
+        scan(sizer, seconds)
+        assert_equal(sizer.page_size, 200)
+        assert_true(sizer.settled)
+
+    def test_shrinks_when_growing_is_slower(self):
+        def seconds(size):
+            return 0.05 + size * 0.001 + max(0, size - 50) * 0.01
+        sizer = PageSizer(page_size=100, pages_per_step=1)
+        scan(sizer, seconds)
+        assert_equal(sizer.page_size, 50)
+
+    def test_starts_at_max(self):
+        sizer = PageSizer(page_size=1000, max_page_size=1000,
+                          pages_per_step=1)
+        scan(sizer, lambda size: 0.2 + size * 0.0001)
+        assert_equal(sizer.page_size, 1000)
+
+    def test_short_pages_ignored(self):
+        sizer = PageSizer(pages_per_step=1)
+        assert_equal(sizer.record(10, 1.0), 50)
+        assert_false(sizer.settled)
+
+    def test_pages_per_step(self):
+        sizer = PageSizer(pages_per_step=2)
+        assert_equal(sizer.record(50, 0.1), 50)
+        assert_equal(sizer.record(50, 0.1), 100)
+
+    def test_reset(self):
+        sizer = PageSizer(pages_per_step=1)
+        scan(sizer, lambda size: 0.2 + size * 0.0001)
+        sizer.reset()
+        assert_false(sizer.settled)
+        assert_equal(sizer.page_size, 1000)
+
+    def test_clamped(self):
+        sizer = PageSizer(page_size=5000, max_page_size=1000)
+        assert_equal(sizer.page_size, 1000)
+
+
+class PageTest(unittest.TestCase):
+
+    def test_records(self):
+        page = Page(["a", "b"], "Page=1&AfterSid=b", {"page": 0})
+        assert_equal(list(page), ["a", "b"])
+        assert_equal(len(page), 2)
+        assert_equal(repr(page), "<Page of 2 records, next 'Page=1&AfterSid=b'>")
+
+
+class Pages(object):
+    """ Serves pages of range(total), noting which were fetched """
+
+    def __init__(self, total, report_total=True):
+        self.total = total
+        self.report_total = report_total
+        self.fetched = []
+
+    def __call__(self, number, size):
+        self.fetched.append(number)
+        records = list(range(number * size, min((number + 1) * size,
+                                                self.total)))
+        meta = {"page": number}
+        if self.report_total:
+            meta["total"] = self.total
+        return records, meta
+
+
+class LastFirst(object):
+    """ A predictable rng, whose samples are the last items, reversed """
+
+    def __init__(self):
+        self.sizes = []
+        self.drawn = 0
+
+    def sample(self, population, k):
+        self.sizes.append(k)
+        return list(population)[::-1][:k]
+
+    def randrange(self, stop):
+        self.drawn += 1
+        return stop - self.drawn
+
+
+class PagedSequenceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pages = Pages(1234)
+        self.seq = PagedSequence(self.pages, page_size=100, cache_pages=2)
+
+    def test_len(self):
+        assert_equal(len(self.seq), 1234)
+        assert_equal(self.pages.fetched, [0])
+
+    def test_index(self):
+        assert_equal(self.seq[550], 550)
+        assert_equal(self.seq[-1], 1233)
+        assert_equal(self.pages.fetched, [5, 12])
+
+    @raises(IndexError)
+    def test_index_out_of_range(self):
+        len(self.seq)
+        self.seq[1234]
+
+    def test_slice_fetches_covering_pages(self):
+        assert_equal(self.seq[590:620], list(range(590, 620)))
+        assert_equal(self.pages.fetched, [5, 6])
+
+    def test_slice_cached(self):
+        self.seq[590:620]
+        self.seq[600:610]
+        assert_equal(self.pages.fetched, [5, 6])
+
+    def test_cache_bounded(self):
+        for i in (0, 100, 200, 0):
+            self.seq[i]
+        assert_equal(self.pages.fetched, [0, 1, 2, 0])
+
+    def test_negative_slice(self):
+        assert_equal(self.seq[-3:], [1231, 1232, 1233])
+        assert_equal(self.seq[1233:1230:-1], [1233, 1232, 1231])
+        assert_equal(self.seq[10:1300:500], [10, 510, 1010])
+
+    def test_iter(self):
+        assert_equal(list(self.seq), list(range(1234)))
+        assert_equal(self.pages.fetched, list(range(13)))
+
+    def test_no_total(self):
+        pages = Pages(250, report_total=False)
+        seq = PagedSequence(pages, page_size=100)
+        assert_equal(seq[120:130], list(range(120, 130)))
+        assert_equal(seq[240:300], list(range(240, 250)))
+        assert_equal(len(seq), 250)
+
+    def test_no_total_past_the_end(self):
+        seq = PagedSequence(Pages(120, report_total=False), page_size=100)
+        assert_raises(IndexError, lambda: seq[300])
+        # An empty page only shows the end lies before it
+        assert_raises(TwilioException, len, seq)
+        assert_equal(seq[119], 119)
+        assert_equal(len(seq), 120)
+        # A page past a known end doesn't stretch it
+        assert_equal(seq.page(3), [])
+        assert_equal(len(seq), 120)
+
+    @raises(TwilioException)
+    def test_len_without_total(self):
+        len(PagedSequence(Pages(250, report_total=False), page_size=100))
+
+    def test_sample(self):
+        sample = self.seq.sample(150, rng=LastFirst())
+        # The short last page leaves the first two 16 short
+        assert_equal(len(sample), 150)
+        assert_equal(self.pages.fetched, [0, 12, 11, 10])
+
+    def test_sample_draws_only_needed_pages(self):
+        rng = LastFirst()
+        self.seq.sample(150, rng=rng)
+        # Two pages are drawn, and the third read after they fall short
+        assert_equal(rng.sizes[0], 2)
+
+    def test_sample_pages(self):
+        sample = self.seq.sample(10, pages=3, rng=LastFirst())
+        assert_equal(len(sample), 10)
+        assert_equal(self.pages.fetched, [0, 12, 11, 10])
+
+    def test_sample_everything(self):
+        sample = self.seq.sample(5000, rng=LastFirst())
+        assert_equal(sorted(sample), list(range(1234)))
+
+    def test_estimate(self):
+        estimate = self.seq.estimate(lambda r: r % 2 == 0, n=1000,
+                                     rng=random.Random(0))
+        assert_true(500 < estimate < 734)
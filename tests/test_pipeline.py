@@ -0,0 +1,137 @@
+import itertools
+import threading
+import time
+import unittest
+
+from mock import Mock
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio import TwilioException
+from twilio.rest.resources import Calls
+from twilio.rest.resources.pipeline import Pipeline
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+
+
+class Counter(object):
+
+    def __init__(self, stop=None):
+        self.produced = 0
+        self.stop = stop
+
+    def __iter__(self):
+        for i in itertools.count():
+            if i == self.stop:
+                return
+            self.produced += 1
+            yield i
+
+
+def fail(item):
+    if item == 3:
+        raise ValueError("bad item")
+    return item
+
+
+class PipelineTest(unittest.TestCase):
+
+    def test_stages(self):
+        pipeline = (Pipeline(range(10))
+                    .map(lambda x: x * 2)
+                    .filter(lambda x: x % 3)
+                    .batch(3))
+        assert_equal(list(pipeline), [[2, 4, 8], [10, 14, 16]])
+
+    def test_stats(self):
+        pipeline = Pipeline(range(10)).filter(lambda x: x % 2, name="odd")
+        stages = pipeline.run()
+        assert_equal([s.name for s in stages], ["source", "odd"])
+        assert_equal(stages[0].emitted, 10)
+        assert_equal(stages[1].received, 10)
+        assert_equal(stages[1].emitted, 5)
+        assert_true(stages[1].peak_depth >= 1)
+        report = pipeline.report()
+        assert_true("odd" in report)
+        assert_true("source" in report)
+
+    def test_parallel_map_ordered(self):
+        def slow(x):
+            time.sleep(0.01 * (x % 3))
+            return x
+
+        pipeline = Pipeline(range(30)).parallel_map(slow, workers=4)
+        assert_equal(list(pipeline), list(range(30)))
+        assert_equal(pipeline.stages[1].workers, 4)
+
+    def test_parallel_map_unordered(self):
+        pipeline = Pipeline(range(30)).parallel_map(
+            lambda x: x + 1, workers=3, ordered=False)
+        assert_equal(sorted(pipeline), list(range(1, 31)))
+
+    def test_parallel_map_concurrent(self):
+        start = time.time()
+        pipeline = Pipeline(range(16)).parallel_map(
+            lambda x: time.sleep(0.05), workers=8)
+        pipeline.run()
+        assert_true(time.time() - start < 0.4)
+
+    def test_backpressure(self):
+        source = Counter()
+        items = iter(Pipeline(source, buffer=2).map(lambda x: x))
+        assert_equal(next(items), 0)
+        time.sleep(0.3)
+        # Two items in each queue, chunk being sent and chunk being read
+        assert_true(source.produced <= 13)
+        items.close()
+
+    def test_sinks(self):
+        seen = []
+        Pipeline(range(3)).run(seen.append)
+        assert_equal(seen, [0, 1, 2])
+
+        sink = Mock()
+        Pipeline(range(3)).map(str).run(sink)
+        assert_equal(sink.write.call_count, 3)
+
+    @raises(TwilioException)
+    def test_runs_once(self):
+        pipeline = Pipeline(range(3))
+        pipeline.run()
+        pipeline.run()
+
+    @raises(ValueError)
+    def test_stage_error(self):
+        Pipeline(Counter()).map(fail).run()
+
+    @raises(ValueError)
+    def test_parallel_error(self):
+        Pipeline(Counter()).parallel_map(fail, workers=3).run()
+
+    @raises(ValueError)
+    def test_unordered_error(self):
+        Pipeline(Counter()).parallel_map(fail, ordered=False).run()
+
+    @raises(ValueError)
+    def test_source_error(self):
+        Pipeline(fail(x) for x in range(5)).run()
+
+    def test_stop_early(self):
+        before = threading.active_count()
+        pipeline = Pipeline(Counter()).parallel_map(lambda x: x, workers=3)
+        for item in pipeline:
+            if item == 5:
+                break
+        time.sleep(0.5)
+        assert_equal(threading.active_count(), before)
+
+    def test_list_resource(self):
+        calls = Calls(BASE_URI, AUTH)
+        calls.request = Mock()
+        calls.request.return_value = Mock(), {
+            "calls": [{"sid": "CA1"}, {"sid": "CA2"}]}
+        pipeline = calls.pipeline(status="completed").map(lambda c: c.sid)
+        assert_equal(list(pipeline), ["CA1", "CA2"])
+        assert_equal(pipeline.stages[0].name, "iter Calls")
+        params = calls.request.call_args[1]["params"]
+        assert_equal(params["Status"], "completed")
@@ -0,0 +1,161 @@
+import unittest
+from datetime import date, datetime
+
+from mock import Mock
+from nose.tools import assert_equal, assert_true, raises
+import pytz
+
+from twilio import TwilioException
+from twilio.rest.resources import Calls, ListResource, NextGenListResource
+from twilio.rest.resources.query import Predicate
+from twilio.rest.resources.util import parse_iso_date, parse_rfc2822_date
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+
+
+def call(sid, status="completed", duration="10",
+         start_time="Sun, 04 Jan 2015 12:00:00 +0000", from_="+14155550000"):
+    return {"sid": sid, "status": status, "duration": duration,
+            "start_time": start_time, "from": from_}
+
+
+class PredicateTest(unittest.TestCase):
+
+    def test_operators(self):
+        record = {"status": "completed", "duration": "60"}
+        assert_true(Predicate("status", "completed").matches(record, None))
+        assert_true(Predicate("status__ne", "failed").matches(record, None))
+        assert_true(Predicate("status__in", ["busy", "completed"]).matches(
+            record, None))
+        assert_true(Predicate("status__contains", "plet").matches(
+            record, None))
+        assert_true(Predicate("duration__gt", 59).matches(record, None))
+        assert_true(not Predicate("duration__lte", 59.5).matches(
+            record, None))
+
+    def test_missing_field(self):
+        assert_true(not Predicate("to", "+1").matches({}, None))
+        assert_true(Predicate("to__ne", "+1").matches({}, None))
+
+    def test_dates(self):
+        record = {"start_time": "Sun, 04 Jan 2015 12:00:00 +0000"}
+        parse = parse_rfc2822_date
+        assert_true(Predicate("start_time", date(2015, 1, 4)).matches(
+            record, parse))
+        assert_true(Predicate("start_time__gt",
+                              datetime(2015, 1, 4, 11)).matches(
+            record, parse))
+        assert_true(not Predicate("start_time__gt",
+                                  datetime(2015, 1, 4, 12)).matches(
+            record, parse))
+
+    def test_aware_dates(self):
+        record = {"date_created": "2015-01-04T12:00:00Z"}
+        eastern = pytz.timezone("US/Eastern")
+        value = eastern.localize(datetime(2015, 1, 4, 6))
+        assert_true(Predicate("date_created__gte", value).matches(
+            record, parse_iso_date))
+
+    def test_unparseable(self):
+        assert_true(not Predicate("duration__gt", 1).matches(
+            {"duration": "n/a"}, None))
+
+    @raises(TwilioException)
+    def test_unknown_operator(self):
+        Predicate("status__like", "comp%")
+
+
+class QueryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = Calls(BASE_URI, AUTH)
+        self.calls.request = Mock()
+
+    def serve(self, *records):
+        self.calls.request.return_value = Mock(), {"calls": list(records)}
+
+    def test_pushdown(self):
+        query = self.calls.where(status="completed", to="+15555550000",
+                                 started__gte=date(2015, 1, 1),
+                                 from_="+14155550000")
+        params, residual = query.compile()
+        assert_equal(params, {"Status": "completed", "To": "+15555550000",
+                              "StartTime>": "2015-01-01",
+                              "From": "+14155550000"})
+        assert_equal(residual, [])
+
+    def test_residual(self):
+        query = self.calls.where(status="completed", duration__gt=30)
+        params, residual = query.compile()
+        assert_equal(params, {"Status": "completed"})
+        assert_equal([str(p) for p in residual], ["duration > 30"])
+
+    def test_datetime_kept(self):
+        value = datetime(2015, 1, 4, 11)
+        params, residual = self.calls.where(start_time__gt=value).compile()
+        assert_equal(params, {"StartTime>": "2015-01-04"})
+        assert_equal(len(residual), 1)
+
+    def test_aware_datetime_utc_day(self):
+        eastern = pytz.timezone("US/Eastern")
+        value = eastern.localize(datetime(2015, 1, 4, 22))
+        params, residual = self.calls.where(started__lte=value).compile()
+        assert_equal(params, {"StartTime<": "2015-01-05"})
+
+    def test_date_strings(self):
+        params, residual = self.calls.where(
+            ended__lt="2015-01-04", ended__gte="2015-01-01").compile()
+        assert_equal(params, {"EndTime<": "2015-01-04",
+                              "EndTime>": "2015-01-01"})
+        assert_equal([str(p) for p in residual],
+                     ["end_time < datetime.date(2015, 1, 4)"])
+
+    def test_same_filter_twice(self):
+        params, residual = self.calls.where(status="busy").where(
+            status="failed").compile()
+        assert_equal(params, {"Status": "busy"})
+        assert_equal(len(residual), 1)
+
+    def test_iter(self):
+        self.serve(call("CA1", duration="10"), call("CA2", duration="90"),
+                   call("CA3", duration="60"))
+        sids = [c.sid for c in self.calls.where(status="completed",
+                                                duration__gte=60)]
+        assert_equal(sids, ["CA2", "CA3"])
+        self.calls.request.assert_called_with(
+            "GET", self.calls.uri, params={"Status": "completed"})
+
+    def test_limit_after_filtering(self):
+        self.serve(call("CA1", duration="10"), call("CA2", duration="90"),
+                   call("CA3", duration="60"))
+        query = self.calls.where(duration__gte=60)
+        assert_equal([c.sid for c in query.list(limit=1)], ["CA2"])
+
+    def test_raw_fields(self):
+        self.serve(call("CA1", from_="+1"), call("CA2", from_="+2"))
+        query = self.calls.where(from___in=["+2"])
+        records = list(query.iter(raw=True, fields=["sid"]))
+        assert_equal(records, [{"sid": "CA2", "from": "+2"}])
+
+    def test_explain(self):
+        query = self.calls.where(status="completed", duration__gt=30)
+        assert_equal(query.explain(), (
+            "GET %s/Calls\n"
+            "  filtered by the API: Status=completed\n"
+            "  filtered here: duration > 30" % BASE_URI))
+
+    def test_nothing_pushed(self):
+        resource = ListResource(BASE_URI, AUTH)
+        explained = resource.where(name="x").explain()
+        assert_true("filtered by the API: nothing" in explained)
+
+    def test_next_gen(self):
+        resource = NextGenListResource(BASE_URI, AUTH)
+        resource.request = Mock()
+        resource.request.return_value = Mock(), {
+            "meta": {"key": "resources"},
+            "resources": [{"sid": "1", "date_created": "2015-01-04T12:00:00Z"},
+                          {"sid": "2", "date_created": "2015-01-02T12:00:00Z"}]}
+        query = resource.where(date_created__gt=datetime(2015, 1, 3))
+        assert_equal([r.sid for r in query], ["1"])
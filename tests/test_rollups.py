@@ -0,0 +1,179 @@
+import bisect
+import json
+import random
+import unittest
+from datetime import datetime
+
+from mock import Mock
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio import TwilioException
+from twilio.rest.resources import Calls
+from twilio.rest.resources.rollups import (
+    QuantileSketch, Rollup, elapsed,
+)
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+
+
+def rank_error(values, sketch, q):
+    ordered = sorted(values)
+    return abs(bisect.bisect(ordered, sketch.quantile(q)) /
+               float(len(ordered)) - q)
+
+
+def call(hour, minute, duration, status="completed", direction="inbound",
+         price="-0.01"):
+    return {
+        "sid": "CA%02d%02d" % (hour, minute),
+        "date_created": "Thu, 01 Jan 2015 %02d:%02d:00 +0000" % (hour,
+                                                                 minute),
+        "duration": str(duration),
+        "status": status,
+        "direction": direction,
+        "price": price,
+    }
+
+
+class QuantileSketchTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(0)
+        self.values = [rng.expovariate(1 / 60.0) for _ in range(50000)]
+
+    def test_small_is_exact(self):
+        sketch = QuantileSketch()
+        for value in range(1, 101):
+            sketch.add(value)
+        assert_equal(sketch.quantile(0.5), 50)
+        assert_equal(sketch.quantile(0), 1)
+        assert_equal(sketch.quantile(1), 100)
+        assert_equal(sketch.rank(51), 0.5)
+
+    def test_accuracy(self):
+        sketch = QuantileSketch()
+        for value in self.values:
+            sketch.add(value)
+        for q in (0.01, 0.25, 0.5, 0.9, 0.99):
+            assert_true(rank_error(self.values, sketch, q) < 0.01)
+        assert_equal(sketch.min, min(self.values))
+        assert_equal(sketch.max, max(self.values))
+
+    def test_bounded(self):
+        sketch = QuantileSketch(k=100)
+        for value in self.values:
+            sketch.add(value)
+        assert_true(sum(len(c) for c in sketch.compactors) < 400)
+        assert_equal(sketch.count, len(self.values))
+
+    def test_merge(self):
+        shards = [QuantileSketch() for _ in range(4)]
+        for i, value in enumerate(self.values):
+            shards[i % 4].add(value)
+        merged = shards[0]
+        for shard in shards[1:]:
+            merged.merge(shard)
+        assert_equal(merged.count, len(self.values))
+        for q in (0.5, 0.95):
+            assert_true(rank_error(self.values, merged, q) < 0.015)
+
+    def test_merge_empty(self):
+        sketch = QuantileSketch()
+        sketch.merge(QuantileSketch())
+        assert_equal(sketch.quantile(0.5), None)
+        empty = QuantileSketch()
+        sketch.add(1)
+        empty.merge(sketch)
+        assert_equal(empty.quantile(0.5), 1)
+
+    def test_round_trip(self):
+        sketch = QuantileSketch()
+        for value in self.values[:5000]:
+            sketch.add(value)
+        copy = QuantileSketch.from_dict(json.loads(json.dumps(
+            sketch.to_dict())))
+        assert_equal(copy.quantile(0.9), sketch.quantile(0.9))
+        copy.add(1.0)
+        assert_equal(copy.count, 5001)
+
+
+class RollupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.records = [
+            call(0, 5, 10), call(0, 30, 30), call(0, 59, 50),
+            call(1, 0, 100, status="busy"),
+            call(1, 10, 7, direction="outbound-api"),
+        ]
+
+    def rollup(self):
+        return Rollup({"duration": "duration", "cost": "price"},
+                      group_by=["status", "direction"])
+
+    def test_buckets(self):
+        results = self.rollup().consume(self.records).results()
+        assert_equal(sorted(results), [
+            (datetime(2015, 1, 1, 0), ("completed", "inbound")),
+            (datetime(2015, 1, 1, 1), ("busy", "inbound")),
+            (datetime(2015, 1, 1, 1), ("completed", "outbound-api")),
+        ])
+        first = results[(datetime(2015, 1, 1, 0), ("completed", "inbound"))]
+        assert_equal(first["duration"].count, 3)
+        assert_equal(first["duration"].sum, 90.0)
+        assert_equal(first["duration"].mean, 30.0)
+        assert_equal(first["duration"].quantile(0.5), 30.0)
+        assert_equal(first["duration"].max, 50.0)
+        assert_equal(first["cost"].sum, -0.03)
+
+    def test_instances(self):
+        calls = Calls(BASE_URI, AUTH)
+        calls.request = Mock()
+        calls.request.return_value = Mock(), {"calls": self.records}
+        rollup = Rollup({"duration": "duration"}, interval=86400)
+        rollup.consume(calls.iter())
+        summary = rollup.results()[(datetime(2015, 1, 1), ())]["duration"]
+        assert_equal(summary.count, 5)
+
+    def test_missing_values(self):
+        records = [dict(self.records[0], duration=None),
+                   dict(self.records[1], date_created=None)]
+        rollup = Rollup({"duration": "duration"}).consume(records)
+        assert_equal(rollup.skipped, 1)
+        assert_equal(list(rollup.results().values()), [{}])
+
+    def test_elapsed(self):
+        message = {"date_created": "Thu, 01 Jan 2015 00:00:00 +0000",
+                   "date_sent": "Thu, 01 Jan 2015 00:00:03 +0000"}
+        rollup = Rollup({"latency": elapsed("date_created", "date_sent")})
+        rollup.add(message)
+        summary = list(rollup.results().values())[0]["latency"]
+        assert_equal(summary.max, 3.0)
+
+    def test_merge_shards(self):
+        whole = self.rollup().consume(self.records)
+        first = self.rollup().consume(self.records[::2])
+        second = self.rollup().consume(self.records[1::2])
+        merged = first.merge(second).results()
+        for key, summaries in whole.results().items():
+            for name, summary in summaries.items():
+                assert_equal(merged[key][name].count, summary.count)
+                assert_equal(merged[key][name].sum, summary.sum)
+
+    def test_serialize_and_merge(self):
+        first = self.rollup().consume(self.records[:3])
+        data = json.loads(json.dumps(first.to_dict()))
+        restored = Rollup.from_dict(data)
+        second = self.rollup().consume(self.records[3:])
+        restored.merge(second)
+        assert_equal(len(restored.results()), 3)
+
+    @raises(TwilioException)
+    def test_merge_different_settings(self):
+        self.rollup().merge(Rollup({"duration": "duration"}))
+
+    @raises(TwilioException)
+    def test_newer_version(self):
+        data = self.rollup().to_dict()
+        data["version"] += 1
+        Rollup.from_dict(data)
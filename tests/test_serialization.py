@@ -0,0 +1,116 @@
+import json
+import pickle
+import unittest
+from datetime import datetime
+
+from mock import patch
+from nose.tools import assert_equal, assert_false, assert_true, raises
+from six import int2byte
+
+from twilio import TwilioException
+from twilio.rest.resources import Call, Calls, PhoneNumbers
+from twilio.rest.resources.imports import msgpack
+from twilio.rest.resources.serialization import (
+    MAGIC, RECORD_VERSION, dump_record, load_record,
+)
+from twilio.rest.resources.task_router.workers import Worker, Workers
+
+AUTH = ("AC123", "token")
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+TASKROUTER_URI = "https://taskrouter.twilio.com/v1/Workspaces/WS123"
+
+
+def fixture(path, key):
+    with open("tests/resources/" + path) as f:
+        return json.load(f)[key][0]
+
+
+class RecordTest(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = Calls(BASE_URI, AUTH)
+        self.call = self.calls.load_instance(
+            fixture("calls_list.json", "calls"))
+
+    def test_round_trip(self):
+        record = self.call.to_record(codec="json")
+        assert_true(record.startswith(MAGIC))
+        call = self.calls.from_record(record)
+        assert_equal(call, self.call)
+        assert_true(call.parent is self.calls)
+        assert_true(isinstance(call.date_created, datetime))
+
+    def test_no_credentials(self):
+        self.call.notifications
+        record = self.call.to_record(codec="json")
+        assert_false(b"token" in record)
+        fields = json.loads(record[5:].decode("utf-8"))[1]
+        assert_false("notifications" in fields)
+        assert_false("parent" in fields)
+        assert_false("auth" in fields)
+
+    def test_smaller_than_pickle(self):
+        record = self.call.to_record(codec="json")
+        assert_true(len(record) < len(pickle.dumps(self.call, 2)))
+
+    def test_pending_dates(self):
+        self.calls.lazy_dates = True
+        call = self.calls.load_instance(fixture("calls_list.json", "calls"))
+        copy = Call.from_record(call.to_record(codec="json"), self.calls)
+        assert_equal(copy.date_created, self.call.date_created)
+
+    def test_aware_dates(self):
+        workers = Workers(TASKROUTER_URI, AUTH, 30)
+        worker = workers.load_instance(
+            fixture("task_router/workers_list.json", "workers"))
+        copy = workers.from_record(worker.to_record(codec="json"))
+        assert_equal(copy.date_created, worker.date_created)
+        assert_equal(copy.date_created.tzinfo, worker.date_created.tzinfo)
+        assert_equal(copy.attributes.data, worker.attributes.data)
+
+    def test_compact(self):
+        workers = Workers(TASKROUTER_URI, AUTH, 30)
+        worker = workers.load_instance(
+            fixture("task_router/workers_list.json", "workers"))
+        workers.compact_instances = True
+        copy = workers.from_record(worker.to_record(codec="json"))
+        assert_true(isinstance(copy, Worker))
+        assert_equal(copy, worker)
+        assert_equal(Worker.from_record(copy.to_record(codec="json"),
+                                        workers), worker)
+
+    @raises(TwilioException)
+    def test_wrong_type(self):
+        numbers = PhoneNumbers(BASE_URI, AUTH)
+        numbers.from_record(self.call.to_record(codec="json"))
+
+    @raises(TwilioException)
+    def test_newer_version(self):
+        record = self.call.to_record(codec="json")
+        record = MAGIC + int2byte(RECORD_VERSION + 1) + record[4:]
+        self.calls.from_record(record)
+
+    @raises(TwilioException)
+    def test_not_a_record(self):
+        load_record(b"{}", Call, self.calls)
+
+    @raises(TwilioException)
+    def test_unknown_codec(self):
+        dump_record(self.call, codec="xml")
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_msgpack(self):
+        record = self.call.to_record()
+        assert_equal(record[4:5], b"m")
+        assert_true(len(record) < len(self.call.to_record(codec="json")))
+        assert_equal(self.calls.from_record(record), self.call)
+
+    @raises(TwilioException)
+    def test_msgpack_missing(self):
+        with patch("twilio.rest.resources.serialization.msgpack", None):
+            self.call.to_record(codec="msgpack")
+
+    def test_default_codec(self):
+        with patch("twilio.rest.resources.serialization.msgpack", None):
+            record = self.call.to_record()
+        assert_equal(record[4:5], b"j")
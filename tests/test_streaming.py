@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from nose.tools import assert_equal, assert_raises
+
+from twilio.exceptions import TwilioException
+from twilio.rest.resources.imports import json
+from twilio.rest.resources.streaming import StreamingPage
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def load_fixture(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class StreamingPageTest(unittest.TestCase):
+
+    def test_matches_json_loads(self):
+        body = load_fixture("tests/resources/calls_list.json")
+        expected = json.loads(body.decode('utf-8'))
+
+        for size in (13, 4096):
+            page = StreamingPage(chunked(body, size), key='calls')
+            assert_equal(list(page.records()), expected['calls'])
+            assert_equal(page.get('next_page_uri'), expected['next_page_uri'])
+            assert_equal(page.get('total'), 509)
+            self.assertTrue('calls' in page)
+
+    def test_yields_before_page_is_complete(self):
+        def chunks():
+            yield b'{"page": 0, "messages": [{"sid": "SM1"}, '
+            raise AssertionError("read past the first record")
+
+        page = StreamingPage(chunks(), key='messages')
+        assert_equal(next(page.records()), {'sid': 'SM1'})
+
+    def test_multibyte_characters_split_across_chunks(self):
+        body = json.dumps({
+            'messages': [{'body': u'h\xe9llo ☃'}],
+        }, ensure_ascii=False).encode('utf-8')
+
+        page = StreamingPage(chunked(body, 1), key='messages')
+        assert_equal(list(page.records()), [{'body': u'h\xe9llo ☃'}])
+
+    def test_numbers_split_across_chunks(self):
+        body = b'{"page_size": 1000, "calls": [12345, 6.5]}'
+        page = StreamingPage(chunked(body, 3), key='calls')
+        assert_equal(list(page.records()), [12345, 6.5])
+        assert_equal(page.get('page_size'), 1000)
+
+    def test_brackets_inside_strings(self):
+        body = b'{"calls": [{"a": "]}[{,\\"\\\\"}, {"b": []}], "x": "}"}'
+        page = StreamingPage(chunked(body, 2), key='calls')
+        assert_equal(list(page.records()),
+                     [{'a': ']}[{,"\\'}, {'b': []}])
+        assert_equal(page.get('x'), '}')
+
+    def test_empty_array(self):
+        page = StreamingPage([b'{"calls": [], "next_page_uri": null}'],
+                             key='calls')
+        assert_equal(list(page.records()), [])
+        self.assertTrue('calls' in page)
+
+    def test_key_missing(self):
+        page = StreamingPage([b'{}'], key='calls')
+        assert_equal(list(page.records()), [])
+        self.assertFalse('calls' in page)
+
+    def test_meta_key_after_records(self):
+        body = load_fixture("tests/resources/task_router/workers_list.json")
+        expected = json.loads(body.decode('utf-8'))
+
+        page = StreamingPage(chunked(body, 16), key='unknown')
+        assert_equal(list(page.records()), expected['workers'])
+        assert_equal(page.streamed, 'workers')
+
+    def test_meta_key_before_records(self):
+        body = b'{"meta": {"key": "workers"}, "workers": [{"sid": "WK1"}]}'
+        page = StreamingPage(chunked(body, 5))
+        assert_equal(list(page.records()), [{'sid': 'WK1'}])
+        self.assertFalse('workers' in page.fields)
+
+    def test_truncated_body(self):
+        page = StreamingPage([b'{"calls": [{"sid": "CA1"}, {"sid"'],
+                             key='calls')
+        records = page.records()
+        assert_equal(next(records), {'sid': 'CA1'})
+        assert_raises(ValueError, next, records)
+
+    def test_not_an_object(self):
+        page = StreamingPage([b'[1, 2]'], key='calls')
+        assert_raises(TwilioException, list, page.records())
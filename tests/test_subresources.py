@@ -0,0 +1,23 @@
+from nose.tools import assert_equal
+
+from twilio.rest.resources import InstanceResource
+from twilio.rest.resources.base import subresource_key
+from twilio.rest.resources import ip_messaging, monitor, pricing, trunking  # noqa
+from twilio.rest.resources.lookups import phone_numbers  # noqa
+
+
+def all_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        for c in all_subclasses(subclass):
+            yield c
+
+
+def test_subresource_keys_match_instances():
+    # Lazy subresources are looked up without building the list resource,
+    # so the key worked out from the class has to match the real one
+    for cls in set(all_subclasses(InstanceResource)):
+        for resource in cls.subresources:
+            instance = resource("https://api.twilio.com", ("AC123", "token"),
+                                None)
+            assert_equal(subresource_key(resource), instance.key)
@@ -1,5 +1,10 @@
 from __future__ import with_statement
-from mock import Mock
+import threading
+import time
+
+from mock import Mock, patch
+
+from twilio.rest.resources import Resource
 
 
 def create_mock_json(path):
@@ -7,3 +12,53 @@ def create_mock_json(path):
         resp = Mock()
         resp.content = f.read()
         return resp
+
+
+class FakeApi(object):
+    """
+    Stands in for :meth:`Resource.request` across threads. Each request is
+    noted in ``requests``, as :meth:`note` describes it, and answered by
+    :meth:`respond` after ``latency`` seconds.
+    """
+
+    def __init__(self, latency=0):
+        self.latency = latency
+        self.requests = []
+        self.in_flight = []
+        self.most_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, resource, method, uri, params=None, data=None,
+                 **kwargs):
+        with self.lock:
+            request = self.note(method, uri, params, data)
+            self.requests.append(request)
+            self.in_flight.append(request)
+            self.most_in_flight = max(self.most_in_flight,
+                                      len(self.in_flight))
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            return self.respond(method, uri, params, data)
+        finally:
+            with self.lock:
+                self.in_flight.remove(request)
+
+    def note(self, method, uri, params, data):
+        """ What to keep of a request, called with the lock held """
+        return uri
+
+    def respond(self, method, uri, params, data):
+        return Mock(), {}
+
+    def patch(self):
+        """ Return a patcher making every request through this fake """
+        return patch.object(Resource, "request", autospec=True,
+                            side_effect=self)
+
+    def install(self, test):
+        """ Patch requests for the rest of a test, and return self """
+        patcher = self.patch()
+        patcher.start()
+        test.addCleanup(patcher.stop)
+        return self
@@ -4,11 +4,13 @@ from six import binary_type
 
 try:
     # python 3
-    from urllib.parse import urlencode, urlparse, urljoin, urlunparse
+    from urllib.parse import (
+        quote_plus, urlencode, urlparse, urljoin, urlunparse,
+    )
 except ImportError:
     # python 2 backward compatibility
     # noinspection PyUnresolvedReferences
-    from urllib import urlencode
+    from urllib import quote_plus, urlencode
     # noinspection PyUnresolvedReferences
     from urlparse import urlparse, urljoin, urlunparse
 
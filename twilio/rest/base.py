@@ -31,9 +31,14 @@ def set_twilio_proxy(proxy_url, proxy_port):
 class TwilioClient(object):
     def __init__(self, account=None, token=None, base="https://api.twilio.com",
                  version="2010-04-01", timeout=UNSET_TIMEOUT,
-                 request_account=None):
+                 request_account=None, json_codec=None):
         """
         Create a Twilio API client.
+
+        :param json_codec: The json backend used to decode responses, one of
+            'json', 'simplejson', 'orjson' or 'ujson'. Like proxy settings,
+            this applies to every client in the process. Defaults to the
+            fastest backend installed.
         """
 
         # Get account credentials
@@ -55,6 +60,9 @@ Or, add your credentials to your shell environment. From the terminal, run
 and be sure to replace the values for the Account SID and auth token with the
 values from your Twilio Account at https://www.twilio.com/user/account.
 """)
+        if json_codec is not None:
+            Connection.set_json_codec(json_codec)
+
         self.base = base
         self.auth = (account, token)
         self.timeout = timeout
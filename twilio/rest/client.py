@@ -43,12 +43,13 @@ class TwilioRestClient(TwilioClient):
 
     def __init__(self, account=None, token=None, base="https://api.twilio.com",
                  version="2010-04-01", timeout=UNSET_TIMEOUT,
-                 request_account=None):
+                 request_account=None, json_codec=None):
         """
         Create a Twilio REST API client.
         """
         super(TwilioRestClient, self).__init__(account, token, base, version,
-                                               timeout, request_account)
+                                               timeout, request_account,
+                                               json_codec)
 
         version_uri = "%s/%s" % (base, version)
 
@@ -21,11 +21,13 @@ class TwilioIpMessagingClient(TwilioClient):
 
     def __init__(self, account=None, token=None,
                  base="https://ip-messaging.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None,
+                 json_codec=None):
 
         super(TwilioIpMessagingClient, self).__init__(account, token, base,
                                                       version, timeout,
-                                                      request_account)
+                                                      request_account,
+                                                      json_codec)
 
         self.version_uri = "%s/%s" % (base, version)
         self.services = Services(self.version_uri, self.auth, timeout)
@@ -20,11 +20,12 @@ class TwilioLookupsClient(TwilioClient):
 
     def __init__(self, account=None, token=None,
                  base="https://lookups.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None,
+                 json_codec=None):
 
         super(TwilioLookupsClient, self).__init__(account, token, base,
                                                   version, timeout,
-                                                  request_account)
+                                                  request_account, json_codec)
 
         self.version_uri = "%s/%s" % (base, version)
         self.phone_numbers = PhoneNumbers(self.version_uri, self.auth, timeout)
@@ -21,11 +21,12 @@ class TwilioMonitorClient(TwilioClient):
 
     def __init__(self, account=None, token=None,
                  base="https://monitor.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None,
+                 json_codec=None):
 
         super(TwilioMonitorClient, self).__init__(account, token, base,
                                                   version, timeout,
-                                                  request_account)
+                                                  request_account, json_codec)
 
         self.version_uri = "%s/%s" % (base, version)
         self.events = Events(self.version_uri, self.auth, timeout)
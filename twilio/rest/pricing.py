@@ -21,10 +21,11 @@ class TwilioPricingClient(TwilioClient):
 
     def __init__(self, account=None, token=None,
                  base="https://pricing.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None,
+                 json_codec=None):
         super(TwilioPricingClient, self).__init__(account, token, base,
                                                   version, timeout,
-                                                  request_account)
+                                                  request_account, json_codec)
 
         self.uri_base = "{}/{}".format(base, version)
 
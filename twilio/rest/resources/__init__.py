@@ -3,9 +3,9 @@ from .util import (
     convert_keys, normalize_dates, UNSET_TIMEOUT
 )
 from .base import (
-    Response, Resource, InstanceResource, ListResource,
+    Response, StreamingResponse, Resource, InstanceResource, ListResource,
     NextGenInstanceResource, NextGenListResource,
-    make_request, make_twilio_request
+    make_request, make_streaming_request, make_twilio_request
 )
 from .phone_numbers import (
     AvailablePhoneNumber, AvailablePhoneNumbers, PhoneNumber, PhoneNumbers
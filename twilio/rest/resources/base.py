@@ -1,6 +1,9 @@
+import base64
 import logging
 import os
 import platform
+import re
+from timeit import default_timer
 
 from six import (
     integer_types,
@@ -15,28 +18,128 @@ from ...compat import urlunparse
 from ... import __version__
 from ...exceptions import TwilioException
 from ..exceptions import TwilioRestException
+from .batch import get_many, instance_cache_key
+from .bulk import BulkJob
+from .coalescing import CoalescingWriter
+from .columns import batch_columns, columns_numpy
+from .compact import compact_class
 from .connection import Connection
+from .crawler import Crawler
+from .dedup import StableScan
 from .imports import parse_qs, httplib2, json
+from .interning import InternTable
+from .lazy_json import json_field
+from .paging import DEFAULT_PAGE_SIZE, Page, PagedSequence, PageSizer
+from .pipeline import Pipeline
+from .query import Query
+from .serialization import dump_record, load_record
+from .streaming import StreamingPage
 from .util import (
+    changed_fields,
+    encode_params,
     parse_iso_date,
     parse_rfc2822_date,
+    project,
+    record_type,
     transform_params,
     UNSET_TIMEOUT,
 )
 
 logger = logging.getLogger('twilio')
 
+# Maps a tuple of subresource classes to {key: class}
+_subresource_keys = {}
+_PAGE_SIZE = re.compile(r'([?&])PageSize=\d+')
+
+
+def _resize_page(url, page_size):
+    """
+    Ask for a smaller next page. Only pages found with a PageToken cursor
+    can be resized without changing which records they hold.
+    """
+    if 'PageToken=' not in url:
+        return url
+    return _PAGE_SIZE.sub(r'\g<1>PageSize=%d' % page_size, url)
+
+
+def _cursor(next_page_uri):
+    """ The cursor of the page after this one: its query string """
+    if not next_page_uri:
+        return None
+    return urlparse(next_page_uri).query or None
+
+
+def subresource_key(resource):
+    """
+    Return the attribute name a subresource list class is attached under,
+    without instantiating it
+    """
+    key = getattr(resource, 'key', None)
+    if key is None:
+        key = resource.name.lower()
+    return key
+
 
 class Response(object):
     """
     Take a httplib2 response and turn it into a requests response
+
+    The body is kept as the bytes that were read off the socket, and only
+    decoded into :attr:`content` text when somebody asks for it.
     """
     def __init__(self, httplib_resp, content, url):
-        self.content = content
+        self.body = content
         self.cached = False
         self.status_code = int(httplib_resp.status)
         self.ok = self.status_code < 400
         self.url = url
+        self._content = None
+
+    @property
+    def content(self):
+        if self._content is None:
+            if isinstance(self.body, binary_type):
+                self._content = self.body.decode('utf-8')
+            else:
+                self._content = self.body
+        return self._content
+
+
+class StreamingResponse(object):
+    """
+    An HTTP response whose body has not been read yet, so it can be consumed
+    incrementally with :meth:`iter_content`
+    """
+    def __init__(self, connection, httplib_resp, url):
+        self.cached = False
+        self.status_code = int(httplib_resp.status)
+        self.ok = self.status_code < 400
+        self.url = url
+        self._connection = connection
+        self._resp = httplib_resp
+        self._content = None
+
+    def iter_content(self, chunk_size=8192):
+        """ Yield the response body as it arrives off the socket """
+        try:
+            while True:
+                chunk = self._resp.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            self.close()
+
+    @property
+    def content(self):
+        """ Read the whole response body, used for error responses """
+        if self._content is None:
+            body = b''.join(self.iter_content())
+            self._content = body.decode('utf-8')
+        return self._content
+
+    def close(self):
+        self._connection.close()
 
 
 def get_cert_file():
@@ -85,27 +188,8 @@ def make_request(method, url, params=None, data=None, headers=None,
     if auth is not None:
         http.add_credentials(auth[0], auth[1])
 
-    def encode_atom(atom):
-            if isinstance(atom, (integer_types, binary_type)):
-                return atom
-            elif isinstance(atom, string_types):
-                return atom.encode('utf-8')
-            else:
-                raise ValueError('list elements should be an integer, '
-                                 'binary, or string')
-
     if data is not None:
-        udata = {}
-        for k, v in iteritems(data):
-            key = k.encode('utf-8')
-            if isinstance(v, (list, tuple, set)):
-                udata[key] = [encode_atom(x) for x in v]
-            elif isinstance(v, (integer_types, binary_type, string_types)):
-                udata[key] = encode_atom(v)
-            else:
-                raise ValueError('data should be an integer, '
-                                 'binary, or string, or sequence ')
-        data = urlencode(udata, doseq=True)
+        data = encode_params(data)
 
     if params is not None:
         enc_params = urlencode(params, doseq=True)
@@ -117,7 +201,73 @@ def make_request(method, url, params=None, data=None, headers=None,
     resp, content = http.request(url, method, headers=headers, body=data)
 
     # Format httplib2 request as requests object
-    return Response(resp, content.decode('utf-8'), url)
+    return Response(resp, content, url)
+
+
+def make_streaming_request(method, url, params=None, headers=None, auth=None,
+                           timeout=None):
+    """Sends an HTTP request without reading the response body
+
+    :param str method: The HTTP method to use
+    :param str url: The URL to request
+    :param dict params: Query parameters to append to the URL
+    :param dict headers: HTTP Headers to send with the request
+    :param tuple auth: Username and password for HTTP basic authentication
+    :param float timeout: Socket/Read timeout for the request
+
+    :return: An http response with an unread body
+    :rtype: A :class:`StreamingResponse` object
+    """
+    if params is not None:
+        enc_params = urlencode(params, doseq=True)
+        if urlparse(url).query:
+            url = '%s&%s' % (url, enc_params)
+        else:
+            url = '%s?%s' % (url, enc_params)
+
+    parsed = urlparse(url)
+    if parsed.scheme == 'https':
+        connection = httplib2.HTTPSConnectionWithTimeout(
+            parsed.hostname,
+            parsed.port,
+            timeout=timeout,
+            proxy_info=Connection.proxy_info(),
+            ca_certs=get_cert_file(),
+        )
+    else:
+        connection = httplib2.HTTPConnectionWithTimeout(
+            parsed.hostname,
+            parsed.port,
+            timeout=timeout,
+            proxy_info=Connection.proxy_info(),
+        )
+
+    headers = dict(headers or {})
+    if auth is not None:
+        # httplib2 only sends credentials after a 401 challenge, which we
+        # can't replay here, so authenticate up front
+        credentials = ('%s:%s' % auth).encode('utf-8')
+        headers['Authorization'] = 'Basic %s' % (
+            base64.b64encode(credentials).decode('ascii')
+        )
+
+    path = parsed.path or '/'
+    if parsed.query:
+        path = '%s?%s' % (path, parsed.query)
+
+    connection.request(method, path, headers=headers)
+    return StreamingResponse(connection, connection.getresponse(), url)
+
+
+def response_body(resp):
+    """
+    Return the undecoded body of a response, falling back to its text
+    content for responses that don't keep the raw bytes around
+    """
+    body = getattr(resp, 'body', None)
+    if isinstance(body, binary_type):
+        return body
+    return resp.content
 
 
 def make_twilio_request(method, uri, **kwargs):
@@ -149,7 +299,10 @@ def make_twilio_request(method, uri, **kwargs):
     if kwargs.pop('use_json_extension', False):
         uri += ".json"
 
-    resp = make_request(method, uri, **kwargs)
+    if kwargs.pop('stream', False):
+        resp = make_streaming_request(method, uri, **kwargs)
+    else:
+        resp = make_request(method, uri, **kwargs)
 
     if not resp.ok:
         try:
@@ -199,12 +352,32 @@ class Resource(object):
         kwargs['use_json_extension'] = self.use_json_extension
         resp = make_twilio_request(method, uri, auth=self.auth, **kwargs)
 
-        logger.debug(resp.content)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(resp.content)
 
         if method == "DELETE":
             return resp, {}
         else:
-            return resp, json.loads(resp.content)
+            return resp, Connection.json_codec().loads(response_body(resp))
+
+    def request_stream(self, method, uri, key=None, **kwargs):
+        """
+        Send an HTTP request to the resource, decoding the response as it
+        arrives.
+
+        :param str key: The name of the array holding the records
+        :return: the response and a
+            :class:`~twilio.rest.resources.streaming.StreamingPage`
+        :raises: a :exc:`~twilio.TwilioRestException`
+        """
+        if 'timeout' not in kwargs and self.timeout is not UNSET_TIMEOUT:
+            kwargs['timeout'] = self.timeout
+
+        kwargs['use_json_extension'] = self.use_json_extension
+        resp = make_twilio_request(method, uri, auth=self.auth, stream=True,
+                                   **kwargs)
+
+        return resp, StreamingPage(resp.iter_content(), key=key)
 
     @property
     def uri(self):
@@ -220,9 +393,16 @@ class InstanceResource(Resource):
         would be a :class:`~twilio.rest.resources.Calls` object.
     :type parent: :class:`~twilio.rest.resources.ListResource`
     :param str sid: The 34-character unique identifier for this instance
+
+    .. attribute:: json_fields
+
+        Names of fields holding a JSON document. They are wrapped in a
+        :class:`~twilio.rest.resources.lazy_json.JsonString`, which is only
+        decoded when it is used.
     """
 
     subresources = []
+    json_fields = ()
     id_key = "sid"
     use_json_extension = True
 
@@ -243,16 +423,49 @@ class InstanceResource(Resource):
         if "uri" in entries.keys():
             del entries["uri"]
 
-        for key in entries.keys():
-            if (key.startswith("date_") and
-                    isinstance(entries[key], string_types)):
-                entries[key] = self._parse_date(entries[key])
+        for key in self.json_fields:
+            if key in entries:
+                entries[key] = json_field(entries[key])
+
+        # Dates still waiting to be parsed, when copying another instance
+        pending = {}
+        if "_pending_dates" in entries:
+            entries = dict(entries)
+            pending.update(entries.pop("_pending_dates"))
+        lazy = getattr(self.parent, 'lazy_dates', False)
+
+        for key in [k for k in entries if k.startswith("date_")]:
+            if isinstance(entries[key], string_types):
+                if lazy:
+                    pending[key] = entries.pop(key)
+                else:
+                    entries[key] = self._parse_date(entries[key])
+
+        attributes = self._attributes()
+        current = attributes.get("_pending_dates")
+        if current:
+            # Values loaded now replace dates that were never parsed
+            for key in entries:
+                current.pop(key, None)
+        if pending:
+            for key in pending:
+                attributes.pop(key, None)
+            if current is None:
+                attributes["_pending_dates"] = pending
+            else:
+                current.update(pending)
+
+        attributes.update(entries)
 
-        self.__dict__.update(entries)
+    def _attributes(self):
+        """ The mapping holding the fields loaded into this instance """
+        return self.__dict__
 
     def load_subresources(self):
         """
         Load all subresources
+
+        This is optional: subresources are also created on first access.
         """
         for resource in self.subresources:
             list_resource = resource(
@@ -260,14 +473,96 @@ class InstanceResource(Resource):
                 self.parent.auth,
                 self.parent.timeout
             )
-            self.__dict__[list_resource.key] = list_resource
+            self._attributes()[list_resource.key] = list_resource
+
+    def _subresource_keys(self):
+        resources = tuple(self.subresources)
+        try:
+            return _subresource_keys[resources]
+        except KeyError:
+            keys = dict((subresource_key(r), r) for r in resources)
+            _subresource_keys[resources] = keys
+            return keys
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, which is how subresources get
+        # built and lazy dates parsed the first time they are used rather
+        # than for every instance
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        attributes = self._attributes()
+        pending = attributes.get("_pending_dates")
+        if pending and name in pending:
+            value = attributes[name] = self._parse_date(pending.pop(name))
+            return value
+
+        resource = self._subresource_keys().get(name)
+        if resource is None:
+            raise AttributeError("%r object has no attribute %r" % (
+                self.__class__.__name__, name))
+
+        list_resource = resource(
+            self.uri,
+            self.parent.auth,
+            self.parent.timeout
+        )
+        attributes[name] = list_resource
+        return list_resource
+
+    def _state(self):
+        """
+        The instance's __dict__, minus any subresources built so far and with
+        lazy dates parsed
+        """
+        keys = self._subresource_keys()
+        state = dict((k, v) for k, v in iteritems(self.__dict__)
+                     if k not in keys)
+        for key, value in iteritems(state.pop("_pending_dates", {})):
+            state[key] = self._parse_date(value)
+        return state
+
+    def __eq__(self, other):
+        return (isinstance(other, self.__class__) and
+                self._state() == other._state())
+
+    def __hash__(self):
+        return hash(frozenset(self._state()))
+
+    def to_record(self, codec=None):
+        """
+        Return the data fields of this instance as a compact, versioned
+        record, for caching or passing to another process. The parent,
+        credentials and subresources are not included.
+
+        :param str codec: ``'msgpack'`` or ``'json'``. Defaults to msgpack
+            when it is installed.
+        :rtype: bytes
+        """
+        return dump_record(self, codec)
+
+    @classmethod
+    def from_record(cls, record, parent):
+        """
+        Rebuild an instance from a record made by :meth:`to_record`
+
+        :param bytes record: The record
+        :param parent: The list resource the instance belongs to, such as
+            ``client.calls``
+        """
+        return load_record(record, cls, parent)
 
     def update_instance(self, **kwargs):
         """ Make a POST request to the API to update an object's properties
 
+        Pass ``if_changed=True`` to skip the request when the instance
+        already has these values.
+
         :return: None, this is purely side effecting
         :raises: a :class:`~twilio.rest.RestException` on failure
         """
+        if kwargs.get('if_changed') is True:
+            kwargs['if_changed'] = self
         a = self.parent.update(self.name, **kwargs)
         self.load(a.__dict__)
 
@@ -298,10 +593,87 @@ class NextGenInstanceResource(InstanceResource):
 
 
 class ListResource(Resource):
+    """ The object representation of a list of resources
+
+    .. attribute:: lazy_dates
+
+        When True, ``date_*`` fields of the instances this resource loads
+        are kept as strings and only parsed the first time they are read.
+        Defaults to False.
+
+    .. attribute:: intern_strings
+
+        When True, the keys and oft-repeated values of records returned by
+        :meth:`iter` and :meth:`list` share a single string object, which
+        saves memory when holding on to many records. May also be an
+        :class:`~twilio.rest.resources.interning.InternTable` to share or
+        tune the table. Defaults to False.
+
+    .. attribute:: compact_instances
+
+        When True, instances are built from
+        :func:`~twilio.rest.resources.compact.compact_class`, which keeps
+        their documented fields in ``__slots__`` and shares their connection
+        settings. Use this to hold many instances in memory. Defaults to
+        False.
+
+    .. attribute:: max_page_size
+
+        The largest page the API returns, used to size the pages of
+        :meth:`iter` when it is given a ``limit`` or tunes them itself.
+        Defaults to 1000.
+
+    .. attribute:: page_sizer
+
+        The :class:`~twilio.rest.resources.paging.PageSizer` of the last
+        ``iter(adaptive=True)``. Each scan tunes its own sizer, starting
+        from the ``best_size`` of the one before.
+
+    .. attribute:: query_filters
+
+        The filters the endpoint supports, used by :meth:`where`. Maps each
+        field to its operators, and each operator to the keyword naming the
+        filter, as taken by :func:`~twilio.rest.resources.util.convert_keys`
+
+    .. attribute:: query_aliases
+
+        Shorter names :meth:`where` accepts for fields, such as ``started``
+        for ``start_time``
+
+    .. attribute:: stable_scan
+
+        The :class:`~twilio.rest.resources.dedup.StableScan` of the last
+        ``iter(stable=True)``, whose ``duplicates`` and ``newer`` count the
+        records it dropped
+
+    .. attribute:: instance_cache
+
+        A cache read by :meth:`get_many` before going to the API, and
+        filled with what it fetches. Any object with ``get(key)`` and
+        ``set(key, value)`` methods, such as a memcached client, holding
+        the records of :meth:`InstanceResource.to_record`. Defaults to
+        None.
+
+    .. attribute:: snapshot
+
+        The records read by :meth:`load_snapshot`, as a dict mapping each
+        sid to the dict the API returned, which ``update(if_changed=True)``
+        compares with. Defaults to None.
+    """
 
     name = "Resources"
     instance = InstanceResource
     use_json_extension = True
+    lazy_dates = False
+    intern_strings = False
+    compact_instances = False
+    max_page_size = 1000
+    page_sizer = None
+    stable_scan = None
+    query_filters = {}
+    query_aliases = {}
+    instance_cache = None
+    snapshot = None
 
     def __init__(self, *args, **kwargs):
         super(ListResource, self).__init__(*args, **kwargs)
@@ -327,6 +699,83 @@ class ListResource(Resource):
         """
         return self.get_instance(sid)
 
+    def get_many(self, sids, concurrency=8):
+        """
+        Get the instance resources with the given sids, several at a time.
+
+        Each sid is fetched once however often it is given, from
+        :attr:`instance_cache` if it holds it. A sid which can't be fetched
+        is reported in the result rather than stopping the others.
+
+        .. code-block:: python
+
+            fetched = client.messages.get_many(flagged, concurrency=16)
+            for message in fetched.instances():
+                print message.body
+
+        :param sids: The sids to get
+        :param int concurrency: The most requests in flight at once
+        :rtype: :class:`~twilio.rest.resources.batch.BatchResult`
+        """
+        return get_many(self, sids, concurrency)
+
+    def bulk_create(self, items, concurrency=8, rate=None, journal=None,
+                    key=None, retry_unknown=False):
+        """
+        Create many instance resources, several at a time, yielding what
+        happened to each as it finishes.
+
+        .. code-block:: python
+
+            job = client.messages.bulk_create(
+                ({'to': to, 'from_': SENDER, 'body': BODY} for to in numbers),
+                rate=10, journal='campaign.journal',
+                key=lambda kwargs: kwargs['to'])
+            for outcome in job:
+                print outcome.key, outcome.ok
+
+        :param items: The keyword arguments of each ``create``
+        :param int concurrency: The most requests in flight at once
+        :param float rate: The most requests started per second
+        :param journal: The path of a
+            :class:`~twilio.rest.resources.bulk.Journal` logging each
+            outcome, so that running the job again skips what it did
+        :param key: A function naming each item in the journal, by default
+            its position in ``items``
+        :param bool retry_unknown: Send items again whose request was sent
+            in an earlier run without an answer
+        :rtype: :class:`~twilio.rest.resources.bulk.BulkJob`
+        """
+        return BulkJob(self, 'create', items, concurrency, rate, journal, key,
+                       retry_unknown)
+
+    def bulk_update(self, items, concurrency=8, rate=None, journal=None,
+                    key=None, retry_unknown=False):
+        """
+        Update many instance resources, several at a time, as
+        :meth:`bulk_create` does.
+
+        :param items: ``(sid, kwargs)`` pairs, each passed to ``update``.
+            Each item is named in the journal by its sid, unless ``key``
+            is given.
+        :rtype: :class:`~twilio.rest.resources.bulk.BulkJob`
+        """
+        return BulkJob(self, 'update', items, concurrency, rate, journal, key,
+                       retry_unknown)
+
+    def bulk_delete(self, sids, concurrency=8, rate=None, journal=None,
+                    key=None, retry_unknown=False):
+        """
+        Delete many instance resources, several at a time, as
+        :meth:`bulk_create` does.
+
+        :param sids: The sids to delete, which name them in the journal
+            unless ``key`` is given
+        :rtype: :class:`~twilio.rest.resources.bulk.BulkJob`
+        """
+        return BulkJob(self, 'delete', sids, concurrency, rate, journal, key,
+                       retry_unknown)
+
     def get_instance(self, sid):
         """Request the specified instance resource"""
         uri = "%s/%s" % (self.uri, sid)
@@ -343,9 +792,13 @@ class ListResource(Resource):
         :param dict params: List of URL parameters to be included in request
         :param int page: The page of results to retrieve (most recent at 0)
         :param int page_size: The number of results to be returned.
+        :param raw: Return records as plain dicts, see :meth:`iter`
+        :param fields: Only keep these fields of each record
 
         :returns: -- the list of resources
         """
+        load = self.record_loader(params.pop('raw', False),
+                                  params.pop('fields', None))
         params = transform_params(params)
 
         resp, page = self.request("GET", self.uri, params=params)
@@ -353,7 +806,7 @@ class ListResource(Resource):
         if self.key not in page:
             raise TwilioException("Key %s not present in response" % self.key)
 
-        return [self.load_instance(ir) for ir in page[self.key]]
+        return [load(ir) for ir in page[self.key]]
 
     def create_instance(self, body):
         """
@@ -386,12 +839,98 @@ class ListResource(Resource):
 
         sid: string -- String identifier for the list resource
         body: dictionary -- Dict of items to POST
+
+        With ``if_changed`` in body, the POST is skipped when the instance
+        already has the values, and the instance returned has a ``changed``
+        attribute listing the fields which differed. ``if_changed`` may be
+        the instance or its record, or True to look it up in
+        :attr:`snapshot`, then :attr:`instance_cache`, and then the API.
         """
+        known = body.get('if_changed')
+        if known is not None:
+            body = dict(body)
+            del body['if_changed']
+        if known:
+            known = self._known_state(sid, known)
+            changed = changed_fields(known, body)
+            if not changed:
+                instance = self._state_instance(known)
+                instance.changed = []
+                return instance
+
         uri = "%s/%s" % (self.uri, sid)
         resp, entry = self.request("POST", uri, data=transform_params(body))
-        return self.load_instance(entry)
+        if self.snapshot is not None and sid in self.snapshot:
+            # Loading the instance changes the entry, so keep the raw record
+            self.snapshot[sid] = dict(entry)
+        instance = self.load_instance(entry)
+        if self.instance_cache is not None:
+            self.instance_cache.set(instance_cache_key(self, sid),
+                                    instance.to_record())
+        if known:
+            instance.changed = changed
+        return instance
+
+    def _known_state(self, sid, known):
+        if known is not True:
+            return known
+        if self.snapshot is not None and sid in self.snapshot:
+            return self.snapshot[sid]
+        if self.instance_cache is not None:
+            record = self.instance_cache.get(instance_cache_key(self, sid))
+            if record is not None:
+                return self.from_record(record)
+        return self.get_instance(sid)
+
+    def _state_instance(self, known):
+        if isinstance(known, InstanceResource):
+            known = known._state()
+        # Loading an instance changes the dict it is given
+        return self.load_instance(dict(known))
+
+    def coalescing_writer(self, window=0.25, concurrency=4):
+        """
+        Return a writer which merges updates to the same instance made
+        within ``window`` seconds into one POST, the last value of each
+        field winning, for instances which change several times a second.
+
+        .. code-block:: python
 
-    def iter(self, **kwargs):
+            with workspace.workers.coalescing_writer(window=0.5) as writer:
+                writer.update(worker_sid, activity_sid=busy)
+                writer.update(worker_sid, activity_sid=idle)
+
+        :param float window: The seconds to wait for more updates to a sid
+        :param int concurrency: The most POSTs in flight at once
+        :rtype: :class:`~twilio.rest.resources.coalescing.CoalescingWriter`
+        """
+        return CoalescingWriter(self, window, concurrency)
+
+    def load_snapshot(self, **kwargs):
+        """
+        Read every record of the list with one scan, and keep them in
+        :attr:`snapshot` for ``update(if_changed=True)`` to compare with,
+        so that updating many instances which mostly haven't changed costs
+        a scan rather than a POST each.
+
+        .. code-block:: python
+
+            client.phone_numbers.load_snapshot()
+            for sid, url in voice_urls.items():
+                number = client.phone_numbers.update(sid, voice_url=url,
+                                                     if_changed=True)
+                print sid, number.changed
+
+        :param kwargs: Filters of the scan, as taken by :meth:`iter`
+        :returns: The snapshot
+        """
+        id_key = self.instance.id_key
+        self.snapshot = dict((record[id_key], record)
+                             for record in self.iter(raw=True, **kwargs))
+        return self.snapshot
+
+    def iter(self, stream=False, raw=False, fields=None, limit=None,
+             adaptive=False, resume_from=None, stable=False, **kwargs):
         """ Return all instance resources using an iterator
 
         This will fetch a page of resources from the API and yield them in
@@ -407,30 +946,402 @@ class ListResource(Resource):
 
             for message in client.messages:
                 print message.sid
+
+        :param bool stream: Decode each page as it comes off the socket,
+            yielding records before the page has finished downloading and
+            only holding one record in memory at a time.
+        :param raw: Yield each record as the plain dict decoded from the
+            response instead of an :class:`InstanceResource`. This skips date
+            parsing and subresource setup entirely. May also be a callable
+            which builds each record from that dict.
+        :param fields: Only keep these fields of each record, dropping the
+            rest right after the record is decoded.
+        :param int limit: Stop after this many records. Pages are sized to
+            fit the limit, and no request is made once it has been reached.
+        :param adaptive: Tune the page size during the scan to fetch the
+            most records per second, unless ``page_size`` is given. May be
+            a :class:`~twilio.rest.resources.paging.PageSizer`; otherwise
+            :attr:`page_sizer` is set to a new one, which holds the chosen
+            size.
+        :param str resume_from: The
+            :attr:`~twilio.rest.resources.paging.Page.cursor` of a page from
+            an earlier scan, to carry on from the page after it
+        :param stable: Skip records created after the scan started, and
+            records already yielded, which offset based pages repeat when
+            records arrive during the scan. May be a
+            :class:`~twilio.rest.resources.dedup.StableScan`; otherwise
+            :attr:`stable_scan` is set to a new one, which counts what was
+            dropped.
         """
+        load = self.record_loader(raw, fields)
+        scan = self._stable_scan(stable, parse_rfc2822_date)
+        sizer = self._page_sizer(adaptive, kwargs)
+        page_size = self._first_page_size(limit, sizer, kwargs)
+        if page_size == 0:
+            return
         params = transform_params(kwargs)
+        if resume_from:
+            params.update(parse_qs(resume_from))
+        remaining = limit
+        id_key = self.instance.id_key
+
+        while True:
+            started = default_timer()
+            busy = 0.0
+            count = 0
+            if stream:
+                resp, page = self.request_stream("GET", self.uri,
+                                                 key=self.key, params=params)
+                records = page.records()
+            else:
+                resp, page = self.request("GET", self.uri, params=params)
+                records = page.get(self.key, ())
+
+            for ir in records:
+                if scan is not None and not scan.accept(ir, id_key):
+                    continue
+                record = load(ir)
+                count += 1
+                busy += default_timer() - started
+                yield record
+                started = default_timer()
+                if remaining is not None:
+                    remaining -= 1
+                    if not remaining:
+                        if stream:
+                            resp.close()
+                        return
+            busy += default_timer() - started
+
+            if self.key not in page:
+                return
+
+            next_page_uri = page.get('next_page_uri', '')
+            if not next_page_uri:
+                return
+
+            o = urlparse(next_page_uri)
+            params.update(parse_qs(o.query))
+            # Pages after a cursor can be resized without moving the offset
+            if 'PageToken' in params or 'AfterSid' in params:
+                size = self._next_page_size(page_size, sizer, remaining,
+                                            count, busy)
+                if size is not None:
+                    params['PageSize'] = [str(size)]
+
+    def iter_pages(self, raw=False, fields=None, resume_from=None,
+                   **kwargs):
+        """
+        Return all instance resources a page at a time, using an iterator.
+
+        Each :class:`~twilio.rest.resources.paging.Page` has a ``cursor``
+        which can be saved, and later passed back as ``resume_from`` to
+        restart a long scan from the page after it.
+
+        .. code-block:: python
+
+            for page in client.calls.iter_pages(resume_from=checkpoint):
+                export(page.records)
+                checkpoint = page.cursor
+
+        :param raw: Return plain dicts, see :meth:`iter`
+        :param fields: Only keep these fields of each record
+        :param str resume_from: A cursor to carry on from
+        """
+        load = self.record_loader(raw, fields)
+        params = transform_params(kwargs)
+        if resume_from:
+            params.update(parse_qs(resume_from))
 
         while True:
             resp, page = self.request("GET", self.uri, params=params)
+            if self.key not in page:
+                return
+
+            records = [load(ir) for ir in page[self.key]]
+            cursor = _cursor(page.get('next_page_uri'))
+            meta = dict((k, v) for k, v in iteritems(page) if k != self.key)
+            yield Page(records, cursor, meta)
+
+            if cursor is None:
+                return
+            params.update(parse_qs(cursor))
+
+    def sequence(self, raw=False, fields=None, page_size=DEFAULT_PAGE_SIZE,
+                 **kwargs):
+        """
+        Return every instance resource as a lazy
+        :class:`~twilio.rest.resources.paging.PagedSequence`, which supports
+        ``len()``, indexing, slicing and sampling while fetching only the
+        pages it needs.
 
+        .. code-block:: python
+
+            calls = client.calls.sequence(status='completed')
+            print len(calls), calls[-1].sid
+            failed = calls.estimate(lambda call: call.duration == '0')
+
+        :param raw: Return plain dicts, see :meth:`iter`
+        :param fields: Only keep these fields of each record
+        :param int page_size: The size of the pages to fetch
+        """
+        load = self.record_loader(raw, fields)
+        params = transform_params(kwargs)
+
+        def fetch(number, size):
+            page_params = dict(params, Page=number, PageSize=size)
+            resp, page = self.request("GET", self.uri, params=page_params)
             if self.key not in page:
-                raise StopIteration()
+                raise TwilioException(
+                    "Key %s not present in response" % self.key)
+            return [load(ir) for ir in page[self.key]], page
 
-            for ir in page[self.key]:
-                yield self.load_instance(ir)
+        return PagedSequence(fetch, page_size)
 
-            if not page.get('next_page_uri', ''):
-                raise StopIteration()
+    def iter_columns(self, fields, batch=10000, numpy=None, types=None,
+                     **kwargs):
+        """
+        Return the given fields of all instance resources as batches of
+        columns, using an iterator. No object is built per record, and
+        numbers and dates are converted a column at a time.
 
-            o = urlparse(page['next_page_uri'])
-            params.update(parse_qs(o.query))
+        Each batch is a dict mapping each field to a column of up to batch
+        values. Numeric fields, such as ``price`` and ``duration``, become
+        floats with NaN for missing values, and date fields become UTC
+        ``datetime64[s]`` with numpy, or seconds since the epoch without.
+
+        .. code-block:: python
+
+            total = 0.0
+            for columns in client.calls.iter_columns(['price', 'duration']):
+                total += numpy.nansum(columns['price'])
+
+        :param fields: The fields to keep, as named by the API, so ``from``
+            rather than ``from_``
+        :param int batch: The largest number of records in a batch
+        :param numpy: Return numpy arrays. None to use numpy when it is
+            installed, otherwise ``array('d')`` columns for numbers and
+            dates, and lists for the rest
+        :param dict types: Maps fields to ``'number'``, ``'date'`` or
+            ``'str'``, for those the default
+            :func:`~twilio.rest.resources.columns.column_type` gets wrong
+        :param kwargs: Filters, and ``resume_from``, as taken by
+            :meth:`iter_pages`
+        """
+        np = columns_numpy(numpy)
+        pages = self.iter_pages(raw=True, **kwargs)
+        return batch_columns(pages, fields, batch, types, np)
+
+    def crawl(self, spec, concurrency=8, max_depth=None, timeout=None):
+        """
+        Return a :class:`~twilio.rest.resources.crawler.Crawler` yielding
+        ``(path, record)`` for every record of this list and of the
+        subresources named in spec, fetching sibling lists concurrently.
+
+        .. code-block:: python
+
+            spec = {'channels': {'members': None, 'messages': None}}
+            for path, record in client.services.crawl(spec):
+                print path
+
+        :param spec: The subresources to expand, as a dict mapping each
+            subresource key to the spec of its own subresources, or None
+        :param int concurrency: The most lists fetched at once
+        :param int max_depth: The most levels of subresources to expand
+        :param float timeout: Stop fetching pages after this many seconds
+        """
+        return Crawler(self, spec, concurrency=concurrency,
+                       max_depth=max_depth, timeout=timeout)
+
+    def pipeline(self, buffer=100, **kwargs):
+        """
+        Return a :class:`~twilio.rest.resources.pipeline.Pipeline` reading
+        :meth:`iter` in a background thread, to add stages to.
+
+        .. code-block:: python
+
+            pipeline = (client.recordings.pipeline()
+                        .parallel_map(fetch_transcription, workers=8)
+                        .batch(100))
+            pipeline.run(write_rows)
+
+        :param int buffer: The largest number of items waiting between two
+            stages. Pages stop being fetched while the first stage has this
+            many records waiting.
+        :param kwargs: The arguments of :meth:`iter`
+        """
+        return Pipeline(self.iter(**kwargs), name='iter %s' % self.name,
+                        buffer=buffer)
+
+    def where(self, **predicates):
+        """
+        Return a :class:`~twilio.rest.resources.query.Query` for the
+        instance resources matching every predicate. Predicates the API can
+        filter on are sent with the request; the rest are checked on each
+        record as it arrives.
+
+        .. code-block:: python
+
+            query = client.calls.where(status='completed',
+                                       started__gte=date(2015, 1, 1))
+            for call in query:
+                print call.sid
+
+        :param predicates: Field names, optionally followed by ``__`` and
+            an operator: ``eq``, ``ne``, ``lt``, ``lte``, ``gt``, ``gte``,
+            ``in`` or ``contains``
+        """
+        return Query(self, ListResource.iter,
+                     parse_rfc2822_date).where(**predicates)
+
+    def _page_sizer(self, adaptive, kwargs):
+        """
+        Return the PageSizer for an iteration, or None if it has a fixed
+        page size
+        """
+        if not adaptive or kwargs.get('page_size'):
+            return None
+        if isinstance(adaptive, PageSizer):
+            adaptive.reset()
+            return adaptive
+        # A sizer per scan, so scans running at once don't reset each other
+        last = self.page_sizer
+        self.page_sizer = PageSizer(
+            last.best_size if last is not None else DEFAULT_PAGE_SIZE,
+            max_page_size=self.max_page_size)
+        return self.page_sizer
+
+    def _stable_scan(self, stable, parse_date):
+        """ Return the started StableScan for an iteration, or None """
+        if not stable:
+            return None
+        if isinstance(stable, StableScan):
+            scan = stable
+        else:
+            scan = self.stable_scan = StableScan()
+        scan.start(parse_date)
+        return scan
+
+    def _first_page_size(self, limit, sizer, kwargs):
+        """
+        Set the page size of the first request, to the smallest of the limit
+        and the requested, tuned or largest page size.
+
+        :returns: The page size, or None to leave it to the API
+        """
+        if sizer is not None:
+            kwargs['page_size'] = sizer.page_size
+        if limit is None:
+            return kwargs.get('page_size')
+        page_size = max(min(limit, kwargs.get('page_size') or
+                            self.max_page_size), 0)
+        if page_size:
+            kwargs['page_size'] = page_size
+        return page_size
+
+    def _next_page_size(self, page_size, sizer, remaining, count, seconds):
+        """
+        Return the size to ask for with the next page, or None to keep the
+        size the API chose. Only call this when the size can be sent, as
+        the sizer expects the next page to be that size.
+        """
+        size = None
+        if sizer is not None:
+            size = sizer.record(count, seconds)
+        if remaining is not None and remaining < (size or page_size):
+            size = remaining
+        return size
+
+    def _instance_class(self):
+        if self.compact_instances:
+            return compact_class(self.instance)
+        return self.instance
 
     def load_instance(self, data):
-        instance = self.instance(self, data[self.instance.id_key])
+        klass = self._instance_class()
+        instance = klass(self, data[klass.id_key])
         instance.load(data)
-        instance.load_subresources()
         return instance
 
+    def from_record(self, record):
+        """
+        Rebuild an instance of this resource from a record made by
+        :meth:`InstanceResource.to_record`, with this resource as its parent
+        """
+        return self._instance_class().from_record(record, self)
+
+    def record_loader(self, raw=False, fields=None):
+        """
+        Return the function turning each decoded record into what
+        :meth:`iter` and :meth:`list` return.
+
+        :param raw: False for instance resources, True for plain dicts, or a
+            callable taking the decoded dict
+        :param fields: Only keep these fields of each record
+        """
+        steps = []
+        if fields is not None:
+            fields = tuple(fields)
+            if not raw and self.instance.id_key not in fields:
+                fields += (self.instance.id_key, )
+            steps.append(lambda record: project(record, fields))
+
+        table = self.intern_table()
+        if table is not None:
+            steps.append(table.record)
+
+        if not raw:
+            steps.append(self.load_instance)
+        elif callable(raw):
+            steps.append(raw)
+
+        if not steps:
+            return lambda record: record
+        if len(steps) == 1:
+            return steps[0]
+
+        def load(record):
+            for step in steps:
+                record = step(record)
+            return record
+        return load
+
+    def intern_table(self):
+        """
+        The :class:`~twilio.rest.resources.interning.InternTable` used for
+        records of this resource, or None if :attr:`intern_strings` is off
+        """
+        if self.intern_strings is True:
+            table = self.__dict__.get('_intern_table')
+            if table is None:
+                table = self._intern_table = InternTable()
+            return table
+        return self.intern_strings or None
+
+    def records(self, fields, **kwargs):
+        """ Return all records as lightweight namedtuples
+
+        Like :meth:`iter`, but each record is a namedtuple holding only the
+        requested fields, which is far cheaper than building an
+        :class:`InstanceResource` when scanning a large number of records.
+
+        .. code-block:: python
+
+            for call in client.calls.records(['sid', 'duration'],
+                                             status='completed'):
+                print call.sid, call.duration
+
+        :param fields: The fields to keep. ``from`` becomes ``from_``, and
+            fields missing from a record are None.
+        """
+        fields = tuple(fields)
+        klass = record_type(self.instance.__name__ + 'Record', fields)
+
+        def load(record):
+            return klass(*[record.get(f) for f in fields])
+
+        return self.iter(raw=load, **kwargs)
+
     def __str__(self):
         return '<%s>' % (self.__class__.__name__)
 
@@ -439,6 +1350,8 @@ class ListResource(Resource):
 
         :param int page: The page of results to retrieve (most recent at 0)
         :param int page_size: The number of results to be returned.
+        :param raw: Return plain dicts instead of InstanceResources
+        :param fields: Only keep these fields of each record
         """
         return self.get_instances(kw)
 
@@ -452,7 +1365,8 @@ class NextGenListResource(ListResource):
     def __init__(self, *args, **kwargs):
         super(NextGenListResource, self).__init__(*args, **kwargs)
 
-    def iter(self, **kwargs):
+    def iter(self, stream=False, raw=False, fields=None, limit=None,
+             adaptive=False, resume_from=None, stable=False, **kwargs):
         """ Return all instance resources using an iterator
 
         This will fetch a page of resources from the API and yield them in
@@ -468,25 +1382,124 @@ class NextGenListResource(ListResource):
 
             for message in client.messages:
                 print message.sid
+
+        :param bool stream: Decode each page as it comes off the socket,
+            yielding records before the page has finished downloading and
+            only holding one record in memory at a time.
+        :param raw: Yield plain dicts instead of instance resources, see
+            :meth:`ListResource.iter`
+        :param fields: Only keep these fields of each record
+        :param int limit: Stop after this many records, see
+            :meth:`ListResource.iter`
+        :param adaptive: Tune the page size during the scan, see
+            :meth:`ListResource.iter`
+        :param str resume_from: A page cursor to carry on from, see
+            :meth:`iter_pages`
+        :param stable: Skip records created after the scan started or
+            already yielded, see :meth:`ListResource.iter`
         """
-        params = urlencode(transform_params(kwargs))
-        parsed = urlparse(self.uri)
-        url = urlunparse(parsed[:4] + (params, ) + (parsed[5], ))
+        load = self.record_loader(raw, fields)
+        scan = self._stable_scan(stable, parse_iso_date)
+        sizer = self._page_sizer(adaptive, kwargs)
+        page_size = self._first_page_size(limit, sizer, kwargs)
+        if page_size == 0:
+            return
+        url = self._first_page_url(kwargs, resume_from)
+        remaining = limit
+        id_key = self.instance.id_key
 
         while True:
-            resp, page = self.request("GET", url)
+            started = default_timer()
+            busy = 0.0
+            count = 0
+            if stream:
+                resp, page = self.request_stream("GET", url, key=self.key)
+                records = page.records()
+            else:
+                resp, page = self.request("GET", url)
+
+                key = page.get('meta', {}).get('key')
+
+                if key is None or key not in page:
+                    return
+
+                records = page[key]
+
+            for ir in records:
+                if scan is not None and not scan.accept(ir, id_key):
+                    continue
+                record = load(ir)
+                count += 1
+                busy += default_timer() - started
+                yield record
+                started = default_timer()
+                if remaining is not None:
+                    remaining -= 1
+                    if not remaining:
+                        if stream:
+                            resp.close()
+                        return
+            busy += default_timer() - started
+
+            if stream:
+                key = page.get('meta', {}).get('key')
+                if key is None or key not in page:
+                    return
 
-            key = page.get('meta', {}).get('key')
+            url = page.get('meta', {}).get('next_page_url')
+            if not url:
+                return
+            size = self._next_page_size(page_size, sizer, remaining, count,
+                                        busy)
+            if size is not None:
+                url = _resize_page(url, size)
+
+    def iter_pages(self, raw=False, fields=None, resume_from=None,
+                   **kwargs):
+        """
+        Return all instance resources a page at a time, using an iterator.
+        See :meth:`ListResource.iter_pages`.
+
+        :param raw: Return plain dicts, see :meth:`ListResource.iter`
+        :param fields: Only keep these fields of each record
+        :param str resume_from: A cursor to carry on from
+        """
+        load = self.record_loader(raw, fields)
+        url = self._first_page_url(kwargs, resume_from)
 
+        while True:
+            resp, page = self.request("GET", url)
+            meta = page.get('meta', {})
+            key = meta.get('key')
             if key is None or key not in page:
-                raise StopIteration()
+                return
 
-            for ir in page[key]:
-                yield self.load_instance(ir)
+            url = meta.get('next_page_url')
+            yield Page([load(ir) for ir in page[key]], _cursor(url), meta)
 
-            url = page.get('meta', {}).get('next_page_url')
             if not url:
-                raise StopIteration()
+                return
+
+    def where(self, **predicates):
+        """
+        Return a query for the instance resources matching every predicate.
+        See :meth:`ListResource.where`.
+        """
+        return Query(self, NextGenListResource.iter,
+                     parse_iso_date).where(**predicates)
+
+    def sequence(self, *args, **kwargs):
+        """
+        Not supported, as these lists are paged by token, so their pages
+        can only be read in order
+        """
+        raise TwilioException("%s can only be read in order, use iter()" %
+                              self.__class__.__name__)
+
+    def _first_page_url(self, kwargs, resume_from=None):
+        params = resume_from or urlencode(transform_params(kwargs))
+        parsed = urlparse(self.uri)
+        return urlunparse(parsed[:4] + (params, ) + (parsed[5], ))
 
     def get_instances(self, params):
         """
@@ -498,9 +1511,13 @@ class NextGenListResource(ListResource):
         :param dict params: List of URL parameters to be included in request
         :param int page: The page of results to retrieve (most recent at 0)
         :param int page_size: The number of results to be returned.
+        :param raw: Return records as plain dicts, see :meth:`iter`
+        :param fields: Only keep these fields of each record
 
         :returns: -- the list of resources
         """
+        load = self.record_loader(params.pop('raw', False),
+                                  params.pop('fields', None))
         params = transform_params(params)
 
         resp, page = self.request("GET", self.uri, params=params)
@@ -514,4 +1531,4 @@ class NextGenListResource(ListResource):
         if key not in page:
             raise TwilioException("Key %s not present in response" % key)
 
-        return [self.load_instance(ir) for ir in page[key]]
+        return [load(ir) for ir in page[key]]
@@ -0,0 +1,126 @@
+from collections import OrderedDict
+
+from .pipeline import Pipeline
+
+
+class BatchResult(object):
+    """
+    The outcome of an operation on many sids, such as
+    :meth:`ListResource.get_many`, with the sids in the order they were
+    first given. A sid which failed holds its exception rather than
+    stopping the batch.
+
+    .. code-block:: python
+
+        fetched = client.calls.get_many(sids)
+        for sid, error in fetched.errors.items():
+            print sid, error
+        for call in fetched.instances():
+            print call.duration
+
+    .. attribute:: sids
+
+        Each distinct sid, in the order given
+
+    .. attribute:: results
+
+        An ordered dict mapping each sid which succeeded to its result
+
+    .. attribute:: errors
+
+        An ordered dict mapping each sid which failed to its exception
+
+    .. attribute:: cached
+
+        The number of results read from a cache rather than the API
+    """
+
+    def __init__(self, sids):
+        self.sids = list(OrderedDict.fromkeys(sids))
+        self.results = OrderedDict()
+        self.errors = OrderedDict()
+        self.cached = 0
+
+    def _finish(self, outcomes):
+        for sid in self.sids:
+            result, error = outcomes[sid]
+            if error is None:
+                self.results[sid] = result
+            else:
+                self.errors[sid] = error
+        return self
+
+    @property
+    def ok(self):
+        """ True if every sid succeeded """
+        return not self.errors
+
+    def instances(self):
+        """ Return the results which succeeded, in the order given """
+        return list(self.results.values())
+
+    def __getitem__(self, sid):
+        """ Return the result for a sid, or raise its exception """
+        if sid in self.errors:
+            raise self.errors[sid]
+        return self.results[sid]
+
+    def __contains__(self, sid):
+        return sid in self.results or sid in self.errors
+
+    def __len__(self):
+        return len(self.sids)
+
+    def __iter__(self):
+        return iter(self.sids)
+
+    def __repr__(self):
+        return '<BatchResult %d ok, %d failed>' % (len(self.results),
+                                                   len(self.errors))
+
+
+def get_many(resource, sids, concurrency=8):
+    """
+    Fetch the instances of a list resource with the given sids, see
+    :meth:`ListResource.get_many`.
+
+    :returns: A :class:`BatchResult`
+    """
+    batch = BatchResult(sids)
+    cache = resource.instance_cache
+    outcomes = {}
+
+    missing = []
+    for sid in batch.sids:
+        record = None
+        if cache is not None:
+            record = cache.get(instance_cache_key(resource, sid))
+        if record is None:
+            missing.append(sid)
+        else:
+            outcomes[sid] = resource.from_record(record), None
+            batch.cached += 1
+
+    def fetch(sid):
+        try:
+            return sid, resource.get_instance(sid), None
+        except Exception as e:
+            return sid, None, e
+
+    if len(missing) == 1 or concurrency <= 1:
+        fetched = (fetch(sid) for sid in missing)
+    else:
+        fetched = Pipeline(missing, name='sids').parallel_map(
+            fetch, workers=min(concurrency, len(missing)), ordered=False,
+            name='get')
+
+    for sid, instance, error in fetched:
+        outcomes[sid] = instance, error
+        if cache is not None and error is None:
+            cache.set(instance_cache_key(resource, sid), instance.to_record())
+    return batch._finish(outcomes)
+
+
+def instance_cache_key(resource, sid):
+    """ The key of an instance in :attr:`ListResource.instance_cache` """
+    return '%s/%s' % (resource.uri, sid)
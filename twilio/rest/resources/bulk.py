@@ -0,0 +1,319 @@
+import os
+import threading
+import time
+from collections import namedtuple
+from timeit import default_timer
+
+from six import string_types
+
+from ...exceptions import TwilioException
+from ..exceptions import TwilioRestException
+from .imports import json
+from .pipeline import Pipeline
+
+JOURNAL_VERSION = 1
+
+
+class RateLimiter(object):
+    """
+    Spaces out calls to :meth:`acquire` across threads so that no more than
+    ``rate`` happen per second, letting up to ``burst`` through at once
+    after a pause.
+
+    :param float rate: The most calls per second
+    :param int burst: The most calls let through without waiting
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = burst
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """ Wait until the next call is allowed """
+        with self._lock:
+            now = default_timer()
+            start = max(self._next, now - (self.burst - 1) / self.rate)
+            self._next = start + 1 / self.rate
+        if start > now:
+            time.sleep(start - now)
+
+
+class Journal(object):
+    """
+    An append-only file of what happened to each item of a bulk job, one
+    JSON object per line, so that a job which was stopped or crashed can be
+    run again without repeating the items it already did.
+
+    An item is logged as ``started`` before its request is sent, and then
+    as ``ok``, ``failed`` when the API turned it down, or ``unknown`` when
+    the request may have taken effect without an answer, such as after a
+    server error or a dropped connection. The last entry for a key wins.
+
+    :param str path: The file to log to, which is created if missing and
+        read if not
+    :param bool sync: Flush each entry to disk with ``fsync``, so the
+        journal survives the machine going down and not only the process
+
+    .. attribute:: entries
+
+        A dict mapping the key of each item logged before this journal was
+        opened to its last entry
+    """
+
+    def __init__(self, path, sync=False):
+        self.path = path
+        self.sync = sync
+        self.header = None
+        self.entries = {}
+        self._file = None
+        self._lock = threading.Lock()
+        self._partial = False
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            data = f.read().decode('utf-8')
+        self._partial = bool(data) and not data.endswith('\n')
+        for line in data.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A line cut short by a crash
+                continue
+            if 'key' in entry:
+                self.entries[_key_id(entry['key'])] = entry
+            elif self.header is None:
+                self.header = entry
+
+    def state(self, key):
+        """ The last state logged for a key, or None """
+        entry = self.entries.get(_key_id(key))
+        return entry['state'] if entry else None
+
+    def open(self, operation, uri):
+        """
+        Start appending, checking that the journal is of the same operation
+        on the same list resource
+        """
+        header = {'version': JOURNAL_VERSION, 'operation': operation,
+                  'uri': uri}
+        if self.header is not None and self.header != header:
+            raise TwilioException(
+                "The journal %s is of a %s of %s, not a %s of %s" % (
+                    self.path, self.header.get('operation'),
+                    self.header.get('uri'), operation, uri))
+        self._file = open(self.path, 'ab')
+        if self._partial:
+            self._file.write(b'\n')
+            self._partial = False
+        if self.header is None:
+            self.header = header
+            self._append(header)
+
+    def write(self, key, state, **fields):
+        """ Log the state of an item """
+        fields['key'] = key
+        fields['state'] = state
+        self._append(fields)
+
+    def _append(self, entry):
+        line = json.dumps(entry, sort_keys=True) + '\n'
+        with self._lock:
+            self._file.write(line.encode('utf-8'))
+            self._file.flush()
+            if self.sync:
+                os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _key_id(key):
+    # Keys come back from JSON with lists for tuples
+    return json.dumps(key, sort_keys=True)
+
+
+class BulkOutcome(namedtuple('BulkOutcome', 'key item result error')):
+    """
+    What happened to one item of a :class:`BulkJob`: the result of the
+    call, such as the instance created, or the exception it raised
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _rejected(error):
+    # A 4xx means the API turned the request down, so nothing was done
+    return (isinstance(error, TwilioRestException) and
+            isinstance(error.status, int) and error.status < 500)
+
+
+def _caller(resource, operation):
+    method = getattr(resource, operation, None)
+    if operation == 'create':
+        if method is None:
+            return resource.create_instance
+        return lambda kwargs: method(**kwargs)
+    if operation == 'update':
+        if method is None:
+            return lambda item: resource.update_instance(item[0], item[1])
+        return lambda item: method(item[0], **item[1])
+    return method or resource.delete_instance
+
+
+class BulkJob(object):
+    """
+    Creates, updates or deletes many instances of a list resource, several
+    at a time, yielding a :class:`BulkOutcome` for each item as it
+    finishes. Items are read from their iterable as they are needed, and an
+    item which fails doesn't stop the others.
+
+    .. code-block:: python
+
+        job = client.messages.bulk_create(
+            ({'to': to, 'from_': SENDER, 'body': BODY} for to in numbers),
+            concurrency=8, rate=10, journal='campaign.journal',
+            key=lambda kwargs: kwargs['to'])
+        for outcome in job:
+            if not outcome.ok:
+                print outcome.key, outcome.error
+
+    With a journal, running the same job again skips the items it logged as
+    done. Items whose request was sent without an answer are held back
+    rather than risk doing them twice, unless ``retry_unknown`` is set,
+    while items the API turned down are tried again.
+
+    :param resource: The :class:`ListResource` to change
+    :param str operation: ``'create'``, ``'update'`` or ``'delete'``
+    :param items: For a create, the keyword arguments of each ``create``;
+        for an update, ``(sid, kwargs)`` pairs; for a delete, sids
+    :param int concurrency: The most requests in flight at once
+    :param float rate: The most requests started per second
+    :param journal: A :class:`Journal`, or the path of one
+    :param key: A function returning the key of an item, which must name
+        it across runs and encode as JSON. Defaults to the sid of an
+        update or delete, and the position of a create in ``items``.
+    :param bool retry_unknown: Send items again whose outcome is unknown
+
+    .. attribute:: succeeded
+
+        The number of items done in this run
+
+    .. attribute:: failed
+
+        The number of items which failed in this run
+
+    .. attribute:: skipped
+
+        The number of items the journal shows were done in an earlier run
+
+    .. attribute:: uncertain
+
+        The keys of items held back as their outcome in an earlier run is
+        unknown
+    """
+
+    def __init__(self, resource, operation, items, concurrency=8, rate=None,
+                 journal=None, key=None, retry_unknown=False):
+        if operation not in ('create', 'update', 'delete'):
+            raise TwilioException("Unknown bulk operation: %r" % operation)
+        if isinstance(journal, string_types):
+            journal = Journal(journal)
+        self.resource = resource
+        self.operation = operation
+        self.items = items
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate) if rate else None
+        self.journal = journal
+        self.key = key
+        self.retry_unknown = retry_unknown
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+        self.uncertain = []
+        self._call = _caller(resource, operation)
+        self._lock = threading.Lock()
+        self._started = False
+
+    def __iter__(self):
+        if self._started:
+            raise TwilioException("A bulk job can only be run once")
+        self._started = True
+        return self._outcomes()
+
+    def run(self):
+        """ Run every item, and return the job """
+        for _ in self:
+            pass
+        return self
+
+    def _outcomes(self):
+        if self.journal is not None:
+            self.journal.open(self.operation, self.resource.uri)
+        try:
+            pipeline = Pipeline(self._pending(), name='items',
+                                buffer=self.concurrency, chunk=1)
+            pipeline.parallel_map(self._apply, workers=self.concurrency,
+                                  ordered=False, name=self.operation)
+            for outcome in pipeline:
+                yield outcome
+        finally:
+            if self.journal is not None:
+                self.journal.close()
+
+    def _key(self, index, item):
+        if self.key is not None:
+            return self.key(item)
+        if self.operation == 'create':
+            return index
+        if self.operation == 'update':
+            return item[0]
+        return item
+
+    def _pending(self):
+        for index, item in enumerate(self.items):
+            key = self._key(index, item)
+            state = self.journal.state(key) if self.journal else None
+            if state == 'ok':
+                self.skipped += 1
+            elif state in ('started', 'unknown') and not self.retry_unknown:
+                self.uncertain.append(key)
+            else:
+                yield key, item
+
+    def _apply(self, pending):
+        key, item = pending
+        if self.limiter is not None:
+            self.limiter.acquire()
+        if self.journal is not None:
+            self.journal.write(key, 'started')
+        try:
+            result = self._call(item)
+        except Exception as e:
+            if self.journal is not None:
+                self.journal.write(
+                    key, 'failed' if _rejected(e) else 'unknown',
+                    status=getattr(e, 'status', None),
+                    error=getattr(e, 'msg', None) or repr(e))
+            with self._lock:
+                self.failed += 1
+            return BulkOutcome(key, item, None, e)
+        if self.journal is not None:
+            self.journal.write(key, 'ok', sid=getattr(result, 'sid', None))
+        with self._lock:
+            self.succeeded += 1
+        return BulkOutcome(key, item, result, None)
+
+    def __repr__(self):
+        return '<BulkJob %s: %d ok, %d failed, %d skipped>' % (
+            self.operation, self.succeeded, self.failed, self.skipped)
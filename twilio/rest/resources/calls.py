@@ -4,6 +4,8 @@ from twilio.rest.resources.call_feedback import (
     CallFeedbackFactory,
     CallFeedbackSummary,
 )
+from .joins import CallJoin
+from .query import date_range
 from .util import normalize_dates, parse_date, transform_params
 from . import InstanceResource, ListResource
 
@@ -60,22 +62,25 @@ class Calls(ListResource):
 
     name = "Calls"
     instance = Call
+    query_filters = {
+        'status': {'eq': 'status'},
+        'to': {'eq': 'to'},
+        'from_': {'eq': 'from_'},
+        'parent_call_sid': {'eq': 'parent_call_sid'},
+        'start_time': date_range('started'),
+        'end_time': date_range('ended'),
+    }
+    query_aliases = {'started': 'start_time', 'ended': 'end_time'}
 
     def __init__(self, *args, **kwargs):
         super(Calls, self).__init__(*args, **kwargs)
         self.summary = CallFeedbackSummary(self, *args, **kwargs)
 
     @normalize_dates
-    def list(self, from_=None, ended_after=None,
-             ended_before=None, ended=None, started_before=None,
-             started_after=None, started=None, **kwargs):
-        """
-        Returns a page of :class:`Call` resources as a list. For paging
-        informtion see :class:`ListResource`
-
-        :param date after: Only list calls started after this datetime
-        :param date before: Only list calls started before this datetime
-        """
+    def _filters(self, from_=None, ended_after=None, ended_before=None,
+                 ended=None, started_before=None, started_after=None,
+                 started=None, **kwargs):
+        """ Map the filters of the list and iter methods to API parameters """
         kwargs["from"] = from_
         kwargs["StartTime<"] = started_before
         kwargs["StartTime>"] = started_after
@@ -83,27 +88,74 @@ class Calls(ListResource):
         kwargs["EndTime<"] = ended_before
         kwargs["EndTime>"] = ended_after
         kwargs["EndTime"] = parse_date(ended)
-        return self.get_instances(kwargs)
+        return kwargs
 
-    @normalize_dates
-    def iter(self, from_=None, ended_after=None,
-             ended_before=None, ended=None, started_before=None,
-             started_after=None, started=None, **kwargs):
+    def list(self, *args, **kwargs):
+        """
+        Returns a page of :class:`Call` resources as a list. For paging
+        informtion see :class:`ListResource`
+
+        :param date after: Only list calls started after this datetime
+        :param date before: Only list calls started before this datetime
+        """
+        return self.get_instances(self._filters(*args, **kwargs))
+
+    def iter(self, *args, **kwargs):
         """
         Returns an iterator of :class:`Call` resources.
 
         :param date after: Only list calls started after this datetime
         :param date before: Only list calls started before this datetime
+        :param int limit: Stop after this many calls
+        :param bool stable: Skip calls made during the scan, and any
+            repeated by shifting pages
         """
-        kwargs["from"] = from_
-        kwargs["StartTime<"] = started_before
-        kwargs["StartTime>"] = started_after
-        kwargs["StartTime"] = parse_date(started)
-        kwargs["EndTime<"] = ended_before
-        kwargs["EndTime>"] = ended_after
-        kwargs["EndTime"] = parse_date(ended)
+        kwargs = self._filters(*args, **kwargs)
         return super(Calls, self).iter(**kwargs)
 
+    def iter_pages(self, *args, **kwargs):
+        """
+        Returns an iterator of pages of :class:`Call` resources. See
+        :meth:`ListResource.iter_pages`.
+
+        :param date after: Only list calls started after this datetime
+        :param date before: Only list calls started before this datetime
+        :param str resume_from: A page cursor to carry on from
+        """
+        kwargs = self._filters(*args, **kwargs)
+        return super(Calls, self).iter_pages(**kwargs)
+
+    def sequence(self, *args, **kwargs):
+        """
+        Returns a lazy sequence of :class:`Call` resources, reading
+        only the pages it needs. See :meth:`ListResource.sequence`.
+
+        :param date after: Only list calls started after this datetime
+        :param date before: Only list calls started before this datetime
+        :param int page_size: The size of the pages to fetch
+        """
+        kwargs = self._filters(*args, **kwargs)
+        return super(Calls, self).sequence(**kwargs)
+
+    def timeline(self, started_after=None, started_before=None,
+                 feedback=False, raw=False, **kwargs):
+        """
+        Returns an iterator of
+        :data:`~twilio.rest.resources.joins.CallTimeline`, each holding a
+        call with its recordings, notifications and, if asked for,
+        feedback. Recordings and notifications are read with one scan of
+        each list rather than a request per call.
+        See :class:`~twilio.rest.resources.joins.CallJoin`.
+
+        :param date started_after: Only join calls started after this date
+        :param date started_before: Only join calls started before this date
+        :param bool feedback: Also fetch each call's feedback, which takes a
+            request per call
+        :param raw: Join plain dicts rather than instance resources
+        """
+        join = CallJoin(self, feedback=feedback)
+        return join.iter(started_after, started_before, raw=raw, **kwargs)
+
     def create(self, to, from_, url, status_method=None, status_events=None,
                **kwargs):
         """
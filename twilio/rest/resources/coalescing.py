@@ -0,0 +1,263 @@
+import atexit
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from timeit import default_timer
+
+from ...exceptions import TwilioException
+
+logger = logging.getLogger('twilio')
+
+# Writers with threads running, flushed when the interpreter exits
+_open_writers = weakref.WeakSet()
+
+
+class PendingUpdate(object):
+    """
+    The outcome of an update made through a :class:`CoalescingWriter`,
+    known once the POST it was merged into has been answered. Every update
+    merged into the same POST shares its result.
+    """
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._result = None
+        self._error = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def done(self):
+        """ True once the POST has been answered """
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """
+        Wait for the POST, and return the updated instance or raise the
+        exception it failed with
+
+        :param float timeout: The most seconds to wait, after which a
+            :exc:`~twilio.TwilioException` is raised
+        """
+        error = self.exception(timeout)
+        if error is not None:
+            raise error
+        return self._result
+
+    def exception(self, timeout=None):
+        """ Wait for the POST, and return the exception it raised, if any """
+        if not self._done.wait(timeout):
+            raise TwilioException("The update hasn't been sent yet")
+        return self._error
+
+    def add_done_callback(self, func):
+        """ Call func with this update once the POST has been answered """
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(func)
+                return
+        func(self)
+
+    def _finish(self, result, error):
+        with self._lock:
+            self._result = result
+            self._error = error
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for func in callbacks:
+            try:
+                func(self)
+            except Exception:
+                logger.exception("Update callback failed")
+
+
+class _Batch(object):
+
+    def __init__(self, due):
+        self.due = due
+        self.fields = {}
+        self.futures = []
+
+
+class CoalescingWriter(object):
+    """
+    Merges updates to the same instance made within a short window into one
+    POST, for instances which change several times a second, such as a
+    TaskRouter worker's activity while an agent's state flaps.
+
+    The first update to a sid opens its window, and later updates in the
+    window add their fields to it, the last value of each field winning.
+    When the window ends the fields are sent in one ``update``. Updates to
+    a sid are sent in order, one POST at a time, and each call gets a
+    :class:`PendingUpdate` for the result of the POST it was merged into.
+
+    .. code-block:: python
+
+        writer = workspace.workers.coalescing_writer(window=0.5)
+        writer.update(worker_sid, activity_sid=busy)
+        pending = writer.update(worker_sid, activity_sid=idle)
+        print pending.result().activity_name
+        writer.close()
+
+    Pending updates are sent by :meth:`flush` and :meth:`close`, and when
+    the interpreter exits.
+
+    :param resource: The :class:`ListResource` to update
+    :param float window: The seconds to wait for more updates to a sid
+    :param int concurrency: The most POSTs in flight at once
+
+    .. attribute:: updates
+
+        The number of updates made
+
+    .. attribute:: posts
+
+        The number of POSTs sent for them
+    """
+
+    def __init__(self, resource, window=0.25, concurrency=4):
+        self.resource = resource
+        self.window = window
+        self.concurrency = concurrency
+        self.updates = 0
+        self.posts = 0
+        self._pending = OrderedDict()
+        self._flying = set()
+        self._cond = threading.Condition()
+        self._threads = []
+        self._closed = False
+
+    def update(self, sid, **kwargs):
+        """
+        Update the instance with the given sid, once the window ends
+
+        :param kwargs: The fields to change, as taken by the resource's
+            ``update``
+        :rtype: :class:`PendingUpdate`
+        """
+        future = PendingUpdate()
+        with self._cond:
+            if self._closed:
+                raise TwilioException("The writer has been closed")
+            batch = self._pending.get(sid)
+            if batch is None:
+                batch = self._pending[sid] = _Batch(
+                    default_timer() + self.window)
+            batch.fields.update(kwargs)
+            batch.futures.append(future)
+            self.updates += 1
+            if not self._threads:
+                self._start()
+            self._cond.notify_all()
+        return future
+
+    def flush(self, timeout=None):
+        """
+        Send every pending update now, and wait for the POSTs
+
+        :param float timeout: The most seconds to wait
+        :returns: True if every POST was answered in time
+        """
+        deadline = None if timeout is None else default_timer() + timeout
+        with self._cond:
+            for batch in self._pending.values():
+                batch.due = 0
+            self._cond.notify_all()
+            while self._pending or self._flying:
+                if not self._threads:
+                    return False
+                if deadline is None:
+                    self._cond.wait()
+                else:
+                    left = deadline - default_timer()
+                    if left <= 0:
+                        return False
+                    self._cond.wait(left)
+        return True
+
+    def close(self, timeout=None):
+        """
+        Send every pending update, stop the writer's threads, and refuse
+        any more updates
+
+        :returns: True if every POST was answered in time
+        """
+        with self._cond:
+            self._closed = True
+        sent = self.flush(timeout)
+        for thread in self._threads:
+            thread.join(timeout)
+        _open_writers.discard(self)
+        return sent
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _start(self):
+        for _ in range(self.concurrency):
+            thread = threading.Thread(target=self._work,
+                                      name='coalescing writer')
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+        _open_writers.add(self)
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while True:
+                    sid, batch = self._take()
+                    if batch is not None:
+                        break
+                    if self._closed and not self._pending:
+                        self._cond.notify_all()
+                        return
+                    self._cond.wait(self._wait_time())
+            try:
+                self._send(sid, batch)
+            finally:
+                with self._cond:
+                    self._flying.discard(sid)
+                    self.posts += 1
+                    self._cond.notify_all()
+
+    def _take(self):
+        """ Pop the first batch whose window has ended """
+        now = default_timer()
+        for sid, batch in self._pending.items():
+            # A sid's POSTs are sent one at a time, so they land in order
+            if batch.due <= now and sid not in self._flying:
+                del self._pending[sid]
+                self._flying.add(sid)
+                return sid, batch
+        return None, None
+
+    def _wait_time(self):
+        dues = [batch.due for sid, batch in self._pending.items()
+                if sid not in self._flying]
+        if not dues:
+            return None
+        return max(min(dues) - default_timer(), 0)
+
+    def _send(self, sid, batch):
+        update = getattr(self.resource, 'update', None)
+        try:
+            if update is None:
+                result = self.resource.update_instance(sid, batch.fields)
+            else:
+                result = update(sid, **batch.fields)
+        except Exception as e:
+            for future in batch.futures:
+                future._finish(None, e)
+        else:
+            for future in batch.futures:
+                future._finish(result, None)
+
+
+@atexit.register
+def _close_open_writers():
+    for writer in list(_open_writers):
+        writer.close()
@@ -0,0 +1,230 @@
+import array
+import datetime
+
+from ...exceptions import TwilioException
+from .imports import numpy
+from .util import parse_api_date
+
+# Fields the API sends as strings which hold numbers
+NUMERIC_FIELDS = frozenset([
+    'price', 'duration', 'num_segments', 'num_media', 'count', 'usage',
+    'queue_time', 'current_size', 'max_size', 'average_wait_time',
+])
+
+_NAN = float('nan')
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MONTHS = {
+    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05',
+    'Jun': '06', 'Jul': '07', 'Aug': '08', 'Sep': '09', 'Oct': '10',
+    'Nov': '11', 'Dec': '12',
+}
+
+
+def column_type(field):
+    """
+    Return how a field is converted in a column: ``'number'``, ``'date'``
+    or ``'str'``, which is left as it is
+    """
+    if field in NUMERIC_FIELDS:
+        return 'number'
+    if field.startswith('date_') or field.endswith('_time'):
+        return 'date'
+    return 'str'
+
+
+def _float(value):
+    if value is None:
+        return _NAN
+    try:
+        return float(value)
+    except ValueError:
+        return _NAN
+
+
+def number_column(values, np=None):
+    """
+    Convert the values of a numeric field to floats, with NaN for missing
+    values, as an ``array('d')`` or, given :mod:`numpy`, a float64 array
+    """
+    if np is not None:
+        try:
+            return np.array([_NAN if v is None else v for v in values],
+                            dtype=np.float64)
+        except ValueError:
+            return np.array([_float(v) for v in values], dtype=np.float64)
+    return array.array('d', [_float(v) for v in values])
+
+
+def _iso(value):
+    """
+    Rewrite a date the API returned as a naive UTC ISO 8601 string, or None
+    if it can't be read
+    """
+    if value is None:
+        return None
+    # "Tue, 15 Feb 2011 04:21:00 +0000" and "2015-01-01T00:00:00Z"
+    if len(value) == 31 and value[26:] == '+0000' and value[8:11] in _MONTHS:
+        return '%s-%s-%sT%s' % (value[12:16], _MONTHS[value[8:11]],
+                                value[5:7], value[17:25])
+    if len(value) == 20 and value[10] == 'T' and value[19] == 'Z':
+        return value[:19]
+    date = parse_api_date(value)
+    return None if date is None else date.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def _digits(codes, start, stop):
+    number = codes[:, start] - 48
+    for i in range(start + 1, stop):
+        number = number * 10 + (codes[:, i] - 48)
+    return number
+
+
+def _numpy_dates(values, np):
+    """
+    Parse the fixed layout RFC 2822 dates the legacy API returns with array
+    arithmetic on their characters, and anything else one at a time
+    """
+    text = np.array([v or '' for v in values], dtype='U31')
+    codes = text.view(np.uint32).reshape(len(values), 31).astype(np.int64)
+    fixed = ((codes[:, 3] == ord(',')) & (codes[:, 16] == ord(' ')) &
+             (codes[:, 19] == ord(':')) & (codes[:, 22] == ord(':')) &
+             (codes[:, 26] == ord('+')) &
+             (codes[:, 27:31] == ord('0')).all(axis=1))
+
+    names = sorted(_MONTHS)
+    keys = np.array([ord(m[0]) << 16 | ord(m[1]) << 8 | ord(m[2])
+                     for m in names])
+    months = np.array([int(_MONTHS[m]) for m in names])
+    key = codes[:, 8] << 16 | codes[:, 9] << 8 | codes[:, 10]
+    index = np.minimum(np.searchsorted(keys, key), len(keys) - 1)
+    fixed &= keys[index] == key
+
+    month = (_digits(codes, 12, 16) - 1970) * 12 + months[index] - 1
+    seconds = (_digits(codes, 17, 19) * 3600 + _digits(codes, 20, 22) * 60 +
+               _digits(codes, 23, 25))
+    dates = (month.astype('datetime64[M]').astype('datetime64[D]') +
+             (_digits(codes, 5, 7) - 1)).astype('datetime64[s]') + seconds
+
+    for i in np.flatnonzero(~fixed):
+        dates[i] = np.datetime64(_iso(values[i]) or 'NaT')
+    return dates
+
+
+def date_column(values, np=None):
+    """
+    Convert the values of a date field, as the API returned them, to UTC.
+    Given :mod:`numpy` this is a ``datetime64[s]`` array with NaT for
+    missing values, otherwise an ``array('d')`` of seconds since the epoch
+    with NaN for missing values.
+    """
+    if np is not None:
+        return _numpy_dates(values, np)
+
+    return array.array('d', [_NAN if value is None else epoch_seconds(value)
+                             for value in values])
+
+
+def epoch_seconds(value):
+    """
+    Return the seconds since the epoch of a date string the API returned,
+    or NaN if it can't be read
+    """
+    if len(value) == 31 and value[26:] == '+0000':
+        days = _month_days[value[8:16]]
+        if days is not None:
+            try:
+                return ((days + int(value[5:7]) - 1) * 86400.0 +
+                        int(value[17:19]) * 3600 +
+                        int(value[20:22]) * 60 + int(value[23:25]))
+            except ValueError:
+                pass
+    date = parse_api_date(value)
+    if date is None:
+        return _NAN
+    delta = date - _EPOCH
+    return delta.days * 86400.0 + delta.seconds
+
+
+class _MonthDays(dict):
+    """ Days from the epoch to the start of months, keyed like "Feb 2011" """
+
+    def __missing__(self, key):
+        try:
+            first = datetime.datetime(int(key[4:]), int(_MONTHS[key[:3]]), 1)
+        except (KeyError, ValueError):
+            return None
+        if len(self) >= 1024:
+            self.clear()
+        days = self[key] = (first - _EPOCH).days
+        return days
+
+
+_month_days = _MonthDays()
+
+
+def str_column(values, np=None):
+    """ Keep the values of a field as a list, or a numpy object array """
+    if np is not None:
+        return np.array(values, dtype=object)
+    return values
+
+
+_CONVERTERS = {
+    'number': number_column,
+    'date': date_column,
+    'str': str_column,
+}
+
+
+def columns_numpy(use_numpy):
+    """
+    Return :mod:`numpy` if columns should be numpy arrays, or None
+
+    :param use_numpy: True to require numpy, False to never use it, or None
+        to use it when it is installed
+    """
+    if use_numpy is None:
+        return numpy
+    if not use_numpy:
+        return None
+    if numpy is None:
+        raise TwilioException("numpy is not installed")
+    return numpy
+
+
+def batch_columns(pages, fields, batch, types=None, np=None):
+    """
+    Turn pages of decoded records into batches of columns.
+
+    :param pages: An iterable of lists of decoded record dicts
+    :param fields: The fields to keep, as named in the records
+    :param int batch: The largest number of records in a batch
+    :param dict types: The :func:`column_type` to use for some fields
+    :param np: :mod:`numpy`, to return numpy arrays
+    :returns: An iterator of dicts mapping each field to its column
+    """
+    fields = tuple(fields)
+    types = types or {}
+    converters = []
+    for field in fields:
+        kind = types.get(field) or column_type(field)
+        if kind not in _CONVERTERS:
+            raise TwilioException("Unknown column type: %r" % kind)
+        converters.append(_CONVERTERS[kind])
+
+    return _batches(pages, fields, converters, batch, np)
+
+
+def _batches(pages, fields, converters, batch, np):
+    def columns(records):
+        return dict((field, convert([r.get(field) for r in records], np))
+                    for field, convert in zip(fields, converters))
+
+    pending = []
+    for records in pages:
+        pending.extend(records)
+        while len(pending) >= batch:
+            yield columns(pending[:batch])
+            del pending[:batch]
+    if pending:
+        yield columns(pending)
@@ -0,0 +1,223 @@
+import re
+
+from six import iteritems
+
+_ATTRIBUTE = re.compile(r'^\s*\.\. attribute:: (\w+)\s*$', re.M)
+
+# Held in the shared context, or set up by InstanceResource itself
+_CONTEXT = ('parent', 'base_uri', 'auth', 'timeout')
+_RESERVED = _CONTEXT + ('name', )
+
+_compact_classes = {}
+
+
+def documented_fields(klass):
+    """
+    Return the data fields listed as ``.. attribute::`` entries in the
+    docstrings of an instance resource class and its bases. Names the class
+    already defines, such as properties or class settings, are skipped.
+    """
+    fields = []
+    for base in reversed(klass.__mro__):
+        for name in _ATTRIBUTE.findall(base.__dict__.get('__doc__') or ''):
+            if name == 'from':
+                name = 'from_'
+            if name not in fields and not hasattr(klass, name):
+                fields.append(name)
+    return tuple(fields)
+
+
+class ResourceContext(object):
+    """
+    The connection settings of a compact instance. One context is shared by
+    every instance with the same parent, uri, credentials and timeout,
+    instead of each instance holding its own copies.
+    """
+    __slots__ = _CONTEXT
+
+    def __init__(self, parent, base_uri, auth, timeout):
+        self.parent = parent
+        self.base_uri = base_uri
+        self.auth = auth
+        self.timeout = timeout
+
+
+def resource_context(parent, base_uri, auth, timeout):
+    """
+    Return the shared :class:`ResourceContext` for these settings. Contexts
+    are cached on the parent itself, so they are freed along with it, and
+    instances only ever share a context with the same parent object.
+    """
+    key = (base_uri, auth, timeout)
+    contexts = parent.__dict__.get('_resource_contexts')
+    if contexts is None:
+        contexts = parent.__dict__['_resource_contexts'] = {}
+    try:
+        context = contexts.get(key)
+    except TypeError:
+        # Unhashable credentials can't be shared
+        return ResourceContext(parent, base_uri, auth, timeout)
+    if context is None:
+        context = contexts[key] = ResourceContext(parent, base_uri, auth,
+                                                  timeout)
+    return context
+
+
+def _context_property(name):
+    def get(self):
+        return getattr(self._context, name)
+
+    def set(self, value):
+        try:
+            context = object.__getattribute__(self, '_context')
+        except AttributeError:
+            # The parent is always set first
+            context = resource_context(value, value.uri, value.auth,
+                                       value.timeout)
+        else:
+            settings = dict((n, getattr(context, n)) for n in _CONTEXT)
+            current = settings[name]
+            # Parents compare by value, which is expensive, so check identity
+            if current is value or (name != 'parent' and current == value):
+                return
+            settings[name] = value
+            if name == 'parent':
+                settings['base_uri'] = value.uri
+                settings['auth'] = value.auth
+                settings['timeout'] = value.timeout
+            context = resource_context(**settings)
+        self._context = context
+
+    return property(get, set)
+
+
+def _extra(instance):
+    # Read the slot directly, as a missing attribute would otherwise end up
+    # in InstanceResource.__getattr__
+    try:
+        return object.__getattribute__(instance, '_extra')
+    except AttributeError:
+        return None
+
+
+class SlotAttributes(object):
+    """
+    The mapping a compact instance loads its fields into. Documented fields
+    are stored in slots, and anything else in a dict which is only created
+    when needed.
+    """
+    __slots__ = ('instance', )
+
+    def __init__(self, instance):
+        self.instance = instance
+
+    def get(self, key, default=None):
+        if key in self.instance._slot_names:
+            try:
+                return object.__getattribute__(self.instance, key)
+            except AttributeError:
+                return default
+        extra = _extra(self.instance)
+        return default if extra is None else extra.get(key, default)
+
+    def __setitem__(self, key, value):
+        if key in self.instance._slot_names:
+            setattr(self.instance, key, value)
+            return
+        extra = _extra(self.instance)
+        if extra is None:
+            extra = self.instance._extra = {}
+        extra[key] = value
+
+    def pop(self, key, default=None):
+        if key in self.instance._slot_names:
+            value = self.get(key, default)
+            try:
+                delattr(self.instance, key)
+            except AttributeError:
+                pass
+            return value
+        extra = _extra(self.instance)
+        return default if extra is None else extra.pop(key, default)
+
+    def update(self, entries):
+        for key, value in iteritems(entries):
+            self[key] = value
+
+    def items(self):
+        instance = self.instance
+        items = [(name, getattr(instance, name)) for name in _CONTEXT]
+        for name in ('name', ) + instance._fields:
+            try:
+                items.append((name, object.__getattribute__(instance, name)))
+            except AttributeError:
+                pass
+        extra = _extra(instance)
+        if extra:
+            items.extend(iteritems(extra))
+        return items
+
+
+def _attributes(self):
+    return SlotAttributes(self)
+
+
+def _snapshot(self):
+    return dict(SlotAttributes(self).items())
+
+
+def _extra_getattr(klass):
+    fallback = klass.__getattr__
+
+    def __getattr__(self, name):
+        extra = _extra(self)
+        if extra is not None and name in extra:
+            return extra[name]
+        return fallback(self, name)
+    return __getattr__
+
+
+def _equality(klass):
+    # Compare as klass, so compact and regular instances are equal both ways
+    def __eq__(self, other):
+        return isinstance(other, klass) and self._state() == other._state()
+    return __eq__
+
+
+def compact_class(klass):
+    """
+    Return a variant of an instance resource class which stores the fields
+    documented on it in ``__slots__``, and shares its parent, uri,
+    credentials and timeout with other instances through a
+    :class:`ResourceContext`.
+
+    Instances behave like those of klass: they are instances of it, fields
+    are read and set as attributes, and methods, lazy dates and
+    subresources work as before. ``__dict__`` is a read-only snapshot of the
+    fields. Fields returned by the API but missing from the documentation
+    are kept in a dict created on demand.
+    """
+    try:
+        return _compact_classes[klass]
+    except KeyError:
+        pass
+
+    fields = tuple(f for f in documented_fields(klass) if f not in _RESERVED)
+    namespace = {
+        '__slots__': ('_context', '_extra', 'name') + fields,
+        '__doc__': klass.__doc__,
+        '__module__': klass.__module__,
+        '_fields': fields,
+        '_slot_names': frozenset(fields + _RESERVED),
+        '_attributes': _attributes,
+        '__dict__': property(_snapshot),
+        '__getattr__': _extra_getattr(klass),
+        '__eq__': _equality(klass),
+        '__hash__': klass.__hash__,
+    }
+    for name in _CONTEXT:
+        namespace[name] = _context_property(name)
+
+    compact = type('Compact' + klass.__name__, (klass, ), namespace)
+    _compact_classes[klass] = compact
+    return compact
@@ -5,11 +5,13 @@ from .imports import (
     PROXY_TYPE_SOCKS4,
     PROXY_TYPE_SOCKS5
 )
+from .json_codec import get_codec
 
 
 class Connection(object):
     '''Class for setting proxy configuration to be used for REST calls.'''
     _proxy_info = None
+    _json_codec = None
 
     @classmethod
     def proxy_info(cls):
@@ -43,6 +45,25 @@ class Connection(object):
             proxy_pass=proxy_pass,
         )
 
+    @classmethod
+    def json_codec(cls):
+        '''Returns the codec used to decode API responses. Defaults to the
+        fastest json backend installed.
+        '''
+        if cls._json_codec is None:
+            cls._json_codec = get_codec()
+        return cls._json_codec
+
+    @classmethod
+    def set_json_codec(cls, codec):
+        '''Set the json backend used for future REST API calls.
+
+        :param codec: One of 'json', 'simplejson', 'orjson' or 'ujson', an
+        object with ``loads`` and ``dumps`` methods, or None to go back to
+        the default.
+        '''
+        cls._json_codec = None if codec is None else get_codec(codec)
+
 
 _hush_pyflakes = [
     socks,
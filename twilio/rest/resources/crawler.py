@@ -0,0 +1,253 @@
+import sys
+import threading
+from timeit import default_timer
+
+from six import iteritems, reraise, string_types
+from six.moves import queue
+
+from ...exceptions import TwilioException
+from .pipeline import _DONE, _POLL, _Stopped, _poll
+
+
+def _subresources(instance_class):
+    # Imported here, as base imports this module
+    from .base import subresource_key
+    return dict((subresource_key(r), r)
+                for r in getattr(instance_class, 'subresources', []))
+
+
+def normalize_spec(spec, list_class=None):
+    """
+    Return a crawl spec as a dict mapping each subresource key to the spec
+    of its own subresources, checking the keys against the subresources of
+    ``list_class``'s instances when it is given.
+
+    A spec may be a dict, with None, True or an empty dict for subresources
+    which aren't expanded further, or a list of keys to expand one level.
+    """
+    if spec is None or spec is True:
+        return {}
+    if isinstance(spec, string_types):
+        spec = [spec]
+    if not isinstance(spec, dict):
+        spec = dict((key, None) for key in spec)
+
+    instance_class = getattr(list_class, 'instance', None)
+    known = _subresources(instance_class) if instance_class else None
+    normalized = {}
+    for key, child in iteritems(spec):
+        child_class = None
+        if known is not None:
+            if key not in known:
+                raise TwilioException(
+                    "%s have no %r subresource, only: %s" % (
+                        list_class.name, key, ', '.join(sorted(known))))
+            child_class = known[key]
+            if getattr(child_class, 'instance', None) is None:
+                raise TwilioException("%r is not a list and can't be "
+                                      "crawled" % key)
+        normalized[key] = normalize_spec(child, child_class)
+    return normalized
+
+
+class _Task(object):
+
+    def __init__(self, path, resource, spec, depth):
+        self.path = path
+        self.resource = resource
+        self.spec = spec
+        self.depth = depth
+
+
+class Crawler(object):
+    """
+    Walks a tree of nested resources, such as IP Messaging services with
+    their channels and each channel's members and messages, yielding every
+    record as a ``(path, record)`` pair.
+
+    Lists are fetched by a pool of threads, so sibling subtrees are read
+    at the same time, and no more than ``concurrency`` requests are ever in
+    flight. The tree is walked depth first, and once a few lists per thread
+    are waiting to be fetched a thread fetches the next one itself, so the
+    lists waiting stay few however wide the tree. Reading records slower
+    than they arrive pauses the crawl once ``buffer`` pages are waiting.
+
+    .. code-block:: python
+
+        crawler = Crawler(client.services, {
+            'channels': {'members': None, 'messages': None},
+            'users': None,
+        }, concurrency=8, timeout=60)
+        for path, record in crawler:
+            # ('services', 'IS123', 'channels', 'CH123', 'members', 'MB123')
+            print path, record
+
+    The path of a record is the key of the list it was found in and the
+    sid of the record, after the path of the record the list belongs to.
+
+    :param root: A :class:`ListResource` whose records are yielded and
+        crawled from, or an :class:`InstanceResource` to crawl from
+    :param spec: The subresources to expand, as a dict mapping each
+        subresource key to a spec of its own. See :func:`normalize_spec`.
+    :param int concurrency: The most lists fetched at once
+    :param int max_depth: Only expand subresources this many levels below
+        the first lists crawled, so 0 only reads those
+    :param float timeout: Stop fetching pages after this many seconds, and
+        end the crawl once the pages already fetched have been read
+    :param int buffer: The most pages of records waiting to be read
+
+    .. attribute:: lists
+
+        The number of lists fetched so far
+
+    .. attribute:: pages
+
+        The number of pages fetched so far
+
+    .. attribute:: truncated
+
+        True if the time budget ran out before the whole tree was read, or
+        the depth budget cut off part of the spec
+    """
+
+    def __init__(self, root, spec, concurrency=8, max_depth=None,
+                 timeout=None, buffer=16):
+        if hasattr(root, 'instance'):
+            self.spec = normalize_spec(spec, type(root))
+        else:
+            self.spec = normalize_spec(spec, getattr(root, 'parent', None))
+        self.root = root
+        self.concurrency = concurrency
+        self.max_depth = max_depth
+        self.timeout = timeout
+        self.lists = 0
+        self.pages = 0
+        self.truncated = False
+        self._output = queue.Queue(buffer)
+        self._tasks = queue.LifoQueue()
+        self._outstanding = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._error = None
+        self._deadline = None
+        self._started = False
+
+    def __iter__(self):
+        if self._started:
+            raise TwilioException("A crawler can only be run once")
+        self._started = True
+        return self._results()
+
+    def _results(self):
+        if self.timeout is not None:
+            self._deadline = default_timer() + self.timeout
+        if hasattr(self.root, 'instance'):
+            self._push(_Task((self.root.key, ), self.root, self.spec, 0))
+        else:
+            self._expand((), self.root, self.spec, 0, inline=False)
+        if not self._outstanding:
+            return
+
+        threads = []
+        for _ in range(self.concurrency):
+            thread = threading.Thread(target=self._work, name='crawler')
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        try:
+            while True:
+                chunk = _poll(self._stop, self._output.get)
+                if chunk is _DONE:
+                    break
+                for item in chunk:
+                    yield item
+        except _Stopped:
+            pass
+        finally:
+            self._stop.set()
+        # Only reached when the crawl ended or failed, rather than when the
+        # reader stopped early, so the threads are already on their way out
+        for thread in threads:
+            thread.join()
+        if self._error is not None:
+            reraise(*self._error)
+
+    def stop(self):
+        """ Stop fetching, leaving pages not yet read """
+        self._stop.set()
+
+    def _expand(self, path, record, spec, depth, inline=True):
+        """ Schedule the lists under a record """
+        if not spec:
+            return
+        if self.max_depth is not None and depth > self.max_depth:
+            self.truncated = True
+            return
+        for key, child in sorted(iteritems(spec)):
+            task = _Task(path + (key, ), getattr(record, key), child, depth)
+            if inline and self._tasks.qsize() >= 2 * self.concurrency:
+                # Plenty is waiting, so crawl this one now
+                self._crawl(task)
+            else:
+                self._push(task)
+
+    def _push(self, task):
+        with self._lock:
+            self._outstanding += 1
+        self._tasks.put(task)
+
+    def _work(self):
+        try:
+            while not self._stop.is_set():
+                try:
+                    task = self._tasks.get(timeout=_POLL)
+                except queue.Empty:
+                    continue
+                if task is None:
+                    return
+                try:
+                    self._crawl(task)
+                finally:
+                    with self._lock:
+                        self._outstanding -= 1
+                        done = not self._outstanding
+                if done:
+                    # Nothing is left to crawl, so let the others go
+                    for _ in range(self.concurrency - 1):
+                        self._tasks.put(None)
+                    self._put(_DONE)
+                    return
+        except _Stopped:
+            pass
+        except Exception:
+            if self._error is None:
+                self._error = sys.exc_info()
+            self._stop.set()
+
+    def _crawl(self, task):
+        with self._lock:
+            self.lists += 1
+        pages = task.resource.iter_pages()
+        while True:
+            if self._stop.is_set():
+                raise _Stopped()
+            if (self._deadline is not None and
+                    default_timer() > self._deadline):
+                self.truncated = True
+                return
+            try:
+                page = next(pages)
+            except StopIteration:
+                return
+            with self._lock:
+                self.pages += 1
+
+            records = [(task.path + (record.name, ), record)
+                       for record in page.records]
+            self._put(records)
+            for path, record in records:
+                self._expand(path, record, task.spec, task.depth + 1)
+
+    def _put(self, chunk):
+        _poll(self._stop,
+              lambda timeout: self._output.put(chunk, timeout=timeout))
@@ -0,0 +1,203 @@
+import datetime
+import hashlib
+import math
+
+from six import text_type
+
+from .util import parse_rfc2822_date
+
+
+def _hash(sid):
+    """
+    A 128 bit hash of a sid. Twilio sids are a two letter prefix and 32
+    random hex digits, which are used as they are.
+    """
+    try:
+        return int(sid[2:], 16) if len(sid) == 34 else _digest(sid)
+    except ValueError:
+        return _digest(sid)
+
+
+def _digest(sid):
+    if isinstance(sid, text_type):
+        sid = sid.encode('utf-8')
+    return int(hashlib.md5(sid).hexdigest(), 16)
+
+
+class BloomFilter(object):
+    """
+    A set of hashes in a fixed number of bits. It may wrongly report a hash
+    it has never seen, with the given error rate once it holds capacity
+    hashes, but never misses one it has.
+
+    :param int capacity: The number of hashes to size the filter for
+    :param float error_rate: The false positive rate at capacity
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        bits = -capacity * math.log(error_rate) / (math.log(2) ** 2)
+        self.size = max(int(math.ceil(bits)), 8)
+        self.hashes = max(int(round(self.size * math.log(2) / capacity)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, h):
+        # Enhanced double hashing from the two 64 bit halves of the hash
+        size = self.size
+        x, y = (h & 0xffffffffffffffff) % size, (h >> 64) % size
+        for i in range(self.hashes):
+            yield x
+            x = (x + y) % size
+            y = (y + i + 1) % size
+
+    def __contains__(self, h):
+        bits = self.bits
+        for position in self._positions(h):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add(self, h):
+        bits = self.bits
+        for position in self._positions(h):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+
+class SidSet(object):
+    """
+    The sids seen during a scan, in bounded memory.
+
+    Sids are kept exactly in a set until there are ``exact_limit`` of them.
+    After that they move to Bloom filters, each twice the size of the one
+    before, using under four bytes per sid at the default error rate. A Bloom
+    filter can mistake a new sid for one already seen, so a huge scan may
+    drop about one record in ``1 / error_rate``.
+
+    :param int exact_limit: Sids to hold exactly
+    :param float error_rate: The false positive rate of each Bloom filter
+    """
+
+    def __init__(self, exact_limit=100000, error_rate=1e-6):
+        self.exact_limit = exact_limit
+        self.error_rate = error_rate
+        self.exact = set()
+        self.filters = []
+
+    def __len__(self):
+        return len(self.exact) + sum(f.count for f in self.filters)
+
+    def clear(self):
+        """ Forget every sid """
+        self.exact = set()
+        self.filters = []
+
+    def add(self, sid):
+        """
+        Add a sid to the set.
+
+        :returns: False if the sid was already in it, True otherwise
+        """
+        if not self.filters:
+            if sid in self.exact:
+                return False
+            self.exact.add(sid)
+            if len(self.exact) > self.exact_limit:
+                self._grow()
+                for seen in self.exact:
+                    self.filters[-1].add(_hash(seen))
+                self.exact = set()
+            return True
+
+        h = _hash(sid)
+        for bloom in self.filters:
+            if h in bloom:
+                return False
+        bloom = self.filters[-1]
+        if bloom.count >= bloom.capacity:
+            self._grow()
+            bloom = self.filters[-1]
+        bloom.add(h)
+        return True
+
+    def _grow(self):
+        capacity = self.exact_limit * 2
+        if self.filters:
+            capacity = self.filters[-1].capacity * 2
+        self.filters.append(BloomFilter(capacity, self.error_rate))
+
+
+class StableScan(object):
+    """
+    Keeps an iteration over a list which changes while it is read from
+    yielding the same record twice, as offset based pages do when records
+    are added ahead of the offset.
+
+    Records created after the scan started are skipped, so the scan covers
+    the list as it was when it began, and records already yielded are
+    dropped. Both are counted.
+
+    A scan can be run more than once, each :meth:`start` clearing the sids
+    and counts of the last run.
+
+    :param until: Skip records created after this naive UTC datetime.
+        Defaults to the time each run starts, by the local clock.
+    :param sids: The :class:`SidSet` to track yielded sids in
+
+    .. attribute:: duplicates
+
+        The number of records dropped for having been yielded already
+
+    .. attribute:: newer
+
+        The number of records skipped for being created after ``until``
+    """
+
+    date_field = 'date_created'
+
+    def __init__(self, until=None, sids=None):
+        self.until = until
+        self.sids = SidSet() if sids is None else sids
+        self.duplicates = 0
+        self.newer = 0
+        self._until = until
+
+    def start(self, parse_date=parse_rfc2822_date):
+        """
+        Begin a run of the scan, forgetting the sids and counts of any
+        earlier one, and pin the upper time bound if one was not given.
+
+        :param parse_date: Parses the dates of the records being scanned
+        """
+        self.until = self._until
+        if self.until is None:
+            self.until = datetime.datetime.utcnow()
+        self.sids.clear()
+        self.duplicates = 0
+        self.newer = 0
+        self._parse_date = parse_date
+
+    def accept(self, record, id_key='sid'):
+        """
+        Return whether a decoded record should be yielded, noting its sid
+        if it should.
+        """
+        created = record.get(self.date_field)
+        if created and self._created(created) > self.until:
+            self.newer += 1
+            return False
+
+        sid = record.get(id_key)
+        if sid is not None and not self.sids.add(sid):
+            self.duplicates += 1
+            return False
+        return True
+
+    def _created(self, value):
+        date = self._parse_date(value)
+        if not isinstance(date, datetime.datetime):
+            return datetime.datetime.min
+        if date.tzinfo is not None:
+            date = date.replace(tzinfo=None) - date.utcoffset()
+        return date
@@ -13,6 +13,34 @@ except ImportError:
     except ImportError:
         from django.utils import simplejson as json
 
+# optional json backends
+try:
+    import simplejson
+except ImportError:
+    simplejson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# optional record encoding
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# optional column arrays
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # httplib2
 import httplib2
 
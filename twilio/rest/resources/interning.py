@@ -0,0 +1,81 @@
+from six import iteritems, string_types
+
+_unseen = object()
+
+
+class InternTable(object):
+    """
+    Shares one string object between every record holding an equal key or
+    low cardinality value, such as ``status``, ``direction`` or
+    ``account_sid``, so large iterations keep one copy of each.
+
+    The table is bounded. A field stops being interned once it has shown
+    more than ``max_values`` distinct values, since values like ``sid`` are
+    never repeated, and the values collected for it are dropped.
+
+    :param int max_values: Distinct values of a field to intern before the
+        field is treated as high cardinality
+    :param int max_length: Strings longer than this are never interned
+    :param int max_keys: The number of distinct keys to intern
+    """
+
+    def __init__(self, max_values=256, max_length=64, max_keys=1024):
+        self.max_values = max_values
+        self.max_length = max_length
+        self.max_keys = max_keys
+        self.keys = {}
+        self.values = {}
+
+    def __len__(self):
+        return len(self.keys) + sum(len(v) for v in self.values.values() if v)
+
+    def key(self, key):
+        """ Return the shared copy of a key """
+        shared = self.keys.get(key)
+        if shared is None:
+            if len(self.keys) >= self.max_keys:
+                return key
+            shared = self.keys[key] = key
+        return shared
+
+    def value(self, field, value):
+        """ Return the shared copy of a value of field """
+        table = self.values.get(field, _unseen)
+        if table is None or len(value) > self.max_length:
+            return value
+        if table is _unseen:
+            if len(self.values) >= self.max_keys:
+                return value
+            table = self.values[field] = {}
+
+        shared = table.get(value)
+        if shared is None:
+            if len(table) >= self.max_values:
+                # Too many distinct values to be worth keeping
+                self.values[field] = None
+                return value
+            shared = table[value] = value
+        return shared
+
+    def record(self, record):
+        """
+        Return a copy of a decoded record, and of any objects nested in it,
+        using the shared keys and values
+        """
+        keys = self.keys
+        values = self.values
+        max_length = self.max_length
+        interned = {}
+        for key, value in iteritems(record):
+            key = keys.get(key) or self.key(key)
+            if isinstance(value, string_types):
+                # Inlined lookup of values seen before, falling back to
+                # value() to add new ones
+                table = values.get(key, _unseen)
+                if table is not None and len(value) <= max_length:
+                    shared = table is not _unseen and table.get(value)
+                    value = shared or self.value(key, value)
+            elif isinstance(value, dict):
+                value = self.record(value)
+            interned[key] = value
+        return interned
@@ -0,0 +1,169 @@
+import datetime
+import sys
+import threading
+from collections import namedtuple
+
+from six import reraise, string_types
+
+from ..exceptions import TwilioRestException
+from .call_feedback import CallFeedbackFactory
+from .notifications import Notifications
+from .pipeline import Pipeline
+from .recordings import Recordings
+from .util import record_field
+
+#: A call with the records of other lists which belong to it
+CallTimeline = namedtuple('CallTimeline',
+                          'call recordings notifications feedback')
+
+
+def index_by(records, key='call_sid'):
+    """
+    Return a dict mapping each value of a field to the list of records
+    holding it, the build side of a hash join. Records without the field
+    are left out.
+
+    :param records: Instance resources or decoded dicts
+    :param str key: The field to index on
+    """
+    index = {}
+    for record in records:
+        value = record_field(record, key)
+        if value is None:
+            continue
+        matches = index.get(value)
+        if matches is None:
+            index[value] = [record]
+        else:
+            matches.append(record)
+    return index
+
+
+def _day(value):
+    if isinstance(value, string_types):
+        return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+    return value
+
+
+class CallJoin(object):
+    """
+    Joins calls with their recordings, notifications and feedback without
+    a request per call.
+
+    The recordings and notifications of a time window are each read with
+    one scan of the account's list, at the same time, and indexed by
+    ``call_sid``. The calls of the window are then read and matched as they
+    arrive. Feedback can't be listed across calls, so it is still fetched a
+    call at a time, by a pool of threads.
+
+    .. code-block:: python
+
+        join = CallJoin(client.calls, feedback=True)
+        for timeline in join.iter(date(2015, 1, 1), date(2015, 1, 2)):
+            print timeline.call.sid, len(timeline.recordings)
+
+    The recordings and notifications of every call in the window are held
+    until the call is reached, so keep windows to what fits in memory.
+
+    :param calls: The :class:`Calls` to read
+    :param recordings: The :class:`Recordings` to join, by default those
+        of the same account, or False to leave them out
+    :param notifications: The :class:`Notifications` to join, by default
+        those of the same account, or False to leave them out
+    :param bool feedback: Fetch the feedback of each call
+    :param lag: How long after a call starts its recordings and
+        notifications may be logged, which widens their scans past the end
+        of the window
+    :param int workers: The number of threads fetching feedback
+    """
+
+    def __init__(self, calls, recordings=None, notifications=None,
+                 feedback=False, lag=datetime.timedelta(days=1), workers=8):
+        self.calls = calls
+        self.recordings = self._account_list(recordings, Recordings)
+        self.notifications = self._account_list(notifications,
+                                                Notifications)
+        self.feedback = feedback
+        self.lag = lag
+        self.workers = workers
+
+    def _account_list(self, resource, list_class):
+        if resource is False:
+            return None
+        if resource is None:
+            return list_class(self.calls.base_uri, self.calls.auth,
+                              self.calls.timeout)
+        return resource
+
+    def iter(self, started_after=None, started_before=None, raw=False,
+             **kwargs):
+        """
+        Return a :data:`CallTimeline` for each call started in a window,
+        using an iterator. The recordings and notifications are read before
+        this returns, and the calls as the iterator is used.
+
+        :param date started_after: The first day of the window
+        :param date started_before: The last day of the window
+        :param raw: Join the plain dicts the API returned instead of
+            instance resources
+        :param kwargs: Other filters of the calls, such as ``status``
+        """
+        before = _day(started_before)
+        if before is not None:
+            before += self.lag
+        window = {'after': _day(started_after), 'before': before}
+
+        indexes = self._scan([self.recordings, self.notifications], window,
+                             raw)
+        recordings, notifications = indexes
+        calls = self.calls.iter(started_after=started_after,
+                                started_before=started_before, raw=raw,
+                                **kwargs)
+        timelines = self._match(calls, recordings, notifications)
+        if not self.feedback:
+            return timelines
+        return iter(Pipeline(timelines, name='join calls')
+                    .parallel_map(self._add_feedback, workers=self.workers,
+                                  name='feedback'))
+
+    def _scan(self, resources, window, raw):
+        """ Index each list by call_sid, reading them at the same time """
+        indexes = [{} for _ in resources]
+        failed = []
+
+        def scan(i, resource):
+            try:
+                indexes[i] = index_by(resource.iter(raw=raw, **window))
+            except Exception:
+                failed.append(sys.exc_info())
+
+        threads = [threading.Thread(target=scan, args=(i, resource))
+                   for i, resource in enumerate(resources)
+                   if resource is not None]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if failed:
+            reraise(*failed[0])
+        return indexes
+
+    def _match(self, calls, recordings, notifications):
+        for call in calls:
+            sid = record_field(call, 'sid')
+            # Popped, so each call's records are freed once it is passed on
+            yield CallTimeline(call, recordings.pop(sid, []),
+                               notifications.pop(sid, []), None)
+
+    def _add_feedback(self, timeline):
+        sid = record_field(timeline.call, 'sid')
+        factory = CallFeedbackFactory('%s/%s' % (self.calls.uri, sid),
+                                      self.calls.auth, self.calls.timeout)
+        try:
+            feedback = factory.get()
+        except TwilioRestException as e:
+            if e.status != 404:
+                raise
+            feedback = None
+        return timeline._replace(feedback=feedback)
@@ -0,0 +1,114 @@
+import sys
+
+from six import binary_type
+
+from ...exceptions import TwilioException
+from .imports import json, simplejson, orjson, ujson
+
+
+class JsonCodec(object):
+    """
+    Decodes response bodies and encodes request payloads. Bodies are handed
+    over as the raw bytes read off the socket so backends that parse UTF-8
+    directly never need a decoded copy of the response.
+
+    Calls the ``loads`` and ``dumps`` of :attr:`module`, by default the
+    standard library :mod:`json`.
+    """
+    name = 'json'
+    module = json
+
+    def loads(self, data):
+        return self.module.loads(data)
+
+    def dumps(self, obj):
+        return self.module.dumps(obj)
+
+    def __repr__(self):
+        return '<%s %s>' % (self.__class__.__name__, self.name)
+
+
+class StdlibJsonCodec(JsonCodec):
+    """ The standard library :mod:`json` module """
+    name = 'json'
+
+    # json.loads only accepts bytes on Python 2 and Python 3.6+
+    decode_bytes = (3, 0) <= sys.version_info < (3, 6)
+
+    def loads(self, data):
+        if self.decode_bytes and isinstance(data, binary_type):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+
+class SimplejsonCodec(JsonCodec):
+    name = 'simplejson'
+    module = simplejson
+
+
+class OrjsonCodec(JsonCodec):
+    name = 'orjson'
+    module = orjson
+
+    def loads(self, data):
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # orjson is stricter than the standard library, for example about
+            # lone surrogates, so give anything it refuses a second chance
+            return json.loads(data)
+
+    def dumps(self, obj):
+        return orjson.dumps(obj).decode('utf-8')
+
+
+class UjsonCodec(JsonCodec):
+    name = 'ujson'
+    module = ujson
+
+
+CODECS = {
+    'json': (StdlibJsonCodec, json),
+    'simplejson': (SimplejsonCodec, simplejson),
+    'orjson': (OrjsonCodec, orjson),
+    'ujson': (UjsonCodec, ujson),
+}
+
+# In order of preference when no codec has been chosen. ujson is opt-in only,
+# as older releases decode floats and very large integers differently from
+# the standard library.
+DEFAULT_PREFERENCE = ('orjson', 'json')
+
+
+def available_codecs():
+    """ Return the names of all installed json backends """
+    return sorted(name for name, (_, module) in CODECS.items() if module)
+
+
+def get_codec(codec=None):
+    """
+    Return a :class:`JsonCodec` for the given backend.
+
+    :param codec: The name of a backend (``json``, ``simplejson``,
+        ``orjson`` or ``ujson``), an object with ``loads`` and ``dumps``
+        methods, or None to pick the fastest backend installed.
+    :raises: a :exc:`~twilio.TwilioException` if the backend is unknown or
+        not installed
+    """
+    if codec is None:
+        for name in DEFAULT_PREFERENCE:
+            if CODECS[name][1] is not None:
+                return get_codec(name)
+
+    if hasattr(codec, 'loads') and hasattr(codec, 'dumps'):
+        return codec
+
+    try:
+        klass, module = CODECS[codec]
+    except (KeyError, TypeError):
+        raise TwilioException("Unknown json codec %r" % (codec,))
+
+    if module is None:
+        raise TwilioException("json codec %r is not installed" % codec)
+
+    return klass()
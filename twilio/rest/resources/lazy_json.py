@@ -0,0 +1,129 @@
+import re
+
+from six import iteritems, string_types, text_type
+
+from .connection import Connection
+from .imports import json
+
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_COLON = re.compile(r'\s*:\s*')
+
+_decoder = json.JSONDecoder()
+_missing = object()
+_undecided = object()
+
+# Documents shorter than this decode faster than they can be searched
+_SMALL = 256
+
+
+def _find_key(doc, key):
+    """
+    Look for a top level key of a JSON object with a substring search,
+    checking each match by counting the brackets before it once strings have
+    been removed. That check costs more per byte than decoding, so matches
+    far into the document, and small documents, are left to a full decode.
+
+    :returns: The decoded value, _missing, or _undecided
+    """
+    if len(doc) < _SMALL:
+        return _undecided
+    if doc.lstrip()[:1] != '{':
+        return _missing
+
+    found = False
+    limit = len(doc) // 4
+    for needle in set([json.dumps(key), json.dumps(key, ensure_ascii=False)]):
+        start = doc.find(needle)
+        while start != -1:
+            if start > limit:
+                return _undecided
+            found = True
+            colon = _COLON.match(doc, start + len(needle))
+            if colon is not None:
+                before = _STRING.sub('', doc[:start])
+                # A quote left over means the match is inside a string
+                if '"' not in before and (
+                        before.count('{') + before.count('[') -
+                        before.count('}') - before.count(']')) == 1:
+                    return _decoder.raw_decode(doc, colon.end())[0]
+            start = doc.find(needle, start + 1)
+
+    if not found and ('\\u' in doc or '\\/' in doc):
+        # The key may have been written with escapes we did not search for
+        return _undecided
+    return _missing
+
+
+def find_key(doc, key, default=None):
+    """
+    Decode the value of a single top level key of a JSON object, decoding
+    as little of the rest of the document as possible.
+
+    :param str doc: A JSON document
+    :param str key: The key to look up
+    :returns: The decoded value, or default if the document is not an object
+        or the key is not present
+    """
+    value = _find_key(doc, key)
+    if value is _undecided:
+        data = json.loads(doc)
+        return data.get(key, default) if isinstance(data, dict) else default
+    return default if value is _missing else value
+
+
+class JsonString(text_type):
+    """
+    A field holding a JSON document as a string, such as the attributes of a
+    TaskRouter :class:`Task`.
+
+    It is still a string, so it can be compared, sent back to the API or
+    passed to :func:`json.loads` as before. The document is only decoded when
+    :attr:`data` is first read, and the result is cached. :meth:`get` reads
+    a single top level key without decoding the whole document.
+    """
+
+    @property
+    def data(self):
+        """ The decoded document """
+        try:
+            return self.__dict__['_data']
+        except KeyError:
+            codec = Connection.json_codec()
+            data = self.__dict__['_data'] = codec.loads(text_type(self))
+            return data
+
+    def get(self, key, default=None):
+        """
+        Return the value of a top level key of the document, or default
+        """
+        if '_data' not in self.__dict__:
+            values = self.__dict__.setdefault('_values', {})
+            value = values.get(key, _undecided)
+            if value is _undecided:
+                value = values[key] = _find_key(self, key)
+            if value is not _undecided:
+                return default if value is _missing else value
+
+        data = self.data
+        return data.get(key, default) if isinstance(data, dict) else default
+
+
+def json_field(value):
+    """
+    Wrap a JSON document field of an instance resource.
+
+    Strings become a :class:`JsonString`. Objects the API has already
+    embedded have their ``*attributes`` string members wrapped instead, as
+    TaskRouter does with the task and worker attributes of an event.
+    """
+    if isinstance(value, JsonString):
+        return value
+    if isinstance(value, string_types):
+        return JsonString(value)
+    if isinstance(value, dict):
+        for key, member in iteritems(value):
+            if (isinstance(member, string_types) and
+                    key.endswith('attributes') and
+                    not isinstance(member, JsonString)):
+                value[key] = JsonString(member)
+    return value
@@ -1,5 +1,6 @@
 from . import InstanceResource, ListResource
 from .media import MediaList
+from .query import date_range
 from .util import normalize_dates, parse_date
 
 
@@ -101,6 +102,12 @@ class Messages(ListResource):
     name = "Messages"
     key = "messages"
     instance = Message
+    query_filters = {
+        'to': {'eq': 'to'},
+        'from_': {'eq': 'from_'},
+        'date_sent': date_range('date_sent'),
+    }
+    query_aliases = {'sent': 'date_sent'}
 
     def create(self, from_=None, **kwargs):
         """
@@ -122,6 +129,17 @@ class Messages(ListResource):
         return self.create_instance(kwargs)
 
     @normalize_dates
+    def _filters(self, from_=None, to=None, before=None, after=None,
+                 date_sent=None, **kwargs):
+        """ Map the filters of the list and iter methods to API parameters """
+        kwargs["From"] = from_
+        if to is not None:
+            kwargs["To"] = to
+        kwargs["DateSent<"] = before
+        kwargs["DateSent>"] = after
+        kwargs["DateSent"] = parse_date(date_sent)
+        return kwargs
+
     def list(self, from_=None, before=None, after=None, date_sent=None, **kw):
         """
         Returns a page of :class:`Message` resources as a list. For
@@ -136,28 +154,47 @@ class Messages(ListResource):
         :param date after: Only list messages logged after this datetime
         :param date before: Only list messages logged before this datetime
         """
-        kw["From"] = from_
-        kw["DateSent<"] = before
-        kw["DateSent>"] = after
-        kw["DateSent"] = parse_date(date_sent)
+        kw = self._filters(from_=from_, before=before, after=after,
+                           date_sent=date_sent, **kw)
         return self.get_instances(kw)
 
-    @normalize_dates
-    def iter(self, from_=None, to=None, before=None, after=None,
-             date_sent=None, **kwargs):
+    def iter(self, *args, **kwargs):
         """
         Returns an iterator of :class:`Message` resources.
 
         :param date after: Only list calls started after this datetime
         :param date before: Only list calls started before this datetime
+        :param int limit: Stop after this many messages
+        :param bool stable: Skip messages sent during the scan, and any
+            repeated by shifting pages
         """
-        kwargs["From"] = from_
-        kwargs["To"] = to
-        kwargs["DateSent<"] = before
-        kwargs["DateSent>"] = after
-        kwargs["DateSent"] = parse_date(date_sent)
+        kwargs = self._filters(*args, **kwargs)
         return super(Messages, self).iter(**kwargs)
 
+    def iter_pages(self, *args, **kwargs):
+        """
+        Returns an iterator of pages of :class:`Message` resources. See
+        :meth:`ListResource.iter_pages`.
+
+        :param date after: Only list calls started after this datetime
+        :param date before: Only list calls started before this datetime
+        :param str resume_from: A page cursor to carry on from
+        """
+        kwargs = self._filters(*args, **kwargs)
+        return super(Messages, self).iter_pages(**kwargs)
+
+    def sequence(self, *args, **kwargs):
+        """
+        Returns a lazy sequence of :class:`Message` resources, reading
+        only the pages it needs. See :meth:`ListResource.sequence`.
+
+        :param date after: Only list messages sent after this date
+        :param date before: Only list messages sent before this date
+        :param int page_size: The size of the pages to fetch
+        """
+        kwargs = self._filters(*args, **kwargs)
+        return super(Messages, self).sequence(**kwargs)
+
     def update(self, sid, **kwargs):
         """ Updates the message for the given sid
         :param sid: The sid of the message to update.
@@ -59,7 +59,7 @@ class Event(NextGenInstanceResource):
 
         Data about this specific Event.
     """
-    pass
+    json_fields = ('event_data',)
 
 
 class Events(NextGenListResource):
@@ -1,3 +1,4 @@
+from .query import date_range
 from .util import normalize_dates
 from . import InstanceResource, ListResource
 
@@ -15,9 +16,19 @@ class Notifications(ListResource):
 
     name = "Notifications"
     instance = Notification
+    query_filters = {
+        'log': {'eq': 'log'},
+        'message_date': date_range('message_date'),
+    }
 
     @normalize_dates
-    def list(self, before=None, after=None, **kwargs):
+    def _filters(self, before=None, after=None, **kwargs):
+        """ Map the filters of the list and iter methods to API parameters """
+        kwargs["MessageDate<"] = before
+        kwargs["MessageDate>"] = after
+        return kwargs
+
+    def list(self, *args, **kwargs):
         """
         Returns a page of :class:`Notification` resources as a list.
         For paging information see :class:`ListResource`.
@@ -30,9 +41,45 @@ class Notifications(ListResource):
         :param date before: Only list notifications logger before this datetime
         :param log_level: If 1, only shows errors. If 0, only show warnings
         """
-        kwargs["MessageDate<"] = before
-        kwargs["MessageDate>"] = after
-        return self.get_instances(kwargs)
+        return self.get_instances(self._filters(*args, **kwargs))
+
+    def iter(self, *args, **kwargs):
+        """
+        Returns an iterator of :class:`Notification` resources.
+
+        :param date after: Only list notifications logged after this datetime
+        :param date before: Only list notifications logged before this
+            datetime
+        :param int limit: Stop after this many notifications
+        """
+        kwargs = self._filters(*args, **kwargs)
+        return super(Notifications, self).iter(**kwargs)
+
+    def iter_pages(self, *args, **kwargs):
+        """
+        Returns an iterator of pages of :class:`Notification` resources. See
+        :meth:`ListResource.iter_pages`.
+
+        :param date after: Only list notifications logged after this datetime
+        :param date before: Only list notifications logged before this
+            datetime
+        :param str resume_from: A page cursor to carry on from
+        """
+        kwargs = self._filters(*args, **kwargs)
+        return super(Notifications, self).iter_pages(**kwargs)
+
+    def sequence(self, *args, **kwargs):
+        """
+        Returns a lazy sequence of :class:`Notification` resources, reading
+        only the pages it needs. See :meth:`ListResource.sequence`.
+
+        :param date after: Only list notifications logged after this datetime
+        :param date before: Only list notifications logged before this
+            datetime
+        :param int page_size: The size of the pages to fetch
+        """
+        kwargs = self._filters(*args, **kwargs)
+        return super(Notifications, self).sequence(**kwargs)
 
     def delete(self, sid):
         """
@@ -0,0 +1,308 @@
+import random
+from collections import OrderedDict
+
+from six.moves import range
+
+from ...exceptions import TwilioException
+
+DEFAULT_PAGE_SIZE = 50
+
+
+class PageSizer(object):
+    """
+    Tunes the page size of a long scan to fetch the most records per second.
+
+    Every ``pages_per_step`` full pages, the records per second since the
+    last step are compared with the rate at the previous page size. The size
+    keeps moving by ``factor`` while that improves the rate by more than
+    ``tolerance``. When it stops improving, the sizer goes back to the best
+    size and settles there, after trying the other direction once if the
+    very first step made things worse.
+
+    :param int page_size: The size to start from
+    :param int min_page_size: The smallest size to try
+    :param int max_page_size: The largest size to try, at most the largest
+        page the API returns
+    :param float factor: How much to grow or shrink the page size by
+    :param int pages_per_step: Full pages to time at each size
+    :param float tolerance: The relative improvement needed to keep going
+
+    .. attribute:: page_size
+
+        The size of the next page
+
+    .. attribute:: best_size
+
+        The size with the best rate measured so far, which later scans can
+        start from
+    """
+
+    def __init__(self, page_size=DEFAULT_PAGE_SIZE, min_page_size=20,
+                 max_page_size=1000, factor=2, pages_per_step=2,
+                 tolerance=0.05):
+        self.min_page_size = min_page_size
+        self.max_page_size = max_page_size
+        self.factor = factor
+        self.pages_per_step = pages_per_step
+        self.tolerance = tolerance
+        self.page_size = self._clamp(page_size)
+        self.reset()
+
+    def reset(self):
+        """ Start tuning again from the current page size """
+        self.settled = False
+        self._direction = 1
+        self._turned = False
+        self._steps = 0
+        self._best_size = self.page_size
+        self._best_rate = None
+        self._clear()
+
+    @property
+    def best_size(self):
+        return self._best_size
+
+    def _clear(self):
+        self._pages = 0
+        self._records = 0
+        self._seconds = 0.0
+
+    def _clamp(self, page_size):
+        return max(self.min_page_size, min(self.max_page_size, page_size))
+
+    def _step(self, page_size):
+        if self._direction > 0:
+            return self._clamp(int(page_size * self.factor))
+        return self._clamp(int(page_size / self.factor))
+
+    def _turn(self):
+        # Head the other way from the best size found so far
+        self._direction = -self._direction
+        self._turned = True
+        return self._step(self._best_size)
+
+    def record(self, records, seconds):
+        """
+        Note how long a page took to fetch and decode.
+
+        Pages shorter than the size asked for, such as the last one, are not
+        used, as they say little about the rate at that size. Only record
+        pages when the size returned is sent with the next request.
+
+        :param int records: The records on the page
+        :param float seconds: The time spent fetching and decoding it
+        :returns: The page size to ask for next
+        """
+        if self.settled or records < self.page_size:
+            return self.page_size
+
+        self._pages += 1
+        self._records += records
+        self._seconds += seconds
+        if self._pages < self.pages_per_step:
+            return self.page_size
+
+        rate = self._records / max(self._seconds, 1e-9)
+        self._clear()
+
+        if (self._best_rate is None or
+                rate > self._best_rate * (1 + self.tolerance)):
+            self._best_rate = rate
+            self._best_size = self.page_size
+            size = self._step(self.page_size)
+            if size == self.page_size and not self._turned:
+                # Already at a limit, so there is only the other way to go
+                size = self._turn()
+        elif self._steps == 1 and not self._turned:
+            # The first step made things worse, so try the other way
+            size = self._turn()
+        else:
+            size = self._best_size
+
+        self._steps += 1
+        if size == self.page_size or size == self._best_size:
+            self.settled = True
+        self.page_size = size
+        return size
+
+
+class Page(object):
+    """
+    A page of records from :meth:`ListResource.iter_pages`. Iterating over
+    it yields its records.
+
+    .. attribute:: records
+
+        The records on this page, loaded as :meth:`ListResource.iter` would
+
+    .. attribute:: cursor
+
+        A short string locating the next page, or None on the last page.
+        Save it, and pass it to ``iter_pages`` or ``iter`` as
+        ``resume_from`` to carry on from the next page later.
+
+    .. attribute:: meta
+
+        The paging information the API returned with the page, such as
+        ``page`` and ``page_size``
+    """
+
+    def __init__(self, records, cursor, meta):
+        self.records = records
+        self.cursor = cursor
+        self.meta = meta
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __repr__(self):
+        return '<Page of %d records, next %r>' % (len(self.records),
+                                                  self.cursor)
+
+
+class PagedSequence(object):
+    """
+    A read-only sequence of every record of a list resource, which fetches
+    only the pages holding the records that are read. The most recently
+    read pages are kept, so reading nearby records costs no requests.
+
+    .. code-block:: python
+
+        calls = client.calls.sequence(status='completed')
+        print len(calls)
+        recent = calls[5000:5050]
+
+    :param fetch: Called with a page number and size, returning the
+        records on that page and the page as the API returned it
+    :param int page_size: The size of the pages to fetch
+    :param int cache_pages: The number of pages to keep
+    """
+
+    def __init__(self, fetch, page_size=DEFAULT_PAGE_SIZE, cache_pages=8):
+        self.fetch = fetch
+        self.page_size = page_size
+        self.cache_pages = cache_pages
+        self._pages = OrderedDict()
+        self._total = None
+
+    def page(self, number):
+        """ Return the records on a page, fetching it if needed """
+        records = self._pages.pop(number, None)
+        if records is None:
+            records, meta = self.fetch(number, self.page_size)
+            if meta.get('total') is not None:
+                self._total = int(meta['total'])
+            elif (records or number == 0) and len(records) < self.page_size:
+                # A short page is the last one, while an empty page may lie
+                # anywhere past the end
+                total = number * self.page_size + len(records)
+                if self._total is None or total < self._total:
+                    self._total = total
+            if len(self._pages) >= self.cache_pages:
+                self._pages.popitem(last=False)
+        self._pages[number] = records
+        return records
+
+    def __len__(self):
+        if self._total is None:
+            self.page(0)
+        if self._total is None:
+            raise TwilioException("The API did not report a total for "
+                                  "this list")
+        return self._total
+
+    def _record(self, index):
+        if self._total is not None and index >= self._total:
+            raise IndexError("list index out of range")
+        number, offset = divmod(index, self.page_size)
+        records = self.page(number)
+        if offset >= len(records):
+            raise IndexError("list index out of range")
+        return records[offset]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._slice(index)
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError("list index out of range")
+        return self._record(index)
+
+    def _slice(self, index):
+        start, stop, step = index.start, index.stop, index.step
+        if ((step or 1) < 0 or stop is None or stop < 0 or
+                (start or 0) < 0):
+            start, stop, step = index.indices(len(self))
+        else:
+            start, step = start or 0, step or 1
+            if self._total is not None:
+                stop = min(stop, self._total)
+
+        records = []
+        for i in range(start, stop, step):
+            try:
+                records.append(self._record(i))
+            except IndexError:
+                break
+        return records
+
+    def __iter__(self):
+        number = 0
+        while True:
+            records = self.page(number)
+            for record in records:
+                yield record
+            number += 1
+            if (len(records) < self.page_size or self._total is not None and
+                    number * self.page_size >= self._total):
+                return
+
+    def sample(self, n, pages=None, rng=random):
+        """
+        Return about n records drawn from a few random pages, to estimate
+        statistics of a long list without reading all of it.
+
+        Records on one page are usually close together in time, so spreading
+        the sample over more pages makes it more representative, at the cost
+        of more requests.
+
+        :param int n: The number of records to return
+        :param int pages: The number of pages to draw from, by default as
+            few as hold n records. More are read if they fall short.
+        :param rng: The :mod:`random` compatible generator to use
+        """
+        total = len(self)
+        page_count = -(-total // self.page_size)
+        if pages is None:
+            pages = -(-n // self.page_size)
+        pages = min(max(pages, 1), page_count)
+
+        records = []
+        drawn = set()
+        for number in rng.sample(range(page_count), pages):
+            drawn.add(number)
+            records.extend(self.page(number))
+        # Short pages, or records filtered out, call for a few more
+        while len(records) < n and len(drawn) < page_count:
+            number = rng.randrange(page_count)
+            if number not in drawn:
+                drawn.add(number)
+                records.extend(self.page(number))
+        return rng.sample(records, min(n, len(records)))
+
+    def estimate(self, predicate, n=500, pages=None, rng=random):
+        """
+        Estimate how many records of the list match predicate, from a
+        :meth:`sample` of n records.
+
+        :returns: The estimated count, as a float
+        """
+        records = self.sample(n, pages, rng)
+        if not records:
+            return 0.0
+        matches = sum(1 for record in records if predicate(record))
+        return float(matches) / len(records) * len(self)
@@ -201,6 +201,11 @@ class PhoneNumber(InstanceResource):
    .. attribute:: beta
 
       (boolean) Phone numbers new to the Twilio platform are marked as beta.
+
+   .. attribute:: capabilities
+
+      A dictionary of the kinds of messages and calls this phone number
+      supports, such as ``voice`` and ``sms``.
     """
 
     def load(self, entries):
@@ -212,11 +217,16 @@ class PhoneNumber(InstanceResource):
             uri = re.sub(r'AC(.*)', entries["account_sid"],
                          self.parent.base_uri)
 
-            self.parent = PhoneNumbers(
-                uri,
-                self.parent.auth,
-                self.parent.timeout
-            )
+            if getattr(self.parent, 'compact_instances', False) is True:
+                # Compact numbers share the parent's context, so they share
+                # one parent per account rather than each making its own
+                self.parent = self.parent._account_parent(uri)
+            else:
+                self.parent = PhoneNumbers(
+                    uri,
+                    self.parent.auth,
+                    self.parent.timeout
+                )
             self.base_uri = self.parent.uri
 
         super(PhoneNumber, self).load(entries)
@@ -262,6 +272,23 @@ class PhoneNumbers(ListResource):
         self.available_phone_numbers = \
             AvailablePhoneNumbers(base_uri, auth, timeout, self)
 
+    def _account_parent(self, base_uri):
+        """
+        The PhoneNumbers of the account at base_uri, kept for the compact
+        numbers loaded through this resource
+        """
+        if base_uri == self.base_uri:
+            return self
+        parents = self.__dict__.get('_account_parents')
+        if parents is None:
+            parents = self._account_parents = {}
+        parent = parents.get(base_uri)
+        if parent is None:
+            parent = parents[base_uri] = PhoneNumbers(base_uri, self.auth,
+                                                      self.timeout)
+            parent.compact_instances = True
+        return parent
+
     def delete(self, sid):
         """
         Release this phone number from your account. Twilio will no longer
@@ -0,0 +1,463 @@
+import sys
+import threading
+from timeit import default_timer
+
+from six import reraise
+from six.moves import queue
+
+from ...exceptions import TwilioException
+
+# How often blocked threads check whether their pool has stopped
+_POLL = 0.1
+# Fetching a source item for longer than this sends on those before it
+_SLOW = 0.001
+
+_DONE = object()
+
+
+class _Stopped(Exception):
+    pass
+
+
+def _poll(stop, call):
+    """
+    Make a blocking queue call, giving up with :class:`_Stopped` once the
+    event stop is set
+    """
+    while True:
+        if stop.is_set():
+            raise _Stopped()
+        try:
+            return call(timeout=_POLL)
+        except (queue.Empty, queue.Full):
+            pass
+
+
+class Stage(object):
+    """
+    One step of a :class:`Pipeline`, with counters for how it is keeping up.
+
+    .. attribute:: name
+
+        The name shown in :meth:`Pipeline.report`
+
+    .. attribute:: workers
+
+        The number of threads running the stage
+
+    .. attribute:: received
+
+        The items taken from the stage before
+
+    .. attribute:: emitted
+
+        The items passed on to the stage after
+
+    .. attribute:: busy
+
+        Seconds spent in the stage's function, summed over its workers. For
+        the source, this is the time spent fetching records.
+
+    .. attribute:: peak_depth
+
+        The most items seen waiting in the queue after the stage
+    """
+
+    def __init__(self, name, run, workers=1, buffer=100, chunk=32):
+        self.name = name
+        self.workers = workers
+        self.chunk = max(min(chunk, buffer), 1)
+        self.output = queue.Queue(max(buffer // self.chunk, 1))
+        self.received = 0
+        self.emitted = 0
+        self.busy = 0.0
+        self.depth = 0
+        self.peak_depth = 0
+        self.started = None
+        self.finished = None
+        self._run = run
+        self._lock = threading.Lock()
+
+    def _queued(self, count):
+        with self._lock:
+            self.depth += count
+            if self.depth > self.peak_depth:
+                self.peak_depth = self.depth
+
+    @property
+    def elapsed(self):
+        """ Seconds since the stage started, until it finished """
+        if self.started is None:
+            return 0.0
+        return (self.finished or default_timer()) - self.started
+
+    @property
+    def rate(self):
+        """ Items emitted per second """
+        return self.emitted / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def utilization(self):
+        """
+        The fraction of the time its workers spent working. A stage near 1
+        is the bottleneck, and the stages before it wait on its queue.
+        """
+        if not self.elapsed:
+            return 0.0
+        return min(self.busy / (self.elapsed * self.workers), 1.0)
+
+    def __repr__(self):
+        return '<Stage %s: %d in, %d out, %d queued>' % (
+            self.name, self.received, self.emitted, self.depth)
+
+
+class Pipeline(object):
+    """
+    Runs records from an iterator, such as :meth:`ListResource.iter`,
+    through a chain of stages, each in its own thread.
+
+    Stages pass items through bounded queues, so a slow stage holds up the
+    ones before it rather than letting items pile up in memory. When the
+    stage after the source falls behind, the source stops fetching pages
+    until it catches up. Items move between stages in chunks, which are
+    sent early whenever a stage runs out of work, so that handing items
+    between threads costs little more than a plain loop.
+
+    .. code-block:: python
+
+        pipeline = (client.recordings.pipeline()
+                    .filter(lambda r: int(r.duration) > 60)
+                    .parallel_map(fetch_transcription, workers=8)
+                    .batch(100))
+        pipeline.run(write_rows)
+        print pipeline.report()
+
+    An exception in any stage stops the pipeline, and is raised where it is
+    being read. A pipeline runs once.
+
+    :param source: The iterable of records to run through the stages
+    :param str name: The name of the source stage
+    :param int buffer: The largest number of items waiting between two
+        stages, unless a stage is given its own
+    :param int chunk: The most items to send between stages at once
+    """
+
+    def __init__(self, source, name='source', buffer=100, chunk=32):
+        self.buffer = buffer
+        self.chunk = chunk
+        self.stages = []
+        self._stop = threading.Event()
+        self._error = None
+        self._threads = []
+        self._read = False
+        self._add(name, self._produce(source), 1, buffer)
+
+    def _add(self, name, run, workers, buffer):
+        self.stages.append(Stage(name, run, workers,
+                                 self.buffer if buffer is None else buffer,
+                                 self.chunk))
+        return self
+
+    def map(self, func, name=None, buffer=None):
+        """ Pass on func(item) for each item """
+        def run(stage, get, emit, flush):
+            for item in get():
+                start = default_timer()
+                result = func(item)
+                stage.busy += default_timer() - start
+                emit(result)
+        return self._add(name or _name(func, 'map'), run, 1, buffer)
+
+    def filter(self, predicate, name=None, buffer=None):
+        """ Pass on the items for which predicate(item) is true """
+        def run(stage, get, emit, flush):
+            for item in get():
+                start = default_timer()
+                keep = predicate(item)
+                stage.busy += default_timer() - start
+                if keep:
+                    emit(item)
+        return self._add(name or _name(predicate, 'filter'), run, 1, buffer)
+
+    def batch(self, size, name=None, buffer=None):
+        """ Pass on lists of size items, and then any left over """
+        def run(stage, get, emit, flush):
+            items = []
+            for item in get():
+                items.append(item)
+                if len(items) >= size:
+                    emit(items)
+                    items = []
+            if items:
+                emit(items)
+        return self._add(name or 'batch(%d)' % size, run, 1, buffer)
+
+    def parallel_map(self, func, workers=4, ordered=True, name=None,
+                     buffer=None):
+        """
+        Pass on func(item) for each item, calling func from several threads
+        at once. Use this for stages which wait on the network, such as
+        fetching a subresource of each record.
+
+        :param int workers: The number of threads calling func
+        :param bool ordered: Keep the items in the order they arrived. A
+            slow item then holds up those after it, up to ``2 * workers``
+            items.
+        """
+        run = _ordered_map(func, workers) if ordered else \
+            _unordered_map(func, workers)
+        return self._add(name or _name(func, 'parallel_map'), run, workers,
+                         buffer)
+
+    def start(self):
+        """ Start the stages' threads, if they haven't been already """
+        if self._threads:
+            return
+        upstream = None
+        for stage in self.stages:
+            thread = threading.Thread(target=self._work,
+                                      args=(stage, upstream),
+                                      name='pipeline %s' % stage.name)
+            thread.daemon = True
+            self._threads.append(thread)
+            upstream = stage
+        for thread in self._threads:
+            thread.start()
+
+    def __iter__(self):
+        if self._read:
+            raise TwilioException("A pipeline can only be run once")
+        self._read = True
+        return self._results()
+
+    def _results(self):
+        self.start()
+        try:
+            for item in self._get(None, self.stages[-1]):
+                yield item
+        except _Stopped:
+            pass
+        finally:
+            self._stop.set()
+        if self._error is not None:
+            reraise(*self._error)
+
+    def run(self, sink=None):
+        """
+        Run the pipeline to the end, passing each item it produces to sink,
+        and return its stages.
+
+        :param sink: A function, or an object with a ``write`` method, to
+            call with each item in this thread
+        """
+        write = getattr(sink, 'write', sink)
+        for item in self:
+            if write is not None:
+                write(item)
+        return self.stages
+
+    def stop(self):
+        """ Stop every stage, leaving items still in the queues """
+        self._stop.set()
+
+    def report(self):
+        """ Describe the throughput and queue depth of each stage """
+        lines = ['%-24s %7s %9s %9s %9s %6s %11s' % (
+            'stage', 'workers', 'in', 'out', 'per sec', 'busy', 'queued')]
+        for stage in self.stages:
+            lines.append('%-24s %7d %9d %9d %9.1f %5.0f%% %5d/%-5d' % (
+                stage.name[:24], stage.workers, stage.received,
+                stage.emitted, stage.rate, stage.utilization * 100,
+                stage.depth, stage.peak_depth))
+        return '\n'.join(lines)
+
+    def _work(self, stage, upstream):
+        stage.started = default_timer()
+        chunk = []
+
+        def flush():
+            if chunk:
+                self._put(stage, chunk[:])
+                del chunk[:]
+
+        def get(idle=True):
+            # Send on what is done before waiting for more
+            return self._get(stage, upstream, flush if idle else None)
+
+        def emit(item):
+            chunk.append(item)
+            stage.emitted += 1
+            if len(chunk) >= stage.chunk:
+                flush()
+
+        try:
+            stage._run(stage, get, emit, flush)
+            flush()
+            stage.finished = default_timer()
+            self._put(stage, _DONE)
+        except _Stopped:
+            pass
+        except Exception:
+            self._fail(sys.exc_info())
+        finally:
+            stage.finished = stage.finished or default_timer()
+
+    def _produce(self, source):
+        def run(stage, get, emit, flush):
+            items = iter(source)
+            while True:
+                start = default_timer()
+                try:
+                    item = next(items)
+                except StopIteration:
+                    return
+                finally:
+                    took = default_timer() - start
+                    stage.busy += took
+                if took > _SLOW:
+                    # Likely a page fetch, which those before it waited on
+                    flush()
+                emit(item)
+        return run
+
+    def _fail(self, exc_info):
+        if self._error is None:
+            self._error = exc_info
+        self._stop.set()
+
+    def _put(self, stage, chunk):
+        _poll(self._stop,
+              lambda timeout: stage.output.put(chunk, timeout=timeout))
+        if chunk is not _DONE:
+            stage._queued(len(chunk))
+
+    def _get(self, stage, upstream, idle=None):
+        chunks = upstream.output
+        while True:
+            try:
+                chunk = chunks.get_nowait()
+            except queue.Empty:
+                if idle is not None:
+                    idle()
+                chunk = _poll(self._stop, chunks.get)
+            if chunk is _DONE:
+                return
+            upstream._queued(-len(chunk))
+            if stage is not None:
+                stage.received += len(chunk)
+            for item in chunk:
+                yield item
+
+
+def _name(func, default):
+    return getattr(func, '__name__', default).replace('<lambda>', default)
+
+
+def _unordered_map(func, workers):
+    def run(stage, get, emit, flush):
+        lock = threading.Lock()
+        items = get()
+        failed = []
+
+        def work():
+            try:
+                while not failed:
+                    with lock:
+                        try:
+                            item = next(items)
+                        except StopIteration:
+                            return
+                    start = default_timer()
+                    result = func(item)
+                    with lock:
+                        stage.busy += default_timer() - start
+                        emit(result)
+            except BaseException:
+                failed.append(sys.exc_info())
+
+        _join(work, workers)
+        if failed:
+            reraise(*failed[0])
+    return run
+
+
+class _Slot(object):
+
+    def __init__(self, item):
+        self.item = item
+        self.done = threading.Event()
+        self.result = None
+
+
+def _ordered_map(func, workers):
+    def run(stage, get, emit, flush):
+        # Workers fill in slots, which are passed on in the order they were
+        # taken, and no more than 2 * workers are in flight at once
+        lock = threading.Lock()
+        items = get(idle=False)
+        pending = queue.Queue(2 * workers)
+        failed = []
+
+        def work():
+            try:
+                while not failed:
+                    with lock:
+                        try:
+                            slot = _Slot(next(items))
+                        except StopIteration:
+                            return
+                        while not failed:
+                            try:
+                                pending.put(slot, timeout=_POLL)
+                                break
+                            except queue.Full:
+                                pass
+                    start = default_timer()
+                    slot.result = func(slot.item)
+                    slot.done.set()
+                    # Another worker may hold the lock until this slot is
+                    # passed on, so only take it once the slot is done
+                    with lock:
+                        stage.busy += default_timer() - start
+            except BaseException:
+                failed.append(sys.exc_info())
+
+        threads = _start(work, workers)
+        try:
+            while any(t.is_alive() for t in threads) or not pending.empty():
+                try:
+                    slot = pending.get_nowait()
+                except queue.Empty:
+                    flush()
+                    try:
+                        slot = pending.get(timeout=_POLL)
+                    except queue.Empty:
+                        continue
+                if not slot.done.is_set():
+                    flush()
+                while not slot.done.wait(_POLL):
+                    if failed:
+                        break
+                if failed:
+                    break
+                emit(slot.result)
+        except BaseException:
+            failed.append(sys.exc_info())
+        for thread in threads:
+            thread.join()
+        if failed:
+            reraise(*failed[0])
+    return run
+
+
+def _start(work, workers):
+    threads = [threading.Thread(target=work) for _ in range(workers)]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    return threads
+
+
+def _join(work, workers):
+    for thread in _start(work, workers):
+        thread.join()
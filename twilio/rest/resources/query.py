@@ -0,0 +1,251 @@
+import datetime
+import operator
+
+from six import integer_types, iteritems, string_types
+
+from ...exceptions import TwilioException
+from .util import convert_keys, parse_date
+
+OPERATORS = {
+    'eq': (operator.eq, '=='),
+    'ne': (operator.ne, '!='),
+    'lt': (operator.lt, '<'),
+    'lte': (operator.le, '<='),
+    'gt': (operator.gt, '>'),
+    'gte': (operator.ge, '>='),
+    'in': (lambda a, b: a in b, 'in'),
+    'contains': (lambda a, b: b in a, 'contains'),
+}
+
+# Date filters are inclusive and only accurate to the day
+_INCLUSIVE = ('eq', 'gte', 'lte')
+
+
+def date_range(name):
+    """
+    The filters of a date field the API takes as ``name``, ``name_after``
+    and ``name_before`` keywords
+    """
+    return {
+        'eq': name,
+        'gte': name + '_after',
+        'gt': name + '_after',
+        'lte': name + '_before',
+        'lt': name + '_before',
+    }
+
+
+def _is_date_range(filters):
+    return 'gt' in filters
+
+
+def _naive(date):
+    if date.tzinfo is not None:
+        date = date.replace(tzinfo=None) - date.utcoffset()
+    return date
+
+
+class Predicate(object):
+    """
+    A test of one field, written as a keyword like ``status='completed'`` or
+    ``start_time__gte=date``
+
+    :param str lookup: The field name, optionally followed by ``__`` and
+        one of the :data:`OPERATORS`
+    :param value: The value to compare the field with
+    """
+
+    def __init__(self, lookup, value):
+        field, sep, op = lookup.rpartition('__')
+        if not sep:
+            field, op = lookup, 'eq'
+        if op not in OPERATORS:
+            raise TwilioException("Unknown operator %r in %r" % (op, lookup))
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def key(self):
+        """ The key of the field in a decoded record """
+        return 'from' if self.field == 'from_' else self.field
+
+    def matches(self, record, parse_date):
+        """
+        Return whether a record, as an instance resource or a decoded dict,
+        passes the test. Strings the API returns for dates and numbers are
+        converted to the type of the value first.
+        """
+        if isinstance(record, dict):
+            actual = record.get(self.key())
+        else:
+            actual = getattr(record, self.field, None)
+        if actual is None:
+            return self.op == 'ne' and self.value is not None
+
+        expected = self.value
+        try:
+            if isinstance(expected, datetime.date):
+                if isinstance(actual, string_types):
+                    actual = parse_date(actual)
+                    if not isinstance(actual, datetime.datetime):
+                        return False
+                if isinstance(expected, datetime.datetime):
+                    actual, expected = _naive(actual), _naive(expected)
+                elif isinstance(actual, datetime.datetime):
+                    actual = actual.date()
+            elif (isinstance(expected, integer_types + (float, )) and
+                    isinstance(actual, string_types)):
+                actual = float(actual)
+        except ValueError:
+            return False
+        return OPERATORS[self.op][0](actual, expected)
+
+    def __str__(self):
+        return '%s %s %r' % (self.field, OPERATORS[self.op][1], self.value)
+
+    def __repr__(self):
+        return '<Predicate %s>' % self
+
+
+class Query(object):
+    """
+    A filtered view of a list resource, built with
+    :meth:`ListResource.where`.
+
+    Predicates the endpoint can filter on, listed in the resource's
+    ``query_filters``, are sent as request parameters, so the API only
+    returns matching records. The rest are applied to the records as they
+    arrive. Date filters only work to the day, so a predicate on a datetime
+    is sent as a filter on its day and also checked on each record.
+
+    .. code-block:: python
+
+        query = client.calls.where(status='completed', started__gte=day,
+                                   duration__gt=60)
+        print query.explain()
+        for call in query:
+            print call.sid
+
+    :param resource: The :class:`ListResource` to query
+    :param iterate: The ``iter`` of the resource's base class, taking the
+        request parameters as they are sent
+    :param parse_date: Parses date strings in decoded records
+    """
+
+    def __init__(self, resource, iterate, parse_date, predicates=()):
+        self.resource = resource
+        self._iterate = iterate
+        self._parse_date = parse_date
+        self.predicates = tuple(predicates)
+
+    def where(self, **predicates):
+        """ Return a new query which also tests these predicates """
+        aliases = self.resource.query_aliases
+        added = [Predicate(self._resolve(lookup, aliases), value)
+                 for lookup, value in sorted(iteritems(predicates))]
+        return Query(self.resource, self._iterate, self._parse_date,
+                     self.predicates + tuple(added))
+
+    def _resolve(self, lookup, aliases):
+        field, sep, op = lookup.rpartition('__')
+        if not sep:
+            return aliases.get(lookup, lookup)
+        return aliases.get(field, field) + sep + op
+
+    def compile(self):
+        """
+        Split the predicates into request parameters and the predicates
+        left to check on each record.
+
+        :returns: A tuple of the parameters, keyed by their names on the
+            wire, and the list of remaining :class:`Predicate`
+        """
+        filters = self.resource.query_filters
+        keywords = {}
+        residual = []
+        for predicate in self.predicates:
+            field_filters = filters.get(predicate.field, {})
+            keyword = field_filters.get(predicate.op)
+            value = predicate.value
+            if keyword is None or keyword in keywords:
+                residual.append(predicate)
+                continue
+
+            if _is_date_range(field_filters):
+                if isinstance(value, string_types):
+                    try:
+                        value = datetime.datetime.strptime(
+                            value, '%Y-%m-%d').date()
+                    except ValueError:
+                        residual.append(predicate)
+                        continue
+                    predicate = Predicate(
+                        predicate.field + '__' + predicate.op, value)
+                if not isinstance(value, datetime.date):
+                    residual.append(predicate)
+                    continue
+                if isinstance(value, datetime.datetime):
+                    # The API's days are UTC days
+                    value = _naive(value)
+                    residual.append(predicate)
+                elif predicate.op not in _INCLUSIVE:
+                    # The day filter lets through more than the predicate
+                    residual.append(predicate)
+                value = parse_date(value)
+
+            keywords[keyword] = value
+        return convert_keys(keywords), residual
+
+    def explain(self):
+        """
+        Describe how the query runs: the parameters sent with each request,
+        and the predicates checked on each record
+        """
+        params, residual = self.compile()
+        sent = ', '.join('%s=%s' % item for item in sorted(iteritems(params)))
+        checked = ', '.join(str(p) for p in residual)
+        return 'GET %s\n  filtered by the API: %s\n  filtered here: %s' % (
+            self.resource.uri, sent or 'nothing', checked or 'nothing')
+
+    def iter(self, limit=None, fields=None, **kwargs):
+        """
+        Return the matching instance resources using an iterator. Takes the
+        arguments of :meth:`ListResource.iter`.
+        """
+        params, residual = self.compile()
+        kwargs.update(params)
+        if not residual:
+            return self._iterate(self.resource, limit=limit, fields=fields,
+                                 **kwargs)
+
+        if fields is not None:
+            fields = tuple(fields) + tuple(p.key() for p in residual)
+        records = self._iterate(self.resource, fields=fields, **kwargs)
+        return self._filter(records, residual, limit)
+
+    def _filter(self, records, residual, limit):
+        if limit is not None and limit <= 0:
+            return
+        parse = self._parse_date
+        for record in records:
+            for predicate in residual:
+                if not predicate.matches(record, parse):
+                    break
+            else:
+                yield record
+                if limit is not None:
+                    limit -= 1
+                    if not limit:
+                        return
+
+    def __iter__(self):
+        return self.iter()
+
+    def list(self, limit=None, **kwargs):
+        """ Return up to limit matching instance resources as a list """
+        return list(self.iter(limit=limit, **kwargs))
+
+    def __repr__(self):
+        return '<Query %s where %s>' % (
+            self.resource.__class__.__name__,
+            ' and '.join(str(p) for p in self.predicates) or 'anything')
@@ -1,3 +1,4 @@
+from .query import date_range
 from .util import normalize_dates
 
 from .transcriptions import Transcriptions
@@ -26,9 +27,20 @@ class Recordings(ListResource):
 
     name = "Recordings"
     instance = Recording
+    query_filters = {
+        'call_sid': {'eq': 'call_sid'},
+        'date_created': date_range('date_created'),
+    }
+    query_aliases = {'created': 'date_created'}
 
     @normalize_dates
-    def list(self, before=None, after=None, **kwargs):
+    def _filters(self, before=None, after=None, **kwargs):
+        """ Map the filters of the list and iter methods to API parameters """
+        kwargs["DateCreated<"] = before
+        kwargs["DateCreated>"] = after
+        return kwargs
+
+    def list(self, *args, **kwargs):
         """
         Returns a page of :class:`Recording` resources as a list.
         For paging information see :class:`ListResource`.
@@ -37,22 +49,43 @@ class Recordings(ListResource):
         :param date before: Only list recordings logger before this datetime
         :param call_sid: Only list recordings from this :class:`Call`
         """
-        kwargs["DateCreated<"] = before
-        kwargs["DateCreated>"] = after
-        return self.get_instances(kwargs)
+        return self.get_instances(self._filters(*args, **kwargs))
 
-    @normalize_dates
-    def iter(self, before=None, after=None, **kwargs):
+    def iter(self, *args, **kwargs):
         """
         Returns an iterator of :class:`Recording` resources.
 
         :param date after: Only list recordings logged after this datetime
         :param date before: Only list recordings logger before this datetime
+        :param int limit: Stop after this many recordings
         """
-        kwargs["DateCreated<"] = before
-        kwargs["DateCreated>"] = after
+        kwargs = self._filters(*args, **kwargs)
         return super(Recordings, self).iter(**kwargs)
 
+    def iter_pages(self, *args, **kwargs):
+        """
+        Returns an iterator of pages of :class:`Recording` resources. See
+        :meth:`ListResource.iter_pages`.
+
+        :param date after: Only list recordings logged after this datetime
+        :param date before: Only list recordings logger before this datetime
+        :param str resume_from: A page cursor to carry on from
+        """
+        kwargs = self._filters(*args, **kwargs)
+        return super(Recordings, self).iter_pages(**kwargs)
+
+    def sequence(self, *args, **kwargs):
+        """
+        Returns a lazy sequence of :class:`Recording` resources, reading
+        only the pages it needs. See :meth:`ListResource.sequence`.
+
+        :param date after: Only list recordings logged after this datetime
+        :param date before: Only list recordings logger before this datetime
+        :param int page_size: The size of the pages to fetch
+        """
+        kwargs = self._filters(*args, **kwargs)
+        return super(Recordings, self).sequence(**kwargs)
+
     def delete(self, sid):
         """
         Delete the given recording
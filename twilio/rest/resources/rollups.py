@@ -0,0 +1,407 @@
+import datetime
+import math
+
+from six import iteritems, string_types
+
+from ...exceptions import TwilioException
+from .columns import epoch_seconds
+from .util import parse_api_date, record_field
+
+ROLLUP_VERSION = 1
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+class QuantileSketch(object):
+    """
+    A KLL sketch of a stream of numbers, answering quantile queries to
+    within about ``1.7 / k`` of the true rank in a few times k values of
+    memory, however long the stream.
+
+    Values go into a stack of compactors. When a compactor fills up, it is
+    sorted and every other value moves up to the next one, where each value
+    stands for twice as many. Sketches of separate streams merge into a
+    sketch of both.
+
+    :param int k: The capacity of the largest compactor. Larger is more
+        accurate and uses more memory.
+    """
+
+    def __init__(self, k=200):
+        self.k = k
+        self.count = 0
+        self.min = None
+        self.max = None
+        self.compactors = [[]]
+        # Which half of a compactor to keep next, alternating so that the
+        # error evens out without a random generator
+        self._offsets = [0]
+        self._size = 0
+        self._limit = self._capacity(0)
+
+    def _capacity(self, height):
+        depth = len(self.compactors) - height - 1
+        return int(math.ceil(self.k * (2.0 / 3) ** depth)) + 1
+
+    def _grow(self):
+        self.compactors.append([])
+        self._offsets.append(0)
+        self._limit = sum(self._capacity(h)
+                          for h in range(len(self.compactors)))
+
+    def add(self, value):
+        """ Add a value to the sketch """
+        self.compactors[0].append(value)
+        self.count += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self._size += 1
+        if self._size >= self._limit:
+            self._compress()
+
+    def _compress(self):
+        while self._size >= self._limit:
+            for height, items in enumerate(self.compactors):
+                if len(items) >= self._capacity(height):
+                    if height + 1 == len(self.compactors):
+                        self._grow()
+                    items.sort()
+                    # An odd value out stays behind at this level
+                    left = items[len(items) - len(items) % 2:]
+                    offset = self._offsets[height]
+                    self._offsets[height] = 1 - offset
+                    kept = items[offset:len(items) - len(left):2]
+                    self.compactors[height + 1].extend(kept)
+                    self.compactors[height] = left
+                    self._size -= len(items) - len(kept) - len(left)
+                    break
+
+    def merge(self, other):
+        """ Add the values summarized by another sketch to this one """
+        if other.count == 0:
+            return self
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for height, items in enumerate(other.compactors):
+            self.compactors[height].extend(items)
+            self._size += len(items)
+        self.count += other.count
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+        self._compress()
+        return self
+
+    def _weighted(self):
+        items = []
+        for height, values in enumerate(self.compactors):
+            weight = 1 << height
+            items.extend((value, weight) for value in values)
+        items.sort()
+        return items
+
+    def quantile(self, q):
+        """
+        Return an estimate of the value with a fraction q of the values
+        below it, or None if the sketch is empty
+        """
+        if not self.count:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        items = self._weighted()
+        target = q * sum(weight for _, weight in items)
+        seen = 0
+        for value, weight in items:
+            seen += weight
+            if seen >= target:
+                return value
+        return self.max
+
+    def rank(self, value):
+        """ Return an estimate of the fraction of values below value """
+        items = self._weighted()
+        total = sum(weight for _, weight in items)
+        if not total:
+            return 0.0
+        below = sum(weight for v, weight in items if v < value)
+        return float(below) / total
+
+    def to_dict(self):
+        return {
+            'k': self.k,
+            'count': self.count,
+            'min': self.min,
+            'max': self.max,
+            'compactors': [list(c) for c in self.compactors],
+            'offsets': list(self._offsets),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['k'])
+        sketch.count = data['count']
+        sketch.min = data['min']
+        sketch.max = data['max']
+        for _ in range(len(data['compactors']) - 1):
+            sketch._grow()
+        sketch.compactors = [list(c) for c in data['compactors']]
+        sketch._offsets = list(data['offsets'])
+        sketch._size = sum(len(c) for c in sketch.compactors)
+        return sketch
+
+
+class Summary(object):
+    """
+    The count, sum, extremes and distribution of a metric within one time
+    bucket and group of a :class:`Rollup`
+
+    :param int k: The accuracy of the quantile sketch
+    """
+
+    def __init__(self, k=200):
+        self.count = 0
+        self.sum = 0.0
+        self.sketch = QuantileSketch(k)
+
+    def add(self, value):
+        self.count += 1
+        self.sum += value
+        self.sketch.add(value)
+
+    def merge(self, other):
+        self.count += other.count
+        self.sum += other.sum
+        self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else None
+
+    @property
+    def min(self):
+        return self.sketch.min
+
+    @property
+    def max(self):
+        return self.sketch.max
+
+    def quantile(self, q):
+        """ An estimate of the q quantile, such as 0.95 """
+        return self.sketch.quantile(q)
+
+    def to_dict(self):
+        return {'count': self.count, 'sum': self.sum,
+                'sketch': self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        summary = cls()
+        summary.count = data['count']
+        summary.sum = data['sum']
+        summary.sketch = QuantileSketch.from_dict(data['sketch'])
+        return summary
+
+    def __repr__(self):
+        return '<Summary count=%d mean=%r p50=%r p95=%r>' % (
+            self.count, self.mean, self.quantile(0.5), self.quantile(0.95))
+
+
+def _date(value):
+    if isinstance(value, string_types):
+        return parse_api_date(value)
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        return value.replace(tzinfo=None) - value.utcoffset()
+    return value
+
+
+def elapsed(start, end):
+    """
+    A metric of the seconds between two date fields of a record, such as
+    ``elapsed('date_created', 'date_sent')`` for message latency
+    """
+    def metric(record):
+        first = _date(record_field(record, start))
+        last = _date(record_field(record, end))
+        if first is None or last is None:
+            return None
+        delta = last - first
+        return delta.days * 86400.0 + delta.seconds + delta.microseconds / 1e6
+    return metric
+
+
+class Rollup(object):
+    """
+    Time bucketed summaries of metrics over a stream of records, such as
+    those from ``iter()``, held in bounded memory per bucket and group.
+
+    .. code-block:: python
+
+        rollup = Rollup({'duration': 'duration', 'cost': 'price'},
+                        group_by=['status', 'direction'])
+        rollup.consume(client.calls.iter(raw=True))
+        for (hour, group), metrics in sorted(rollup.results().items()):
+            print hour, group, metrics['duration'].quantile(0.95)
+
+    Rollups of separate shards of a stream, with the same settings, merge
+    into the rollup of the whole stream, and :meth:`to_dict` keeps one for
+    combining later.
+
+    :param dict metrics: Maps the name of each metric to the record field
+        holding its value, or a function returning the value of a record.
+        Records without a value are left out of that metric.
+    :param group_by: The fields to summarize each combination of
+        separately
+    :param str time_field: The date field which places a record in a bucket
+    :param int interval: The length of a bucket, in seconds
+    :param int k: The accuracy of the quantile sketches
+    """
+
+    def __init__(self, metrics, group_by=(), time_field='date_created',
+                 interval=3600, k=200):
+        self.metrics = dict(metrics)
+        self.group_by = tuple(group_by)
+        self.time_field = time_field
+        self.interval = interval
+        self.k = k
+        self.buckets = {}
+        self.skipped = 0
+        self._getters = [(name, self._getter(metric))
+                         for name, metric in sorted(iteritems(self.metrics))]
+
+    def _getter(self, metric):
+        if callable(metric):
+            return metric
+
+        def get(record):
+            value = record_field(record, metric)
+            if value is None:
+                return None
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+        return get
+
+    def _bucket(self, record):
+        value = record_field(record, self.time_field)
+        if isinstance(value, string_types):
+            seconds = epoch_seconds(value)
+            if seconds != seconds:
+                return None
+            seconds = int(seconds)
+        else:
+            date = _date(value)
+            if date is None:
+                return None
+            delta = date - _EPOCH
+            seconds = delta.days * 86400 + delta.seconds
+        return seconds - seconds % self.interval
+
+    def add(self, record):
+        """ Add a record, as an instance resource or a decoded dict """
+        bucket = self._bucket(record)
+        if bucket is None:
+            self.skipped += 1
+            return
+        group = tuple(record_field(record, field) for field in self.group_by)
+        summaries = self.buckets.get((bucket, group))
+        if summaries is None:
+            summaries = self.buckets[(bucket, group)] = {}
+        for name, get in self._getters:
+            value = get(record)
+            if value is None:
+                continue
+            summary = summaries.get(name)
+            if summary is None:
+                summary = summaries[name] = Summary(self.k)
+            summary.add(value)
+
+    def consume(self, records):
+        """ Add every record of an iterable, and return the rollup """
+        add = self.add
+        for record in records:
+            add(record)
+        return self
+
+    def results(self):
+        """
+        Return the summaries, as a dict mapping ``(bucket start, group)`` to
+        a dict mapping each metric name to its :class:`Summary`. The bucket
+        start is a naive UTC datetime, and the group a tuple of the values
+        of the ``group_by`` fields.
+        """
+        return dict(
+            ((_EPOCH + datetime.timedelta(seconds=bucket), group), summaries)
+            for (bucket, group), summaries in iteritems(self.buckets))
+
+    def _settings(self):
+        return (sorted(self.metrics), self.group_by, self.time_field,
+                self.interval)
+
+    def merge(self, other):
+        """
+        Add the summaries of another rollup with the same settings, such as
+        one over another shard of the stream
+        """
+        if other._settings() != self._settings():
+            raise TwilioException("Rollups with different settings can't "
+                                  "be merged")
+        for key, theirs in iteritems(other.buckets):
+            summaries = self.buckets.setdefault(key, {})
+            for name, summary in iteritems(theirs):
+                if name in summaries:
+                    summaries[name].merge(summary)
+                else:
+                    summaries[name] = Summary.from_dict(summary.to_dict())
+        self.skipped += other.skipped
+        return self
+
+    def to_dict(self):
+        """
+        Return the rollup as plain lists and dicts, which can be encoded as
+        JSON and passed to :meth:`from_dict` to merge later. Metrics given
+        as functions are kept by name only.
+        """
+        return {
+            'version': ROLLUP_VERSION,
+            'metrics': sorted(self.metrics),
+            'group_by': list(self.group_by),
+            'time_field': self.time_field,
+            'interval': self.interval,
+            'k': self.k,
+            'skipped': self.skipped,
+            'buckets': [
+                [bucket, list(group),
+                 dict((n, s.to_dict()) for n, s in iteritems(summaries))]
+                for (bucket, group), summaries in iteritems(self.buckets)
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data, metrics=None):
+        """
+        Rebuild a rollup from :meth:`to_dict`.
+
+        :param dict metrics: The metrics, to keep adding records to it
+        """
+        if data.get('version') != ROLLUP_VERSION:
+            raise TwilioException("Unsupported rollup version: %r" %
+                                  data.get('version'))
+        if metrics is None:
+            metrics = dict((name, name) for name in data['metrics'])
+        rollup = cls(metrics, data['group_by'], data['time_field'],
+                     data['interval'], data['k'])
+        if sorted(rollup.metrics) != sorted(data['metrics']):
+            raise TwilioException("The metrics don't match the rollup's")
+        rollup.skipped = data['skipped']
+        for bucket, group, summaries in data['buckets']:
+            rollup.buckets[(bucket, tuple(group))] = dict(
+                (name, Summary.from_dict(summary))
+                for name, summary in iteritems(summaries))
+        return rollup
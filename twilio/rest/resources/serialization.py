@@ -0,0 +1,112 @@
+import datetime
+
+import pytz
+from six import binary_type, indexbytes, int2byte, iteritems
+
+from ...exceptions import TwilioException
+from .connection import Connection
+from .imports import msgpack
+
+MAGIC = b'TWR'
+RECORD_VERSION = 1
+
+_CODECS = {'msgpack': b'm', 'json': b'j'}
+_CONTEXT = ('parent', 'base_uri', 'auth', 'timeout')
+_EPOCH = datetime.datetime(1970, 1, 1)
+_UTC_EPOCH = _EPOCH.replace(tzinfo=pytz.utc)
+
+
+def _record_type(klass):
+    # Compact classes are recorded as the class they were made from
+    if '_slot_names' in klass.__dict__:
+        klass = klass.__mro__[1]
+    return klass.__name__
+
+
+def _encode(codec, payload):
+    if codec == 'msgpack':
+        if msgpack is None:
+            raise TwilioException("msgpack is not installed")
+        return msgpack.packb(payload, use_bin_type=True)
+    if codec == 'json':
+        return Connection.json_codec().dumps(payload).encode('utf-8')
+    raise TwilioException("Unknown record codec: %r" % codec)
+
+
+def _decode(codec, data):
+    if codec == _CODECS['msgpack']:
+        if msgpack is None:
+            raise TwilioException("msgpack is needed to read this record")
+        return msgpack.unpackb(data, raw=False)
+    if codec == _CODECS['json']:
+        return Connection.json_codec().loads(data)
+    raise TwilioException("Unknown record codec: %r" % codec)
+
+
+def dump_record(instance, codec=None):
+    """
+    Encode the data fields of an instance resource as a record.
+
+    The parent, credentials, timeout and any subresources are left out.
+    Dates are kept as microseconds since the epoch, and dates which were
+    never parsed as the strings the API returned.
+
+    :param instance: The :class:`InstanceResource` to encode
+    :param str codec: ``'msgpack'``, or ``'json'`` to use the JSON backend
+        of :class:`Connection`. Defaults to msgpack when it is installed.
+    :returns: The record, as bytes
+    """
+    if codec is None:
+        codec = 'json' if msgpack is None else 'msgpack'
+
+    subresources = instance._subresource_keys()
+    fields = {}
+    dates = {}
+    for key, value in iteritems(instance.__dict__):
+        if key in _CONTEXT or key in subresources:
+            continue
+        if key == '_pending_dates':
+            fields.update(value)
+        elif key.startswith('_'):
+            continue
+        elif isinstance(value, datetime.datetime):
+            utc = value.tzinfo is not None
+            delta = value - (_UTC_EPOCH if utc else _EPOCH)
+            dates[key] = [(delta.days * 86400 + delta.seconds) * 1000000 +
+                          delta.microseconds, utc]
+        else:
+            fields[key] = value
+
+    payload = _encode(codec, [_record_type(instance.__class__), fields, dates])
+    return MAGIC + int2byte(RECORD_VERSION) + _CODECS[codec] + payload
+
+
+def load_record(record, klass, parent):
+    """
+    Build an instance resource from a record made by :func:`dump_record`.
+
+    :param bytes record: The record
+    :param klass: The :class:`InstanceResource` class to build
+    :param parent: The live :class:`ListResource` the instance belongs to
+    :raises: :exc:`~twilio.TwilioException` if the record is not a record of
+        klass, or was written by a newer version
+    """
+    if not isinstance(record, binary_type) or record[:3] != MAGIC:
+        raise TwilioException("Not a resource record")
+
+    version = indexbytes(record, 3)
+    if version != RECORD_VERSION:
+        raise TwilioException("Unsupported record version: %d" % version)
+
+    record_type, fields, dates = _decode(record[4:5], record[5:])
+    if record_type != _record_type(klass):
+        raise TwilioException("Expected a %s record, got %s" % (
+            _record_type(klass), record_type))
+
+    for key, (value, utc) in iteritems(dates):
+        delta = datetime.timedelta(microseconds=value)
+        fields[key] = (_UTC_EPOCH if utc else _EPOCH) + delta
+
+    instance = klass(parent, fields['name'])
+    instance.load(fields)
+    return instance
@@ -0,0 +1,162 @@
+import codecs
+
+from six import text_type
+
+from ...exceptions import TwilioException
+from .imports import json
+
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ',:]}'
+
+# Once this many characters have been consumed, drop them from the buffer
+_COMPACT_THRESHOLD = 64 * 1024
+
+
+class _TextBuffer(object):
+    """
+    A text buffer fed from an iterator of UTF-8 encoded byte chunks. Only
+    the unconsumed tail of the response is kept in memory.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buf = u''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """ Read another chunk. Returns False once the input is exhausted """
+        if self.eof:
+            return False
+
+        if self.pos > _COMPACT_THRESHOLD:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+
+        for chunk in self.chunks:
+            if isinstance(chunk, text_type):
+                text = chunk
+            else:
+                text = self.decoder.decode(chunk)
+            if text:
+                self.buf += text
+                return True
+
+        self.buf += self.decoder.decode(b'', True)
+        self.eof = True
+        return False
+
+    def peek(self):
+        """ Return the next non-whitespace character, or None at EOF """
+        while True:
+            while self.pos < len(self.buf):
+                if self.buf[self.pos] not in _WHITESPACE:
+                    return self.buf[self.pos]
+                self.pos += 1
+            if not self.fill():
+                return None
+
+    def expect(self, chars):
+        c = self.peek()
+        if c is None or c not in chars:
+            raise TwilioException(
+                "Malformed JSON response: expected %r, found %r" % (chars, c)
+            )
+        self.pos += 1
+        return c
+
+    def decode(self, decoder):
+        """ Decode one complete JSON value starting at the next token """
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+            except ValueError:
+                if self.fill():
+                    continue
+                raise
+            # A number at the end of the buffer may have been cut short
+            if ((end < len(self.buf) and self.buf[end] in _DELIMITERS) or
+                    not self.fill()):
+                self.pos = end
+                return value
+
+
+class StreamingPage(object):
+    """
+    A page of a list resource which is decoded incrementally from an
+    iterable of byte chunks, such as an HTTP response body read off the
+    socket.
+
+    Records inside the resource key array are decoded and yielded one at a
+    time by :meth:`records`, so only a single record is held in memory.
+    Every other top level member of the page (``next_page_uri``, ``meta``,
+    ...) is kept and can be read with :meth:`get` once :meth:`records` is
+    exhausted.
+
+    :param chunks: An iterable of bytes making up a JSON object
+    :param str key: The name of the array holding the records. If it is not
+        the array named by ``meta.key`` (NextGen resources), that array is
+        buffered and yielded once the page is complete.
+    """
+
+    def __init__(self, chunks, key=None, decoder=None):
+        self.key = key
+        self.fields = {}
+        self.streamed = None
+        self._buffer = _TextBuffer(chunks)
+        self._decoder = decoder or json.JSONDecoder()
+
+    def _is_record_key(self, name):
+        if self.streamed is not None:
+            return False
+        if self.key is not None and name == self.key:
+            return True
+        meta = self.fields.get('meta')
+        return isinstance(meta, dict) and meta.get('key') == name
+
+    def records(self):
+        """ Yield each record of the page as soon as it has been decoded """
+        buf = self._buffer
+        decoder = self._decoder
+
+        buf.expect('{')
+        if buf.peek() == '}':
+            buf.pos += 1
+        else:
+            while True:
+                name = buf.decode(decoder)
+                buf.expect(':')
+
+                if self._is_record_key(name) and buf.peek() == '[':
+                    buf.pos += 1
+                    self.streamed = name
+                    if buf.peek() == ']':
+                        buf.pos += 1
+                    else:
+                        while True:
+                            yield buf.decode(decoder)
+                            if buf.expect(',]') == ']':
+                                break
+                else:
+                    self.fields[name] = buf.decode(decoder)
+
+                if buf.expect(',}') == '}':
+                    break
+
+        # The records were not in the array we expected to stream, so they
+        # were buffered until ``meta`` told us which array holds them
+        meta = self.fields.get('meta')
+        if self.streamed is None and isinstance(meta, dict):
+            key = meta.get('key')
+            if key in self.fields:
+                self.streamed = key
+                for record in self.fields.pop(key):
+                    yield record
+
+    def get(self, name, default=None):
+        return self.fields.get(name, default)
+
+    def __contains__(self, name):
+        return name == self.streamed or name in self.fields
@@ -39,9 +39,10 @@ class Event(NextGenInstanceResource):
 
     .. attribute:: event_data
 
-        Data about this specific Event.
+        Data about this specific Event. The ``task_attributes`` and
+        ``worker_attributes`` it carries support ``get(key)`` and ``data``.
     """
-    pass
+    json_fields = ('event_data',)
 
 
 class Events(NextGenListResource):
@@ -29,7 +29,8 @@ class Task(NextGenInstanceResource):
     .. attribute:: attributes
 
         The user-defined JSON string describing the custom attributes of
-        this work.
+        this work. Use ``attributes.get(key)`` to read a single attribute, or
+        ``attributes.data`` for all of them.
 
     .. attribute:: age
 
@@ -62,7 +63,16 @@ class Task(NextGenInstanceResource):
     .. attribute:: date_updated
 
         The date this task was last updated, as UTC in ISO 8601 format.
+
+    .. attribute:: timeout
+
+        The number of seconds the task may wait before it is canceled.
+
+    .. attribute:: url
+
+        The absolute URL of this task.
     """
+    json_fields = ('attributes',)
 
     def delete(self):
         """
@@ -37,7 +37,8 @@ class Worker(NextGenInstanceResource):
         Callback URL whenever TaskRouter assigns a :class:`Task` to this
         worker, so you can also use this as a place to store information that
         you'll need when routing a Task to the Worker (for example, the
-        Worker's phone number or Twilio Client name).
+        Worker's phone number or Twilio Client name). Use
+        ``attributes.get(key)`` to read a single attribute.
 
     .. attribute:: available
 
@@ -67,7 +68,12 @@ class Worker(NextGenInstanceResource):
 
         The time of the last change to this worker's activity. Used to
         calculate :class: `Workflow` statistics.
+
+    .. attribute:: url
+
+        The absolute URL of this worker.
     """
+    json_fields = ('attributes',)
     subresources = [
         Statistics,
         Reservations
@@ -1,9 +1,24 @@
 import datetime
+import re
+from collections import namedtuple
 
 from email.utils import parsedate
-from six import iteritems
+from six import binary_type, integer_types, iteritems, string_types, text_type
 import pytz
 
+from ...compat import quote_plus
+
+PARAM_NAME_CACHE_SIZE = 1024
+_param_names = {}
+_filter_names = {}
+_quoted_names = {}
+
+# Values such as callback URLs and sender numbers repeat on every request,
+# and quoting them costs far more than looking them up
+PARAM_VALUE_CACHE_SIZE = 4096
+PARAM_VALUE_MAX_LENGTH = 256
+_quoted_values = {}
+
 
 def transform_params(parameters):
     """
@@ -17,22 +32,32 @@ def transform_params(parameters):
     {"Record": "true", "DateCreated": "2012-01-02"}
     """
     transformed_parameters = {}
+    names = _param_names
 
     for key, value in iteritems(parameters):
+        if value is None:
+            continue
+        name = names.get(key) or format_name(key)
         if isinstance(value, (list, tuple, set)):
             value = [convert_boolean(param) for param in value]
-            transformed_parameters[format_name(key)] = value
-        elif value is not None:
-            transformed_parameters[format_name(key)] = convert_boolean(value)
+        elif value is True or value is False:
+            value = convert_boolean(value)
+        transformed_parameters[name] = value
 
     return transformed_parameters
 
 
 def format_name(word):
-    if word.lower() == word:
-        return convert_case(word)
-    else:
-        return word
+    try:
+        return _param_names[word]
+    except KeyError:
+        pass
+
+    name = convert_case(word) if word.lower() == word else word
+    if len(_param_names) >= PARAM_NAME_CACHE_SIZE:
+        _param_names.clear()
+    _param_names[word] = name
+    return name
 
 
 def parse_date(d):
@@ -48,11 +73,52 @@ def parse_date(d):
         return d
 
 
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+# Parsed timestamps, keyed by the string they came from. Records in the same
+# page often share timestamps, and datetimes are immutable so can be shared.
+DATE_CACHE_SIZE = 4096
+_rfc2822_cache = {}
+_iso_cache = {}
+
+
 def parse_rfc2822_date(s):
     """
     Parses an RFC 2822 date string and returns a time zone naive datetime
     object. All dates returned from Twilio are UTC.
     """
+    if not isinstance(s, string_types):
+        return _parse_rfc2822_date(s)
+
+    try:
+        return _rfc2822_cache[s]
+    except KeyError:
+        pass
+
+    # Twilio always sends "Tue, 15 Feb 2011 04:21:00 +0000", so slice that
+    # directly and only fall back to the general parser for anything else
+    try:
+        if (len(s) == 31 and s[4] == s[7] == s[11] == s[16] == ' ' and
+                s[19] == s[22] == ':'):
+            date = datetime.datetime(
+                int(s[12:16]), _MONTHS[s[8:11]], int(s[5:7]),
+                int(s[17:19]), int(s[20:22]), int(s[23:25]),
+            )
+        else:
+            date = _parse_rfc2822_date(s)
+    except (KeyError, ValueError):
+        date = _parse_rfc2822_date(s)
+
+    if len(_rfc2822_cache) >= DATE_CACHE_SIZE:
+        _rfc2822_cache.clear()
+    _rfc2822_cache[s] = date
+    return date
+
+
+def _parse_rfc2822_date(s):
     date_tuple = parsedate(s)
     if date_tuple is None:
         return None
@@ -66,6 +132,111 @@ def parse_iso_date(s):
     :param s: ISO 8601-formatted string date
     :return: datetime or str
     """
+    if not isinstance(s, string_types):
+        return _parse_iso_date(s)
+
+    try:
+        return _iso_cache[s]
+    except KeyError:
+        pass
+
+    # The fast path covers the "2015-01-01T00:00:00Z" format Twilio sends
+    try:
+        if (len(s) == 20 and s[4] == s[7] == '-' and s[10] == 'T' and
+                s[13] == s[16] == ':' and s[19] == 'Z'):
+            date = datetime.datetime(
+                int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                tzinfo=pytz.utc,
+            )
+        else:
+            date = _parse_iso_date(s)
+    except ValueError:
+        date = _parse_iso_date(s)
+
+    if len(_iso_cache) >= DATE_CACHE_SIZE:
+        _iso_cache.clear()
+    _iso_cache[s] = date
+    return date
+
+
+def record_field(record, name):
+    """
+    Return a field of a record, either an instance resource or the dict
+    the API returned, or None if it is missing
+    """
+    if isinstance(record, dict):
+        return record.get('from' if name == 'from_' else name)
+    return getattr(record, name, None)
+
+
+_MISSING = object()
+
+
+def changed_fields(record, params):
+    """
+    Return the fields of a record, either an instance resource or the dict
+    the API returned, which an update with params would change. Values are
+    compared as :func:`transform_params` sends them, and a field the record
+    doesn't have counts as changed.
+
+    Ex:
+    changed_fields({"voice_url": "http://a", "voice_fallback_url": None},
+                   {"voice_url": "http://a", "voice_fallback_url": "http://b"})
+
+    returns:
+    ["voice_fallback_url"]
+    """
+    sent = transform_params(params)
+    changed = []
+    for key in sorted(params):
+        name = format_name(key)
+        if name not in sent:
+            continue
+        field = key if key.lower() == key else _snake_case(key)
+        if isinstance(record, dict):
+            current = record.get('from' if field == 'from_' else field,
+                                 _MISSING)
+        else:
+            current = getattr(record, field, _MISSING)
+        if current is _MISSING or (
+                _param_text(sent[name]) !=
+                _param_text(transform_params({key: current}).get(name))):
+            changed.append(field)
+    return changed
+
+
+def _snake_case(name):
+    return re.sub(r'(?<=[a-z0-9])([A-Z])', r'_\1', name).lower()
+
+
+def _param_text(value):
+    if value is None:
+        return u''
+    if isinstance(value, list):
+        return [_param_text(v) for v in value]
+    if isinstance(value, binary_type):
+        return value.decode('utf-8')
+    return text_type(value)
+
+
+def parse_api_date(s):
+    """
+    Parses a date string in either format the APIs return, RFC 2822 or
+    ISO 8601, and returns a naive UTC datetime, or None if parsing failed.
+    """
+    if s[3:4] == ',':
+        date = parse_rfc2822_date(s)
+    else:
+        date = parse_iso_date(s)
+    if not isinstance(date, datetime.datetime):
+        return None
+    if date.tzinfo is not None:
+        date = date.replace(tzinfo=None) - date.utcoffset()
+    return date
+
+
+def _parse_iso_date(s):
     format = "%Y-%m-%dT%H:%M:%SZ"
     try:
         return datetime.datetime.strptime(s, format).replace(tzinfo=pytz.utc)
@@ -89,31 +260,101 @@ def convert_case(s):
     return ''.join([a.title() for a in s.split("_") if a])
 
 
+SPECIAL_KEYS = {
+    "started_before": "StartTime<",
+    "started_after": "StartTime>",
+    "started": "StartTime",
+    "ended_before": "EndTime<",
+    "ended_after": "EndTime>",
+    "ended": "EndTime",
+    "from_": "From",
+    "date_sent_before": "DateSent<",
+    "date_sent_after": "DateSent>",
+    "date_created_before": "DateCreated<",
+    "date_created_after": "DateCreated>",
+    "message_date_before": "MessageDate<",
+    "message_date_after": "MessageDate>",
+}
+
+
 def convert_keys(d):
     """
     Return a dictionary with all keys converted from arguments
     """
-    special = {
-        "started_before": "StartTime<",
-        "started_after": "StartTime>",
-        "started": "StartTime",
-        "ended_before": "EndTime<",
-        "ended_after": "EndTime>",
-        "ended": "EndTime",
-        "from_": "From",
-    }
-
     result = {}
 
     for k, v in iteritems(d):
-        if k in special:
-            result[special[k]] = v
-        else:
-            result[convert_case(k)] = v
+        name = _filter_names.get(k)
+        if name is None:
+            name = SPECIAL_KEYS.get(k) or convert_case(k)
+            if len(_filter_names) >= PARAM_NAME_CACHE_SIZE:
+                _filter_names.clear()
+            _filter_names[k] = name
+        result[name] = v
 
     return result
 
 
+def _quote_atom(atom):
+    try:
+        return _quoted_values[atom]
+    except (KeyError, TypeError):
+        pass
+
+    if isinstance(atom, integer_types):
+        return str(atom)
+    elif isinstance(atom, binary_type):
+        quoted = quote_plus(atom)
+    elif isinstance(atom, string_types):
+        quoted = quote_plus(atom.encode('utf-8'))
+    else:
+        return None
+
+    if len(atom) <= PARAM_VALUE_MAX_LENGTH:
+        if len(_quoted_values) >= PARAM_VALUE_CACHE_SIZE:
+            _quoted_values.clear()
+        _quoted_values[atom] = quoted
+    return quoted
+
+
+def encode_params(data):
+    """
+    URL encode form data in one pass, as urlencode(data, doseq=True) would
+    once every key and value was UTF-8 encoded. Encoded keys, and short
+    values, are cached, since the same parameter names and many of the same
+    values are sent on every request.
+
+    :param dict data: Values may be an integer, binary or string, or a
+        sequence of them
+    :raises: ValueError for any other value
+    """
+    parts = []
+    quoted = _quoted_names
+    for key, value in iteritems(data):
+        name = quoted.get(key)
+        if name is None:
+            name = quote_plus(key.encode('utf-8'))
+            if len(quoted) >= PARAM_NAME_CACHE_SIZE:
+                quoted.clear()
+            quoted[key] = name
+
+        if isinstance(value, (list, tuple, set)):
+            for atom in value:
+                atom = _quote_atom(atom)
+                if atom is None:
+                    raise ValueError('list elements should be an integer, '
+                                     'binary, or string')
+                parts.append(name + '=' + atom)
+        else:
+            atom = _quote_atom(value)
+            if atom is None:
+                raise ValueError('data should be an integer, '
+                                 'binary, or string, or sequence ')
+            parts.append(name + '=' + atom)
+
+    return '&'.join(parts)
+
+
 def normalize_dates(myfunc):
     def inner_func(*args, **kwargs):
         for k, v in iteritems(kwargs):
@@ -142,6 +383,31 @@ def change_dict_key(d, from_key, to_key):
         pass
 
 
+def project(record, fields):
+    """
+    Return a copy of a decoded record holding only the given fields. Fields
+    missing from the record are left out.
+    """
+    return dict((f, record[f]) for f in fields if f in record)
+
+
+_record_types = {}
+
+
+def record_type(name, fields):
+    """
+    Return a namedtuple class named name with the given fields. ``from``
+    is renamed to ``from_``, as it is on instance resources.
+    """
+    fields = tuple(fields)
+    try:
+        return _record_types[name, fields]
+    except KeyError:
+        names = ['from_' if f == 'from' else f for f in fields]
+        klass = _record_types[name, fields] = namedtuple(name, names)
+        return klass
+
+
 class _UnsetTimeoutKls(object):
     """ A sentinel for an unset timeout. Defaults to the system timeout. """
     def __repr__(self):
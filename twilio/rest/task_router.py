@@ -25,13 +25,15 @@ class TwilioTaskRouterClient(TwilioClient):
 
     def __init__(self, account=None, token=None,
                  base="https://taskrouter.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None,
+                 json_codec=None):
         """
         Create a Twilio REST API client.
         """
         super(TwilioTaskRouterClient, self).__init__(account, token, base,
                                                      version, timeout,
-                                                     request_account)
+                                                     request_account,
+                                                     json_codec)
         self.base_uri = "{0}/{1}".format(base, version)
         self.workspace_uri = "{0}/Workspaces".format(self.base_uri)
 
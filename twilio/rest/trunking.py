@@ -22,13 +22,14 @@ class TwilioTrunkingClient(TwilioClient):
 
     def __init__(self, account=None, token=None,
                  base="https://trunking.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None,
+                 json_codec=None):
         """
         Create a Twilio REST API client.
         """
         super(TwilioTrunkingClient, self).__init__(account, token, base,
                                                    version, timeout,
-                                                   request_account)
+                                                   request_account, json_codec)
         self.trunk_base_uri = "{0}/{1}".format(base, version)
 
     def credential_lists(self, trunk_sid):